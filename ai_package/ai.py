@@ -1,6 +1,8 @@
-from src.game import Game
-from src.move import Move
-from src.constants import *
+from src.core.game import Game
+from src.core.move import Move
+from src.core.constants import *
+from . import opening_book
+import importlib
 import os
 import json
 import time
@@ -23,6 +25,17 @@ class AI:
         # paramètres passés à l'IA
         self.args = self.set_args()
 
+    @classmethod
+    def load(cls, name, color):
+        """ Crée l'IA 'name' en n'important que son module (ai_package/<name>.py). """
+        module = importlib.import_module(f"{__package__}.{name}")
+        return cls(name, module.MAIN_FUNC, color)
+
+    @property
+    def is_parallel(self):
+        """ Vrai si l'IA répartit elle-même sa recherche entre plusieurs processus (IS_PARALLEL dans son module). """
+        return getattr(importlib.import_module(self.engine.__module__), 'IS_PARALLEL', False)
+
     def move(self, game: Game, move: Move):
         """ 
         Joue le move passé en paramètre en appelant
@@ -42,22 +55,20 @@ class AI:
         return eval(data[self.name])
     
     def choose_move(self, game: Game, addr):
-        """ Renvoie le déplacement choisi par l'IA. """
+        """ Renvoie le déplacement choisi par l'IA. La bibliothèque d'ouvertures est consultée en premier. """
         start_time = time.time()
-        score, move, depth, nodes = self.engine(game, self.color, *self.args)
+        move = opening_book.choose_move(game)
+        if move is not None:
+            print(f"{addr} ({self.color}): {move} found in the opening book in {round(time.time() - start_time, 6)}s.")
+            return move
+
+        score, move, depth, nodes, *details = self.engine(game, self.color, *self.args)
         search_time = time.time() - start_time
 
         print(f"{addr} ({self.color}): {move} found in {round(search_time, 3)}s with depth of {depth+1} and score of {score} exploring {nodes} nodes.")
+        if details:
+            # Variation principale
+            print(f"{addr} ({self.color}): principal variation {details[0]}")
         #time.sleep(0.8 - search_time)
 
         return move
-
-    @staticmethod
-    def simulate_move(move: Move, game: Game):
-        """ 
-        Simule un déplacement et renvoi l'instance de la 
-        classe game modifiée.
-        """
-        current_game: Game = game.copy()
-        current_game.apply_move(move.copy())
-        return current_game
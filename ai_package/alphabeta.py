@@ -1,29 +1,230 @@
-from src.game import Game
-from .ai import AI
-import time
+from src.core.game import Game
+from src.core.move import Move
+from .transposition_table import TranspositionTable, DEFAULT_SIZE, EXACT, LOWER_BOUND, UPPER_BOUND
+from .evaluation import evaluate
+from .iterative_deepening import iterative_deepening, deadline
+from .move_ordering import MoveOrderer
+from src.core.tablebase import Tablebase, DEFAULT_PATH, DRAW, WIN
+import os
 
 
-MAX_TIME = 5 # arrêt en largeur
 nodes = 0
+quiescence_nodes = 0
+# Les scores dépendent de la couleur de l'IA : la clé d'une position cherchée pour les noirs est différente.
+BLACK_PERSPECTIVE = 0x9E3779B97F4A7C15
+# Demi-largeur de la fenêtre d'aspiration (un pion vaut PAWN_VALUE = 100)
+ASPIRATION_WINDOW = 25
+transposition_table = TranspositionTable(DEFAULT_SIZE)
+move_orderer = MoveOrderer()
+# Score d'une partie gagnée, diminué du nombre de demi-coups joués depuis la racine pour préférer les gains rapides
+WIN_SCORE = 10000
+# Profondeur maximale d'une recherche (prises forcées comprises) : au-delà de WIN_SCORE - MAX_PLY,
+# un score est un gain (l'évaluation d'une position reste bien en dessous : 20 dames valent 6000)
+MAX_PLY = 2000
+WIN_THRESHOLD = WIN_SCORE - MAX_PLY
+# Tables de finales, si elles ont été générées (main_tablebase.py)
+tablebase = Tablebase(DEFAULT_PATH) if os.path.exists(DEFAULT_PATH) else None
 
 
-def evaluate(game: Game, color):
-    opposite_color = game.get_opposite_color(color)
-    return game.board.get_number_of_pawns(color) - game.board.get_number_of_pawns(opposite_color) \
-        + game.board.get_number_of_queens(color) * 3 - game.board.get_number_of_queens(opposite_color) * 3
+def get_key(game: Game, color):
+    """ Clé de la position dans la table de transposition. """
+    key = game.hash_key.get_value()
+    return key ^ BLACK_PERSPECTIVE if color == 'black' else key
+
+
+def score_to_table(score, ply):
+    """
+    Un score de gain compte les demi-coups depuis la racine ('ply' au noeud) :
+    il est mémorisé relativement au noeud pour rester valable si la position est atteinte
+    à une autre profondeur, dans cette recherche ou dans une suivante (la table est conservée).
+    """
+    if score >= WIN_THRESHOLD:
+        return score + ply
+    if score <= -WIN_THRESHOLD:
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    """ Inverse de score_to_table pour une position atteinte au demi-coup 'ply'. """
+    if score >= WIN_THRESHOLD:
+        return score - ply
+    if score <= -WIN_THRESHOLD:
+        return score + ply
+    return score
+
+
+def probe_table(key, depth, alpha, beta, ply):
+    """
+    Consulte la table de transposition pour une recherche à la profondeur 'depth'
+    d'une position atteinte 'ply' demi-coups après la racine.
+    Retourne (score, hash_move, alpha, beta) : score vaut None si l'entrée ne permet pas
+    de conclure, sinon la recherche peut s'arrêter. La fenêtre est resserrée par les bornes connues.
+    """
+    entry = transposition_table.probe(key)
+    if entry is None:
+        return None, None, alpha, beta
+
+    _, entry_depth, entry_score, entry_flag, entry_move, _ = entry
+    entry_score = score_from_table(entry_score, ply)
+    hash_move = Move.decode(entry_move)
+    if entry_depth >= depth:
+        if entry_flag == EXACT:
+            return entry_score, hash_move, alpha, beta
+        elif entry_flag == LOWER_BOUND:
+            alpha = max(alpha, entry_score)
+        else:
+            beta = min(beta, entry_score)
+        if alpha >= beta:
+            return entry_score, hash_move, alpha, beta
+
+    return None, hash_move, alpha, beta
+
+
+def store_result(key, depth, best_score, best_move, initial_alpha, initial_beta, ply):
+    """
+    Mémorise le résultat et sa nature par rapport à la fenêtre [alpha, beta] de départ
+    (les scores de gain relativement au demi-coup 'ply' du noeud).
+    """
+    if best_move is None:
+        return
+    if best_score <= initial_alpha:
+        flag = UPPER_BOUND
+    elif best_score >= initial_beta:
+        flag = LOWER_BOUND
+    else:
+        flag = EXACT
+    transposition_table.store(key, depth, score_to_table(best_score, ply), flag, best_move.encode())
+
+
+def evaluate_end(game: Game, color):
+    """ Score d'une partie terminée du point de vue de 'color' : gain, perte ou 0 en cas d'égalité. """
+    if game.winner is None:
+        return 0
+    score = WIN_SCORE - len(game.undo_stack)
+    return score if game.winner == ('blanc' if color == 'white' else 'noir') else -score
+
+
+def probe_tablebase(game: Game, color):
+    """
+    Score exact, du point de vue de 'color', d'une finale présente dans les tables ; None sinon.
+    Comme pour evaluate_end, le score tient compte du demi-coup où la partie se termine.
+    """
+    if tablebase is None or game.board.get_total_number_of_pieces() > tablebase.max_pieces:
+        return None
+    entry = tablebase.probe(game.board.bitboard, game.turn)
+    if entry is None:
+        return None
+    result, distance = entry
+    if result == DRAW:
+        return 0
+    score = WIN_SCORE - len(game.undo_stack) - distance
+    return score if (result == WIN) == (game.turn == color) else -score
+
+
+def search_tablebase_root(game: Game, color):
+    """
+    Racine présente dans les tables : chaque déplacement est noté par le résultat exact de la
+    position obtenue, sans recherche ni approfondissement itératif (le gain le plus court,
+    ou à défaut la perte la plus longue, a le meilleur score).
+    Retourne (score, move, depth, nodes, variation principale) comme AlphaBeta_PVS,
+    ou None si la position, ou l'une des positions obtenues, n'est pas dans les tables.
+    """
+    if probe_tablebase(game, color) is None:
+        return None
+
+    best_score, best_move = float('-inf'), None
+    nodes = 0
+    for move in game.iter_valid_moves():
+        game.make_move(move)
+        score = evaluate_end(game, color) if game.is_finished else probe_tablebase(game, color)
+        game.unmake_move()
+        nodes += 1
+        if score is None:
+            return None
+        if score > best_score:
+            best_score, best_move = score, move
+
+    print(f"[TABLEBASE] {best_move} ({best_score})")
+    return best_score, best_move, 0, nodes, [best_move]
+
+
+def Quiescence(game: Game, color, alpha, beta, is_max):
+    """
+    Recherche de calme : tant que le joueur au trait est obligé de prendre,
+    on explore les prises (seuls déplacements autorisés) au lieu d'évaluer.
+    La prise étant obligatoire, il n'y a pas d'option 'ne rien faire' (stand pat).
+    Les noeuds explorés sont comptés à part dans quiescence_nodes.
+    Les finales présentes dans les tables ne sont pas explorées.
+    """
+    global quiescence_nodes
+    quiescence_nodes += 1
+    deadline.check()
+
+    if game.is_finished:
+        return evaluate_end(game, color)
+    # Avec peu de pièces, le résultat exact remplace l'évaluation et les prises
+    tablebase_score = probe_tablebase(game, color)
+    if tablebase_score is not None:
+        return tablebase_score
+    if not game.board.has_capture(game.turn):
+        return evaluate(game, color)
+
+    if is_max:
+        best_score = float('-inf')
+        for move in game.iter_valid_moves():
+            game.make_move(move)
+            score = Quiescence(game, color, alpha, beta, False)
+            game.unmake_move()
+            if score > best_score:
+                best_score = score
+                alpha = max(alpha, best_score)
+                if alpha >= beta:
+                    break
+    else:
+        best_score = float('inf')
+        for move in game.iter_valid_moves():
+            game.make_move(move)
+            score = Quiescence(game, color, alpha, beta, True)
+            game.unmake_move()
+            if score < best_score:
+                best_score = score
+                beta = min(beta, best_score)
+                if alpha >= beta:
+                    break
+
+    return best_score
 
 
 def AlphaBeta(game: Game, color, depth, alpha, beta, is_max):
     global nodes
     nodes += 1
-    start_time = time.time()
+    # Lève SearchTimeout si le budget de l'approfondissement itératif est épuisé
+    deadline.check()
     
-    if depth < 1 or game.is_finished:
-        return evaluate(game, color), game, depth, nodes
+    if game.is_finished:
+        return evaluate_end(game, color), game, depth, nodes
+    if depth < 1:
+        # Une feuille au milieu d'une rafle n'est pas évaluée : on prolonge par les prises forcées
+        return Quiescence(game, color, alpha, beta, is_max), game, depth, nodes
+
+    # Finale présente dans les tables : le score exact dispense de la recherche
+    tablebase_score = probe_tablebase(game, color)
+    if tablebase_score is not None:
+        return tablebase_score, None, depth, nodes
 
-    valid_moves = game.valid_moves
-    if len(valid_moves) == 0:
-        return evaluate(game, color), game, depth, nodes
+    # Consultation de la table de transposition
+    key = get_key(game, color)
+    cutoff, hash_move, alpha, beta = probe_table(key, depth, alpha, beta, len(game.undo_stack))
+    if cutoff is not None:
+        return cutoff, hash_move, depth - 1, nodes
+
+    initial_alpha, initial_beta, initial_depth = alpha, beta, depth
+
+    # Une partie non terminée a toujours au moins un déplacement valide.
+    # Le meilleur déplacement connu est essayé en premier, puis les prises, killers et l'historique
+    # (les autres déplacements ne sont générés que si le premier ne provoque pas de coupure).
+    valid_moves = move_orderer.order_moves(game, hash_move)
 
     if is_max:
         best_score = float('-inf')
@@ -31,8 +232,9 @@ def AlphaBeta(game: Game, color, depth, alpha, beta, is_max):
         depth -= 1
 
         for move in valid_moves:
-            new_game = AI.simulate_move(move, game)
-            score, *_ = AlphaBeta(new_game, color, depth, alpha, beta, False)
+            game.make_move(move)
+            score, *_ = AlphaBeta(game, color, depth, alpha, beta, False)
+            game.unmake_move()
             if score > best_score:
                 best_score = score
                 best_move = move
@@ -40,18 +242,17 @@ def AlphaBeta(game: Game, color, depth, alpha, beta, is_max):
                     alpha = best_score
                     # élagage beta
                     if alpha >= beta:
+                        move_orderer.update(game, move, initial_depth)
                         break
-            elapsed_time = time.time() - start_time
-            if elapsed_time > MAX_TIME:
-                return best_score, best_move, depth, nodes
     else:
         best_score = float('inf')
         best_move = None
         depth -= 1
 
         for move in valid_moves:
-            new_game = AI.simulate_move(move, game)
-            score, *_ = AlphaBeta(new_game, color, depth, alpha, beta, True)
+            game.make_move(move)
+            score, *_ = AlphaBeta(game, color, depth, alpha, beta, True)
+            game.unmake_move()
             if score < best_score:
                 best_score = score
                 best_move = move
@@ -59,12 +260,183 @@ def AlphaBeta(game: Game, color, depth, alpha, beta, is_max):
                     beta = best_score
                     # élagage alpha
                     if alpha >= beta:
+                        move_orderer.update(game, move, initial_depth)
                         break
-            elapsed_time = time.time() - start_time
-            if elapsed_time > MAX_TIME:
-                return best_score, best_move, depth, nodes
+
+    store_result(key, initial_depth, best_score, best_move, initial_alpha, initial_beta, len(game.undo_stack))
     
     return best_score, best_move, depth, nodes
 
 
-MAIN_FUNC = AlphaBeta
+def PrincipalVariationSearch(game: Game, color, depth, alpha, beta, is_max):
+    """
+    Variante PVS (negascout) d'AlphaBeta : le premier déplacement, supposé le meilleur
+    grâce au tri, est cherché avec la fenêtre complète. Les suivants sont cherchés avec
+    une fenêtre nulle qui prouve seulement qu'ils sont moins bons ; s'ils ne le sont pas,
+    on refait la recherche avec la fenêtre complète.
+    Les scores étant entiers, une fenêtre nulle est de largeur 1.
+    La table de transposition ne coupe que les noeuds à fenêtre nulle : la variation principale
+    renvoyée couvre toute la profondeur cherchée, sauf si la partie se termine avant
+    ou si elle atteint une finale présente dans les tables.
+    Retourne (score, variation principale) où la variation est une liste de Move.
+    """
+    global nodes
+    nodes += 1
+    deadline.check()
+
+    if game.is_finished:
+        return evaluate_end(game, color), []
+    if depth < 1:
+        return Quiescence(game, color, alpha, beta, is_max), []
+
+    tablebase_score = probe_tablebase(game, color)
+    if tablebase_score is not None:
+        return tablebase_score, []
+
+    key = get_key(game, color)
+    if beta - alpha > 1:
+        # Noeud de la variation principale (fenêtre non nulle) : la table ne fournit que le
+        # meilleur déplacement, une coupure tronquerait la variation renvoyée.
+        _, hash_move, _, _ = probe_table(key, depth, alpha, beta, len(game.undo_stack))
+    else:
+        cutoff, hash_move, alpha, beta = probe_table(key, depth, alpha, beta, len(game.undo_stack))
+        if cutoff is not None:
+            return cutoff, [hash_move]
+
+    initial_alpha, initial_beta = alpha, beta
+    valid_moves = move_orderer.order_moves(game, hash_move)
+
+    best_score = float('-inf') if is_max else float('inf')
+    best_move = None
+    best_variation = []
+
+    for index, move in enumerate(valid_moves):
+        game.make_move(move)
+        if index == 0:
+            score, variation = PrincipalVariationSearch(game, color, depth - 1, alpha, beta, not is_max)
+        elif is_max:
+            score, variation = PrincipalVariationSearch(game, color, depth - 1, alpha, alpha + 1, False)
+            if alpha < score < beta:
+                score, variation = PrincipalVariationSearch(game, color, depth - 1, alpha, beta, False)
+        else:
+            score, variation = PrincipalVariationSearch(game, color, depth - 1, beta - 1, beta, True)
+            if alpha < score < beta:
+                score, variation = PrincipalVariationSearch(game, color, depth - 1, alpha, beta, True)
+        game.unmake_move()
+
+        if (is_max and score > best_score) or (not is_max and score < best_score):
+            best_score = score
+            best_move = move
+            best_variation = variation
+            if is_max:
+                alpha = max(alpha, best_score)
+            else:
+                beta = min(beta, best_score)
+            if alpha >= beta:
+                move_orderer.update(game, move, depth)
+                break
+
+    store_result(key, depth, best_score, best_move, initial_alpha, initial_beta, len(game.undo_stack))
+
+    return best_score, [best_move] + best_variation
+
+
+def AlphaBeta_TT(game: Game, color, depth, alpha, beta, is_max, tt_size=DEFAULT_SIZE):
+    """
+    Point d'entrée de l'IA : prépare la table de transposition (de taille tt_size)
+    puis lance la recherche AlphaBeta et affiche les statistiques de la table.
+    """
+    global nodes, quiescence_nodes, transposition_table
+    nodes = quiescence_nodes = 0
+    if transposition_table.size < tt_size:
+        transposition_table = TranspositionTable(tt_size)
+    transposition_table.new_search()
+    move_orderer.new_search()
+
+    tablebase_result = search_tablebase_root(game, color)
+    if tablebase_result is not None:
+        return tablebase_result[:4]
+
+    result = AlphaBeta(game, color, depth, alpha, beta, is_max)
+    print(transposition_table)
+    print(f"[QUIESCENCE] {quiescence_nodes} nodes")
+    return result
+
+
+def AlphaBeta_ID(game: Game, color, max_depth, time_budget, tt_size=DEFAULT_SIZE):
+    """
+    Point d'entrée de l'IA avec approfondissement itératif : cherche aux profondeurs
+    1, 2, ..., max_depth tant que time_budget (en secondes) n'est pas épuisé.
+    La table de transposition est conservée d'une itération à l'autre.
+    """
+    global quiescence_nodes, transposition_table
+    quiescence_nodes = 0
+    if transposition_table.size < tt_size:
+        transposition_table = TranspositionTable(tt_size)
+    transposition_table.new_search()
+    move_orderer.new_search()
+
+    tablebase_result = search_tablebase_root(game, color)
+    if tablebase_result is not None:
+        return tablebase_result[:4]
+
+    def search(game: Game, color, depth):
+        global nodes
+        nodes = 0
+        return AlphaBeta(game, color, depth, float('-inf'), float('+inf'), True)
+
+    result = iterative_deepening(search, game, color, max_depth, time_budget)
+    print(transposition_table)
+    print(f"[QUIESCENCE] {quiescence_nodes} nodes")
+    return result
+
+
+def AlphaBeta_PVS(game: Game, color, max_depth, time_budget, tt_size=DEFAULT_SIZE, aspiration_window=ASPIRATION_WINDOW):
+    """
+    Point d'entrée de l'IA : approfondissement itératif avec PrincipalVariationSearch.
+    À partir de la deuxième itération, la recherche commence avec une fenêtre d'aspiration
+    [score précédent - aspiration_window, score précédent + aspiration_window]. Si le score
+    en sort, la fenêtre est ouverte du côté de l'échec et la recherche est refaite.
+    Retourne (score, move, depth, nodes, variation principale).
+    """
+    global quiescence_nodes, transposition_table
+    quiescence_nodes = 0
+    if transposition_table.size < tt_size:
+        transposition_table = TranspositionTable(tt_size)
+    transposition_table.new_search()
+    move_orderer.new_search()
+    previous_score = None
+
+    # Finale présente dans les tables : inutile d'approfondir
+    tablebase_result = search_tablebase_root(game, color)
+    if tablebase_result is not None:
+        return tablebase_result
+
+    def search(game: Game, color, depth):
+        global nodes
+        nonlocal previous_score
+        nodes = 0
+        alpha, beta = float('-inf'), float('+inf')
+        if previous_score is not None:
+            alpha, beta = previous_score - aspiration_window, previous_score + aspiration_window
+
+        while True:
+            score, variation = PrincipalVariationSearch(game, color, depth, alpha, beta, True)
+            if score <= alpha:
+                alpha = float('-inf')
+            elif score >= beta:
+                beta = float('+inf')
+            else:
+                break
+            print(f"[ASPIRATION] depth {depth}: score {score} out of the window, new window [{alpha}, {beta}]")
+
+        previous_score = score
+        return score, variation[0], depth - 1, nodes, variation
+
+    result = iterative_deepening(search, game, color, max_depth, time_budget)
+    print(transposition_table)
+    print(f"[QUIESCENCE] {quiescence_nodes} nodes")
+    return result
+
+
+MAIN_FUNC = AlphaBeta_PVS
@@ -0,0 +1,84 @@
+from src.core.game import Game
+from . import alphabeta
+from .mtdf import MTDf
+import argparse
+import random
+import time
+
+"""
+Banc d'essai : compare AlphaBeta (fenêtre complète) et MTD(f) sur les mêmes positions
+et à la même profondeur. Chaque recherche part d'une table de transposition et de tables
+de tri vides pour que les deux méthodes soient mesurées dans les mêmes conditions.
+Les positions sont les configurations de plateau suivies de quelques déplacements
+aléatoires (graine fixe, donc positions identiques d'une exécution à l'autre).
+"""
+
+
+def create_positions(board_configs, random_plies, seed):
+    """ Retourne la liste des parties (sans fenêtre) servant de positions de test. """
+    rng = random.Random(seed)
+    positions = []
+    for board_config in board_configs:
+        game = Game(board_config)
+        game.init_position()
+        for _ in range(rng.randint(0, random_plies)):
+            if game.is_finished:
+                break
+            game.apply_move(rng.choice(game.valid_moves))
+        if not game.is_finished:
+            positions.append(game)
+    return positions
+
+
+def reset_tables():
+    alphabeta.transposition_table.clear()
+    alphabeta.transposition_table.new_search()
+    alphabeta.move_orderer.clear()
+    alphabeta.nodes = alphabeta.quiescence_nodes = 0
+
+
+def run_alphabeta(game: Game, depth):
+    score, *_ = alphabeta.AlphaBeta(game, game.turn, depth, float('-inf'), float('+inf'), True)
+    return score
+
+
+def run_mtdf(game: Game, depth):
+    score, *_ = MTDf(game, game.turn, depth)
+    return score
+
+
+def benchmark(positions, depth):
+    """ Affiche, pour chaque position, le score, les noeuds et le temps de chaque méthode. """
+    engines = [('alphabeta', run_alphabeta), ('mtdf', run_mtdf)]
+    totals = {name: [0, 0] for name, _ in engines}
+
+    for index, game in enumerate(positions):
+        scores = []
+        line = f"position {index} ({game.turn}):"
+        for name, run in engines:
+            reset_tables()
+            start_time = time.time()
+            scores.append(run(game, depth))
+            search_time = time.time() - start_time
+            nodes = alphabeta.nodes + alphabeta.quiescence_nodes
+            totals[name][0] += nodes
+            totals[name][1] += search_time
+            line += f" {name} {scores[-1]} ({nodes} nodes, {round(search_time, 3)}s)"
+        if len(set(scores)) > 1:
+            line += " DIFFERENT SCORES"
+        print(line)
+
+    for name, (nodes, search_time) in totals.items():
+        print(f"{name}: {nodes} nodes in {round(search_time, 3)}s")
+
+
+def main():
+    """ Point d'entrée en ligne de commande (main_benchmark.py). """
+    parser = argparse.ArgumentParser(description="Compare AlphaBeta et MTD(f) sur les mêmes positions.")
+    parser.add_argument("depth", type=int, help="profondeur de recherche")
+    parser.add_argument("--configs", type=int, nargs="+", default=list(range(1, 10)), help="configurations du plateau")
+    parser.add_argument("--plies", type=int, default=12, help="nombre maximal de déplacements aléatoires")
+    parser.add_argument("--seed", type=int, default=0, help="graine des déplacements aléatoires")
+    args = parser.parse_args()
+
+    benchmark(create_positions(args.configs, args.plies, args.seed), args.depth)
@@ -0,0 +1,91 @@
+from src.core.game import Game
+from src.core.move import Move
+from src.core.bitboard import SQUARES
+from src.core.evaluation_terms import *
+import numpy as np
+
+"""
+Évaluation positionnelle commune aux IA : matériel, tables pièce-case (ligne de fond,
+centre, bords, grande diagonale), avancement des pions et trait.
+Les tables sont définies dans src/core/evaluation_terms.py.
+
+evaluate est en O(1) : le plateau tient à jour, à chaque déplacement, prise et promotion,
+le nombre de pièces et les termes positionnels de chaque joueur (Board.evaluation_terms).
+
+Le calcul par lot utilise NumPy. Le plateau est vu comme un tableau de bits de forme (4, 50) :
+pions blancs, pions noirs, dames blanches, dames noires, une colonne par case foncée
+(voir src/core/bitboard.py). Tous les termes sauf le trait sont linéaires en ces bits : ils sont
+additionnés une fois pour toutes dans une table de poids WEIGHTS de même forme (positive pour
+les blancs, négative pour les noirs), et le score d'une position est le produit scalaire
+bits · poids. Pour un lot de N positions, le même calcul porte sur un tableau (N, 4, 50).
+"""
+
+WHITE_PAWN, BLACK_PAWN, WHITE_QUEEN, BLACK_QUEEN = range(4)
+SQUARE_SHIFTS = np.arange(SQUARES, dtype=np.uint64)
+
+# Tables complètes du joueur du bas
+PAWN_TABLE = PAWN_VALUE + ADVANCEMENT_WEIGHT * np.array(ADVANCEMENT_TABLE) + np.array(PAWN_SQUARE_TABLE)
+QUEEN_TABLE = QUEEN_VALUE + np.array(QUEEN_SQUARE_TABLE)
+
+
+def _build_weights(white_side):
+    """ Table (4, 50) des poids, du point de vue des blancs, selon le côté où ils jouent. """
+    white_pawns, white_queens = PAWN_TABLE, QUEEN_TABLE
+    black_pawns, black_queens = PAWN_TABLE[::-1], QUEEN_TABLE[::-1]
+    if white_side == "top":
+        white_pawns, white_queens, black_pawns, black_queens = black_pawns, black_queens, white_pawns, white_queens
+    return np.stack([white_pawns, -black_pawns, white_queens, -black_queens])
+
+
+WEIGHTS = {'bottom': _build_weights("bottom"), 'top': _build_weights("top")}
+
+
+def get_bits(keys):
+    """
+    Vue tableau d'un lot de positions : keys est un tableau (N, 4) de masques
+    (BitBoard.get_key()), le résultat un tableau (N, 4, 50) de 0 et de 1.
+    """
+    keys = np.asarray(keys, dtype=np.uint64)
+    return ((keys[:, :, np.newaxis] >> SQUARE_SHIFTS) & np.uint64(1)).astype(np.int64)
+
+
+def evaluate_keys(keys, white_to_move, color, white_side="bottom"):
+    """
+    Point d'entrée par lot : scores (tableau de N entiers) du point de vue de 'color'
+    pour N positions données par leurs masques et le trait (tableau de booléens).
+    """
+    white_scores = np.einsum('nks,ks->n', get_bits(keys), WEIGHTS[white_side])
+    white_scores += np.where(white_to_move, TEMPO_BONUS, -TEMPO_BONUS)
+    return white_scores if color == 'white' else -white_scores
+
+
+def evaluate_batch(games: list[Game], color):
+    """ Scores de plusieurs parties (même orientation du plateau) en un seul calcul. """
+    keys = [game.board.bitboard.get_key() for game in games]
+    white_to_move = [game.turn == 'white' for game in games]
+    return evaluate_keys(keys, white_to_move, color, games[0].board.bitboard.white_side)
+
+
+def evaluate_moves(game: Game, color, moves: list[Move]):
+    """ Scores des positions atteintes par chacun des déplacements, évaluées en un seul calcul. """
+    keys, white_to_move = [], []
+    for move in moves:
+        game.make_move(move)
+        keys.append(game.board.bitboard.get_key())
+        white_to_move.append(game.turn == 'white')
+        game.unmake_move()
+    return evaluate_keys(keys, white_to_move, color, game.board.bitboard.white_side)
+
+
+def get_player_score(board, color):
+    """ Score d'un joueur (sans le trait) à partir des compteurs tenus à jour par le plateau. """
+    terms = board.evaluation_terms[color]
+    return board.pieces_dict[color]['pawn'] * PAWN_VALUE + board.pieces_dict[color]['queen'] * QUEEN_VALUE \
+        + terms['square_values'] + terms['advancement'] * ADVANCEMENT_WEIGHT
+
+
+def evaluate(game: Game, color):
+    """ Score d'une position du point de vue de 'color', en temps constant. """
+    opposite_color = game.get_opposite_color(color)
+    tempo = TEMPO_BONUS if game.turn == color else -TEMPO_BONUS
+    return get_player_score(game.board, color) - get_player_score(game.board, opposite_color) + tempo
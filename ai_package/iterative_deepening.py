@@ -0,0 +1,72 @@
+from src.core.game import Game
+import time
+
+"""
+Approfondissement itératif commun aux IA.
+Le driver cherche à la profondeur 1, puis 2, 3... tant que le budget de temps
+(en secondes) n'est pas épuisé. Une itération interrompue est abandonnée :
+on renvoie toujours le résultat de la dernière itération terminée.
+Les fonctions de recherche appellent deadline.check() à chaque noeud.
+"""
+
+
+class SearchTimeout(Exception):
+    """ Levée par deadline.check() quand le budget de temps est dépassé. """
+    pass
+
+
+class Deadline:
+    """ Échéance globale de la recherche en cours (et non par noeud). """
+
+    def __init__(self):
+        self.end_time = None
+
+    def start(self, time_budget):
+        self.end_time = time.time() + time_budget
+
+    def stop(self):
+        self.end_time = None
+
+    def check(self):
+        if self.end_time is not None and time.time() > self.end_time:
+            raise SearchTimeout()
+
+
+deadline = Deadline()
+
+
+def iterative_deepening(search, game: Game, color, max_depth, time_budget, *args):
+    """
+    Lance search(game, color, depth, *args) pour depth = 1, 2, ..., max_depth.
+    search doit renvoyer (score, move, depth, nodes) comme les fonctions principales des IA,
+    éventuellement suivis d'informations supplémentaires (variation principale, ...).
+    La première itération n'est pas limitée pour toujours disposer d'un déplacement.
+    Renvoie le résultat de la dernière itération terminée avec le total de noeuds explorés.
+    """
+    undo_length = len(game.undo_stack)
+    result = None
+    total_nodes = 0
+    start_time = time.time()
+    deadline.stop()
+
+    for depth in range(1, max_depth + 1):
+        try:
+            score, move, remaining_depth, nodes, *details = search(game, color, depth, *args)
+        except SearchTimeout:
+            # On défait les déplacements joués par la recherche interrompue
+            while len(game.undo_stack) > undo_length:
+                game.unmake_move()
+            break
+
+        if depth == 1:
+            deadline.start(time_budget - (time.time() - start_time))
+        total_nodes += nodes
+        result = score, move, remaining_depth, details
+        print(f"[ITERATIVE DEEPENING] depth {depth} completed in {round(time.time() - start_time, 3)}s: {move} ({score})")
+
+        if time.time() - start_time > time_budget:
+            break
+
+    deadline.stop()
+    score, move, remaining_depth, details = result
+    return score, move, remaining_depth, total_nodes, *details
@@ -1,72 +1,75 @@
-from src.game import Game
-from .ai import AI
-import time
+from src.core.game import Game
+from .evaluation import evaluate
+from .iterative_deepening import iterative_deepening, deadline
 
 
-MAX_TIME = 5 # arrêt en largeur
 nodes = 0
 
 
-def evaluate(game: Game, color):
-    opposite_color = game.get_opposite_color(color)
-    return game.board.get_number_of_pawns(color) - game.board.get_number_of_pawns(opposite_color) \
-        + game.board.get_number_of_queens(color) * 3 - game.board.get_number_of_queens(opposite_color) * 3
-
-
 def MiniMax_Max(game: Game, color, depth):
     global nodes
     nodes += 1
-    start_time = time.time()
+    # Lève SearchTimeout si le budget de l'approfondissement itératif est épuisé
+    deadline.check()
 
     if depth < 1 or game.is_finished:
         return evaluate(game, color), game, depth, nodes
 
-    valid_moves = game.valid_moves
-    if len(valid_moves) == 0:
-        return evaluate(game, color), game, depth, nodes
+    # Les déplacements sont produits à la demande : une coupure évite de construire les suivants.
+    # Une partie non terminée a toujours au moins un déplacement valide.
+    valid_moves = game.iter_valid_moves()
 
     best_score = float('-inf')
     best_move = None
     depth -= 1
 
     for move in valid_moves:
-        new_game = AI.simulate_move(move, game)
-        score, *_ = MiniMax_Min(new_game, color, depth)
+        game.make_move(move)
+        score, *_ = MiniMax_Min(game, color, depth)
+        game.unmake_move()
         if score > best_score:
             best_score = score
             best_move = move
-        elapsed_time = time.time() - start_time
-        if elapsed_time > MAX_TIME:
-            return best_score, best_move, depth, nodes
         
     return best_score, best_move, depth, nodes
 
 
 def MiniMax_Min(game: Game, color, depth):
-    start_time = time.time()
+    deadline.check()
 
     if depth < 1 or game.is_finished:
         return evaluate(game, color), game, depth, nodes
 
-    valid_moves = game.valid_moves
-    if len(valid_moves) == 0:
-        return evaluate(game, color), game, depth, nodes
+    # Les déplacements sont produits à la demande : une coupure évite de construire les suivants.
+    # Une partie non terminée a toujours au moins un déplacement valide.
+    valid_moves = game.iter_valid_moves()
         
     best_score = float('inf')
     best_move = None
     depth -= 1
 
     for move in valid_moves:
-        new_game = AI.simulate_move(move, game)
-        score, *_ = MiniMax_Max(new_game, color, depth)
+        game.make_move(move)
+        score, *_ = MiniMax_Max(game, color, depth)
+        game.unmake_move()
         if score < best_score:
             best_score = score
             best_move = move
-        elapsed_time = time.time() - start_time
-        if elapsed_time > MAX_TIME:
-            return best_score, best_move, depth, nodes
     
     return best_score, best_move, depth, nodes
 
 
-MAIN_FUNC = MiniMax_Max
+def MiniMax_ID(game: Game, color, max_depth, time_budget):
+    """
+    Point d'entrée de l'IA avec approfondissement itératif : cherche aux profondeurs
+    1, 2, ..., max_depth tant que time_budget (en secondes) n'est pas épuisé.
+    """
+    def search(game: Game, color, depth):
+        global nodes
+        nodes = 0
+        return MiniMax_Max(game, color, depth)
+
+    return iterative_deepening(search, game, color, max_depth, time_budget)
+
+
+MAIN_FUNC = MiniMax_ID
@@ -0,0 +1,94 @@
+from src.core.game import Game
+from src.core.move import Move
+from src.core.bitboard import SQUARES, count_bits
+
+"""
+Tri des déplacements commun aux IA.
+Plus le meilleur déplacement est essayé tôt, plus l'élagage alpha-beta est efficace.
+Ordre de priorité :
+    1. le déplacement mémorisé dans la table de transposition (hash move), essayé avant
+       de générer les autres : s'il provoque une coupure, ils ne sont jamais générés
+    2. les prises, qui prennent toutes autant de pièces (prise majoritaire) : celles qui prennent
+       le plus de dames d'abord, et les promotions
+    3. les coups 'killer' : déplacements calmes ayant provoqué une coupure à la même profondeur
+    4. les autres déplacements calmes, triés par la table d'historique
+La prise étant obligatoire, les étapes 2 d'une part, 3 et 4 d'autre part ne se mélangent jamais.
+"""
+
+QUEEN_CAPTURE_SCORE = 1 << 32 # par dame prise
+PROMOTION_SCORE = 1 << 31
+KILLER_SCORES = (1 << 30, 1 << 29)
+NUMBER_OF_KILLERS = len(KILLER_SCORES)
+
+
+class MoveOrderer:
+    """
+    Conserve les coups 'killer' par ply (distance à la racine de la recherche)
+    et la table d'historique par couleur, indexée par (origine, destination).
+    Le ply est la longueur de la pile d'annulation du jeu copié par le serveur.
+    """
+
+    def __init__(self):
+        self.killers = {}
+        self.history = {'white': [0] * (SQUARES * SQUARES), 'black': [0] * (SQUARES * SQUARES)}
+
+    def new_search(self):
+        """
+        Les killers ne valent que pour une position de départ donnée.
+        L'historique est conservé mais vieilli pour suivre l'évolution de la partie.
+        """
+        self.killers.clear()
+        for color_history in self.history.values():
+            for index, value in enumerate(color_history):
+                if value:
+                    color_history[index] = value >> 1
+
+    def clear(self):
+        self.__init__()
+
+    def get_score(self, game: Game, move: Move, killers):
+        """ Note un déplacement : plus la note est haute, plus tôt il sera essayé. """
+        bitboard = game.board.bitboard
+        score = 0
+        if move.captured:
+            opponent_queens = bitboard.queens[game.get_opposite_color(game.turn)]
+            score += QUEEN_CAPTURE_SCORE * count_bits(move.captured & opponent_queens)
+        if move.is_pawn and bitboard.is_promotion(game.turn, move.origin, move.destination):
+            score += PROMOTION_SCORE
+        if score or move.captured:
+            return score
+        if move in killers:
+            return KILLER_SCORES[killers.index(move)]
+        return self.history[game.turn][move.origin * SQUARES + move.destination]
+
+    def order_moves(self, game: Game, hash_move: Move = None):
+        """
+        Produit les déplacements valides, du plus prometteur au moins prometteur, par étapes :
+        le hash move, après vérification de sa validité, est rendu sans rien générer d'autre.
+        Les autres déplacements ne sont générés et triés que si la recherche en demande la suite.
+        La position doit être la même à chaque reprise (c'est le cas entre make_move et unmake_move).
+        """
+        if hash_move is not None and game.is_valid_move(hash_move):
+            yield hash_move
+        else:
+            hash_move = None
+
+        killers = self.killers.get(len(game.undo_stack), ())
+        moves = [move for move in game.iter_valid_moves() if move != hash_move]
+        yield from sorted(moves, key=lambda move: self.get_score(game, move, killers), reverse=True)
+
+    def update(self, game: Game, move: Move, depth):
+        """
+        Appelée quand 'move' provoque une coupure dans la position courante.
+        Seuls les déplacements calmes alimentent les killers et l'historique :
+        les prises sont déjà essayées en premier.
+        """
+        if move.captured:
+            return
+
+        ply = len(game.undo_stack)
+        killers = self.killers.get(ply, ())
+        if move not in killers:
+            self.killers[ply] = (move,) + killers[:NUMBER_OF_KILLERS - 1]
+
+        self.history[game.turn][move.origin * SQUARES + move.destination] += depth * depth
@@ -0,0 +1,72 @@
+from src.core.game import Game
+from . import alphabeta
+from .alphabeta import AlphaBeta, TranspositionTable, DEFAULT_SIZE
+from .iterative_deepening import iterative_deepening
+
+"""
+MTD(f) : le score minimax est encadré par une suite de recherches AlphaBeta à fenêtre nulle
+[beta - 1, beta]. Chaque recherche indique seulement si le score est inférieur à beta
+(nouvelle borne supérieure) ou non (nouvelle borne inférieure). On s'arrête quand les
+deux bornes se rejoignent. Les recherches successives réutilisent la table de transposition
+d'alphabeta.py, sans laquelle la méthode referait tout le travail à chaque passage.
+L'évaluation étant entière, la convergence ne demande que quelques passages
+si la première estimation (le score de l'itération précédente) est proche.
+"""
+
+
+def MTDf(game: Game, color, depth, first_guess=0):
+    """
+    Recherche MTD(f) à profondeur fixe. Retourne (score, move, depth, nodes, nombre de passages).
+    Le déplacement retenu est celui de la recherche qui a établi la borne inférieure finale :
+    une recherche qui échoue en dessous de beta ne désigne pas de meilleur déplacement fiable.
+    """
+    score = first_guess
+    lower_bound, upper_bound = float('-inf'), float('+inf')
+    best_move, last_move = None, None
+    passes = 0
+
+    while lower_bound < upper_bound:
+        beta = score + 1 if score == lower_bound else score
+        score, last_move, remaining_depth, _ = AlphaBeta(game, color, depth, beta - 1, beta, True)
+        passes += 1
+        if score < beta:
+            upper_bound = score
+        else:
+            lower_bound = score
+            best_move = last_move
+
+    return score, best_move or last_move, remaining_depth, alphabeta.nodes, passes
+
+
+def MTDf_ID(game: Game, color, max_depth, time_budget, tt_size=DEFAULT_SIZE):
+    """
+    Point d'entrée de l'IA : approfondissement itératif, chaque itération étant une recherche
+    MTD(f) dont la première estimation est le score de l'itération précédente.
+    """
+    if alphabeta.transposition_table.size < tt_size:
+        alphabeta.transposition_table = TranspositionTable(tt_size)
+    alphabeta.transposition_table.new_search()
+    alphabeta.move_orderer.new_search()
+    alphabeta.quiescence_nodes = 0
+    previous_score = 0
+
+    # Finale présente dans les tables : inutile d'approfondir
+    tablebase_result = alphabeta.search_tablebase_root(game, color)
+    if tablebase_result is not None:
+        return tablebase_result[:4]
+
+    def search(game: Game, color, depth):
+        nonlocal previous_score
+        alphabeta.nodes = 0
+        score, move, remaining_depth, nodes, passes = MTDf(game, color, depth, previous_score)
+        print(f"[MTD(f)] depth {depth}: {passes} passes")
+        previous_score = score
+        return score, move, remaining_depth, nodes
+
+    result = iterative_deepening(search, game, color, max_depth, time_budget)
+    print(alphabeta.transposition_table)
+    print(f"[QUIESCENCE] {alphabeta.quiescence_nodes} nodes")
+    return result
+
+
+MAIN_FUNC = MTDf_ID
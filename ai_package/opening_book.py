@@ -0,0 +1,198 @@
+from src.core.game import Game
+from src.core.move import Move
+from src.core.constants import DATA_PATH
+from bisect import bisect_left
+import argparse
+import random
+import struct
+import mmap
+import json
+import time
+import os
+
+"""
+Bibliothèque d'ouvertures : pour une position (clé de Zobrist, voir src/core/hash_key.py),
+les déplacements joués dans des parties de référence, avec leur poids (nombre de parties)
+et leur score (résultat moyen pour le joueur qui joue le déplacement, de -1000 à 1000).
+
+Les parties sont lues dans des fichiers d'enregistrements (une partie JSON par ligne,
+voir Game.get_record), par exemple ceux écrits par self_play.
+
+Format du fichier :
+    en-tête : MAGIC, nombre d'entrées (struct HEADER)
+    entrées : clé, déplacement compacté (Move.encode), poids, score (struct ENTRY),
+              triées par clé puis par poids décroissant
+Le fichier est projeté en mémoire (mmap) et une position est trouvée par recherche
+dichotomique sur les clés : aucune entrée n'est chargée à l'ouverture.
+"""
+
+MAGIC = b'OBK1'
+HEADER = struct.Struct('<4sI')
+ENTRY = struct.Struct('<QQIh')
+DEFAULT_PATH = os.path.join(DATA_PATH, "opening_book.bin")
+RECORDS_PATH = os.path.join(DATA_PATH, "self_play.jsonl")
+# Nombre de demi-coups de chaque partie retenus dans la bibliothèque
+DEFAULT_PLIES = 12
+# Écart de score maximal avec le meilleur déplacement pour qu'un déplacement soit joué
+SCORE_MARGIN = 250
+RESULT_SCALE = 1000
+
+
+class OpeningBook:
+    """ Consultation de la bibliothèque projetée en mémoire. """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} n'est pas une bibliothèque d'ouvertures.")
+
+    def get_entry(self, index):
+        """ Retourne (clé, déplacement compacté, poids, score) de l'entrée 'index'. """
+        return ENTRY.unpack_from(self.data, HEADER.size + index * ENTRY.size)
+
+    def get_key(self, index):
+        return struct.unpack_from('<Q', self.data, HEADER.size + index * ENTRY.size)[0]
+
+    def probe(self, key):
+        """ Liste des (déplacement compacté, poids, score) de la position, par poids décroissant. """
+        index = bisect_left(range(self.size), key, key=self.get_key)
+        entries = []
+        while index < self.size:
+            entry_key, move_code, weight, score = self.get_entry(index)
+            if entry_key != key:
+                break
+            entries.append((move_code, weight, score))
+            index += 1
+        return entries
+
+    def choose_move(self, game: Game, rng=random):
+        """
+        Déplacement de la bibliothèque pour la position de la partie, ou None.
+        On tire au sort, proportionnellement à leur poids, parmi les déplacements valides
+        dont le score est proche du meilleur.
+        """
+        valid_moves = {move.encode(): move for move in game.valid_moves}
+        entries = [entry for entry in self.probe(game.hash_key.get_value()) if entry[0] in valid_moves]
+        if not entries:
+            return None
+        best_score = max(score for _, _, score in entries)
+        candidates = [(move_code, weight) for move_code, weight, score in entries if score >= best_score - SCORE_MARGIN]
+        move_code, = rng.choices([move_code for move_code, _ in candidates], [weight for _, weight in candidates])
+        return valid_moves[move_code]
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"OpeningBook [{self.path}; {self.size} entries]"
+
+
+# Bibliothèque consultée par AI.choose_move, si elle a été construite (main_opening_book.py)
+book = OpeningBook(DEFAULT_PATH) if os.path.exists(DEFAULT_PATH) else None
+
+
+def choose_move(game: Game):
+    """ Déplacement de la bibliothèque par défaut, ou None. """
+    if book is None:
+        return None
+    return book.choose_move(game)
+
+
+class OpeningBookBuilder:
+    """
+    Construit une bibliothèque à partir de parties : chacune est rejouée depuis sa
+    configuration de départ et ses 'max_plies' premiers déplacements sont comptés.
+    """
+
+    def __init__(self, max_plies=DEFAULT_PLIES):
+        self.max_plies = max_plies
+        # (clé, déplacement compacté) -> [poids, somme des résultats, nombre de résultats connus]
+        self.entries = {}
+        self.games = 0
+
+    def add_game(self, board_config, move_codes, result=None):
+        """ Ajoute une partie ; result vaut 'white', 'black', 'draw' ou None s'il est inconnu. """
+        game = Game(board_config)
+        game.init_position()
+        for move_code in move_codes[:self.max_plies]:
+            entry = self.entries.setdefault((game.hash_key.get_value(), move_code), [0, 0, 0])
+            entry[0] += 1
+            if result is not None:
+                entry[1] += 0 if result == 'draw' else 1 if result == game.turn else -1
+                entry[2] += 1
+            game.apply_move(Move.decode(move_code))
+        self.games += 1
+
+    def add_records(self, path):
+        """ Ajoute les parties d'un fichier d'enregistrements (une partie JSON par ligne). """
+        with open(path, "r", encoding='UTF-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self.add_game(record['config'], record['moves'], record.get('result'))
+
+    def write(self, path=DEFAULT_PATH):
+        rows = sorted(((key, move_code, weight, round(RESULT_SCALE * total / results) if results else 0)
+                       for (key, move_code), (weight, total, results) in self.entries.items()),
+                      key=lambda row: (row[0], -row[2], row[1]))
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(rows)))
+            for row in rows:
+                f.write(ENTRY.pack(*row))
+        print(f"[OPENING BOOK] {len(rows)} entries from {self.games} games written to {path}")
+
+
+def self_play(engine_name, board_configs, games, random_plies, max_plies, seed, path=RECORDS_PATH):
+    """
+    Fait jouer l'IA 'engine_name' (paramètres de args.json) contre elle-même et ajoute les
+    parties au fichier d'enregistrements 'path'. Les 'random_plies' premiers déplacements
+    sont tirés au sort pour varier les ouvertures ; une partie est arrêtée après
+    'max_plies' demi-coups (résultat inconnu).
+    La bibliothèque n'est pas consultée : tous les déplacements viennent de la recherche.
+    """
+    from .tournament import play_game
+
+    rng = random.Random(seed)
+    with open(path, "a", encoding='UTF-8') as f:
+        for board_config in board_configs:
+            for _ in range(games):
+                start_time = time.time()
+                record, _ = play_game(engine_name, engine_name, board_config, rng.getrandbits(32), random_plies, max_plies)
+                f.write(json.dumps(record) + "\n")
+                print(f"[SELF PLAY] config {board_config}: {len(record['moves'])} plies, result {record['result']} in {round(time.time() - start_time, 3)}s")
+
+
+def main():
+    """ Point d'entrée en ligne de commande (main_opening_book.py). """
+    parser = argparse.ArgumentParser(description="Construit la bibliothèque d'ouvertures.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    play_parser = subparsers.add_parser("self-play", help="enregistre des parties de l'IA contre elle-même")
+    play_parser.add_argument("engine", help="nom de l'IA (voir args.json)")
+    play_parser.add_argument("--configs", type=int, nargs="+", default=[1], help="configurations du plateau")
+    play_parser.add_argument("--games", type=int, default=10, help="nombre de parties par configuration")
+    play_parser.add_argument("--random-plies", type=int, default=2, help="nombre de déplacements aléatoires au début")
+    play_parser.add_argument("--max-plies", type=int, default=200, help="nombre maximal de demi-coups par partie")
+    play_parser.add_argument("--seed", type=int, default=0, help="graine des déplacements aléatoires")
+    play_parser.add_argument("--output", default=RECORDS_PATH, help="fichier d'enregistrements")
+
+    build_parser = subparsers.add_parser("build", help="construit la bibliothèque à partir d'enregistrements")
+    build_parser.add_argument("records", nargs="*", default=[RECORDS_PATH], help="fichiers d'enregistrements")
+    build_parser.add_argument("--plies", type=int, default=DEFAULT_PLIES, help="demi-coups retenus par partie")
+    build_parser.add_argument("--output", default=DEFAULT_PATH, help="fichier à écrire")
+
+    args = parser.parse_args()
+    if args.command == "self-play":
+        self_play(args.engine, args.configs, args.games, args.random_plies, args.max_plies, args.seed, args.output)
+    else:
+        builder = OpeningBookBuilder(args.plies)
+        for path in args.records:
+            builder.add_records(path)
+        builder.write(args.output)
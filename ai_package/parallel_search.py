@@ -0,0 +1,227 @@
+from src.core.game import Game
+from src.core.move import Move
+from . import alphabeta
+from .iterative_deepening import deadline, SearchTimeout
+from .shared_transposition_table import SharedTranspositionTable
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_EXCEPTION
+from multiprocessing import util, get_context
+import pickle
+import time
+import os
+
+"""
+Recherche parallèle à la racine.
+À cause du GIL, des threads n'accélèrent pas la recherche : les déplacements de la racine
+sont donc répartis entre les processus d'un ProcessPoolExecutor. Chaque processus cherche
+le sous-arbre d'un déplacement avec PrincipalVariationSearch.
+
+Chaque itération suit le schéma de PVS à la racine :
+    - le meilleur déplacement de l'itération précédente est cherché seul, avec la fenêtre complète ;
+    - les autres sont cherchés par vagues de 'workers' déplacements en parallèle, avec une fenêtre
+      nulle au meilleur score connu, qui prouve seulement qu'ils ne font pas mieux ;
+    - seuls ceux qui échouent en haut sont cherchés à nouveau, en parallèle, pour leur score exact.
+      Leur fenêtre part de la meilleure borne inférieure obtenue par la fenêtre nulle.
+Le meilleur score ne peut que monter d'une vague à l'autre : les vagues suivantes coupent davantage.
+
+Deux modes de table de transposition :
+    - tables privées (shared_tt_size = 0) : chaque processus vide sa table au début d'une
+      recherche puis la conserve d'une itération à l'autre ;
+    - table partagée (shared_tt_size > 0) : tous les processus lisent et écrivent la même
+      SharedTranspositionTable, à la manière de Lazy SMP. Le travail d'un processus profite
+      aux autres.
+Dans les deux cas, le contenu des tables dépend de la répartition des tâches entre les
+processus, et les scores peuvent varier légèrement d'une exécution à l'autre.
+La fusion est déterministe : meilleur score, puis ordre de recherche (meilleur déplacement de
+l'itération précédente, puis ordre de génération), quel que soit le nombre de processus.
+"""
+
+executor = None
+executor_settings = None
+shared_table = None
+# Recherche en cours dans un processus du pool : ses tables sont conservées jusqu'à la suivante
+current_search = None
+
+
+def use_table(table):
+    """ Initialisation d'un processus du pool : il utilise la table partagée. """
+    alphabeta.transposition_table = table
+
+
+def get_shared_table(size):
+    """ La table partagée est créée par le processus principal et conservée entre les recherches. """
+    global shared_table
+    if shared_table is None or shared_table.size < size:
+        if shared_table is not None:
+            shared_table.close()
+        shared_table = SharedTranspositionTable(size)
+    return shared_table
+
+
+def shutdown_executor():
+    """ Arrête le pool de processus de la recherche, s'il existe. """
+    global executor, executor_settings
+    if executor is not None:
+        executor.shutdown(cancel_futures=True)
+    executor = executor_settings = None
+
+
+def get_executor(workers, table=None):
+    """
+    Le pool de processus est créé au premier appel et conservé entre les recherches.
+    Ses processus sont lancés par 'spawn' (comme sous Windows) : la recherche peut s'exécuter dans
+    un processus d'un autre pool (serveur, tournoi) qui a déjà des threads, et un 'fork' y copierait
+    des verrous déjà pris. Le pool est arrêté à la fin du processus qui l'a créé, avant que celui-ci
+    n'attende ses processus fils, sans quoi il ne s'arrêterait jamais (la priorité du finaliseur est
+    supérieure à celle des files du pool, qui doivent encore transmettre l'ordre d'arrêt).
+    """
+    global executor, executor_settings
+    settings = (workers, None if table is None else table.name)
+    if executor is None or executor_settings != settings:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        else:
+            util.Finalize(None, shutdown_executor, exitpriority=100)
+        if table is None:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn'))
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn'),
+                                           initializer=use_table, initargs=(table,))
+        executor_settings = settings
+    return executor
+
+
+def search_root_move(game_data, move_code, color, depth, alpha, beta, end_time, search_id, is_shared):
+    """
+    Tâche exécutée par un processus du pool : joue le déplacement de la racine
+    puis cherche la position obtenue à la profondeur depth - 1 dans la fenêtre [alpha, beta].
+    La table privée et les killers ne sont vidés qu'à la première tâche d'une nouvelle recherche.
+    Retourne (score, variation encodée, noeuds) ou None si end_time est dépassé.
+    """
+    global current_search
+    game: Game = pickle.loads(game_data)
+    move = Move.decode(move_code)
+    if search_id != current_search:
+        if not is_shared:
+            alphabeta.transposition_table.clear()
+        alphabeta.move_orderer.clear()
+        current_search = search_id
+    alphabeta.nodes = alphabeta.quiescence_nodes = 0
+
+    deadline.end_time = end_time
+    game.make_move(move)
+    try:
+        score, variation = alphabeta.PrincipalVariationSearch(game, color, depth - 1, alpha, beta, False)
+    except SearchTimeout:
+        return None
+    finally:
+        deadline.stop()
+
+    return score, [move_code] + [variation_move.encode() for variation_move in variation], \
+        alphabeta.nodes + alphabeta.quiescence_nodes
+
+
+def run_tasks(pool, tasks, end_time):
+    """
+    Exécute les tâches (arguments de search_root_move) en parallèle.
+    Retourne la liste de leurs résultats, ou None si l'une d'elles n'est pas terminée à end_time.
+    """
+    futures = [pool.submit(search_root_move, *task) for task in tasks]
+    done, not_done = wait(futures, timeout=None if end_time is None else max(0, end_time - time.time()), return_when=FIRST_EXCEPTION)
+    for future in not_done:
+        future.cancel()
+    outcomes = [future.result() if future in done else None for future in futures]
+    return None if None in outcomes else outcomes
+
+
+def search_root(pool, workers, game_data, root_moves, first_index, color, depth, end_time, search_id, is_shared):
+    """
+    Une itération à la profondeur 'depth' : le déplacement first_index est cherché en premier avec
+    la fenêtre complète, puis les autres par vagues avec une fenêtre nulle, et ceux qui échouent
+    en haut avec une fenêtre ouverte vers le haut.
+    Retourne (index du meilleur déplacement, score, variation encodée, noeuds) ou None si end_time est dépassé.
+    """
+    def task(index, alpha, beta):
+        return game_data, root_moves[index].encode(), color, depth, alpha, beta, end_time, search_id, is_shared
+
+    outcomes = run_tasks(pool, [task(first_index, float('-inf'), float('+inf'))], end_time)
+    if outcomes is None:
+        return None
+    best_score, best_variation, nodes = outcomes[0]
+    best_index = first_index
+
+    others = [index for index in range(len(root_moves)) if index != first_index]
+    for start in range(0, len(others), workers):
+        wave = others[start:start + workers]
+        outcomes = run_tasks(pool, [task(index, best_score, best_score + 1) for index in wave], end_time)
+        if outcomes is None:
+            return None
+        nodes += sum(outcome[2] for outcome in outcomes)
+        fail_high = [(index, outcome[0]) for index, outcome in zip(wave, outcomes) if outcome[0] > best_score]
+        if not fail_high:
+            continue
+
+        # Le meilleur score est au moins la plus grande des bornes inférieures obtenues
+        alpha = max(score for _, score in fail_high) - 1
+        outcomes = run_tasks(pool, [task(index, alpha, float('+inf')) for index, _ in fail_high], end_time)
+        if outcomes is None:
+            return None
+        # À score égal, le déplacement cherché le premier l'emporte
+        for (index, _), (score, variation, task_nodes) in zip(fail_high, outcomes):
+            nodes += task_nodes
+            if score > best_score:
+                best_index, best_score, best_variation = index, score, variation
+
+    return best_index, best_score, best_variation, nodes
+
+
+def ParallelSearch(game: Game, color, max_depth, time_budget, workers=None, shared_tt_size=0):
+    """
+    Point d'entrée de l'IA : approfondissement itératif à la racine, chaque itération
+    répartissant les déplacements de la racine entre 'workers' processus
+    (par défaut un par coeur). Une itération non terminée dans le budget est abandonnée.
+    Si shared_tt_size > 0, les processus partagent une table de transposition de cette taille.
+    Retourne (score, move, depth, nodes, variation principale).
+    """
+    # Finale présente dans les tables : inutile d'approfondir ou de démarrer le pool
+    tablebase_result = alphabeta.search_tablebase_root(game, color)
+    if tablebase_result is not None:
+        return tablebase_result
+
+    workers = workers or os.cpu_count()
+    table = None
+    if shared_tt_size:
+        table = get_shared_table(shared_tt_size)
+        table.new_search()
+    pool = get_executor(workers, table)
+    is_shared = table is not None
+    root_moves = game.valid_moves
+    game_data = pickle.dumps(game)
+    search_id = os.urandom(8)
+    start_time = time.time()
+    end_time = None
+    result = None
+    total_nodes = 0
+    best_index = 0
+
+    for depth in range(1, max_depth + 1):
+        outcome = search_root(pool, workers, game_data, root_moves, best_index, color, depth, end_time, search_id, is_shared)
+        if outcome is None:
+            break
+
+        best_index, score, variation_codes, nodes = outcome
+        total_nodes += nodes
+        result = score, root_moves[best_index], depth - 1, [Move.decode(code) for code in variation_codes]
+        print(f"[PARALLEL SEARCH] depth {depth} completed in {round(time.time() - start_time, 3)}s with {workers} workers: {result[1]} ({score})")
+
+        if depth == 1:
+            end_time = start_time + time_budget
+        if time.time() > end_time:
+            break
+
+    score, move, remaining_depth, variation = result
+    return score, move, remaining_depth, total_nodes, variation
+
+
+MAIN_FUNC = ParallelSearch
+# La recherche crée son propre pool de processus (voir AI.is_parallel)
+IS_PARALLEL = True
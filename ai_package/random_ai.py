@@ -1,17 +1,17 @@
-from src.game import Game
+from src.core.game import Game
 import random
 
 """
 random_ai est une IA aléatoire aussi appelée IA naïve.
-Elle prend en paramètre une instance de la classe game et
+Elle prend en paramètre une instance de la classe game (et la couleur de l'IA) et
 choisi aléatoirement* un élément de la liste game.valid_moves
 de type : list[Move]
 
 * pseudo-aléatoirement
 """
 
-def random_ai(game: Game):
-    return None, game.valid_moves[random.randint(0, len(game.valid_moves)-1)]
+def random_ai(game: Game, color):
+    return None, game.valid_moves[random.randint(0, len(game.valid_moves)-1)], 0, 1
 
 
 MAIN_FUNC = random_ai
@@ -0,0 +1,138 @@
+from .transposition_table import TranspositionTable, DEFAULT_SIZE
+from multiprocessing import shared_memory
+import atexit
+
+"""
+Table de transposition en mémoire partagée (multiprocessing.shared_memory),
+lue et écrite par tous les processus d'une recherche parallèle sur une même machine.
+
+Le segment est un tableau d'entiers non signés de 64 bits :
+    - le mot 0 contient la génération courante (commune à tous les processus) ;
+    - viennent ensuite les entrées, regroupées par paquets (buckets) de BUCKET_SIZE.
+Une entrée occupe trois mots : contrôle, données, déplacement compacté.
+    données = validité | profondeur | nature du score | génération | score
+    contrôle = clé ^ données ^ déplacement
+Les écritures se font sans verrou : si deux processus écrivent la même entrée en même temps,
+ou si une lecture croise une écriture, le mot de contrôle ne correspond plus à la clé
+et l'entrée est simplement ignorée (considérée comme absente).
+"""
+
+BUCKET_SIZE = 4
+WORDS_PER_ENTRY = 3
+HEADER_WORDS = 1
+WORD_SIZE = 8
+
+DEPTH_BITS = 8
+FLAG_SHIFT = DEPTH_BITS
+GENERATION_SHIFT = FLAG_SHIFT + 2
+SCORE_SHIFT = GENERATION_SHIFT + 8
+VALID_SHIFT = SCORE_SHIFT + 16
+SCORE_OFFSET = 1 << 15
+
+
+def pack_data(depth, score, flag, generation):
+    score = int(min(max(score, -SCORE_OFFSET), SCORE_OFFSET - 1))
+    return 1 << VALID_SHIFT | (score + SCORE_OFFSET) << SCORE_SHIFT | generation << GENERATION_SHIFT \
+        | flag << FLAG_SHIFT | depth
+
+
+def unpack_data(data):
+    """ Retourne (profondeur, score, nature du score, génération). """
+    return data & 0xFF, (data >> SCORE_SHIFT & 0xFFFF) - SCORE_OFFSET, data >> FLAG_SHIFT & 0b11, \
+        data >> GENERATION_SHIFT & 0xFF
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """
+    Même interface que TranspositionTable (probe, store, new_search, clear, statistiques).
+    Le processus qui crée la table (name=None) en est propriétaire et libère le segment
+    à la fin du programme ; les autres s'y rattachent par son nom.
+    Les statistiques restent propres à chaque processus.
+    """
+
+    def __init__(self, size=DEFAULT_SIZE, name=None):
+        # Puissance de 2, au moins un paquet
+        self.size = 1 << max(size - 1, BUCKET_SIZE - 1).bit_length()
+        self.bucket_mask = self.size // BUCKET_SIZE - 1
+        self.owner = name is None
+        byte_size = (HEADER_WORDS + self.size * WORDS_PER_ENTRY) * WORD_SIZE
+
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=byte_size)
+            atexit.register(self.close)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.words = self.shm.buf.cast('Q')
+        self.reset_stats()
+
+    def __reduce__(self):
+        # Un processus du pool reçoit la table par son nom et s'y rattache
+        return SharedTranspositionTable, (self.size, self.name)
+
+    @property
+    def generation(self):
+        return self.words[0]
+
+    def new_search(self):
+        self.words[0] = (self.words[0] + 1) & 0xFF
+        self.reset_stats()
+
+    def probe(self, key):
+        self.probes += 1
+        words = self.words
+        position = HEADER_WORDS + (key & self.bucket_mask) * BUCKET_SIZE * WORDS_PER_ENTRY
+        for index in range(position, position + BUCKET_SIZE * WORDS_PER_ENTRY, WORDS_PER_ENTRY):
+            check, data, move_code = words[index], words[index + 1], words[index + 2]
+            if data and check ^ data ^ move_code == key:
+                self.hits += 1
+                depth, score, flag, generation = unpack_data(data)
+                return key, depth, score, flag, move_code, generation
+        return None
+
+    def store(self, key, depth, score, flag, move_code):
+        """
+        Dans le paquet de la position, on remplace en priorité la même position,
+        puis une case vide, puis l'entrée d'une ancienne génération ou la moins profonde.
+        """
+        words = self.words
+        generation = words[0]
+        position = HEADER_WORDS + (key & self.bucket_mask) * BUCKET_SIZE * WORDS_PER_ENTRY
+        victim, victim_rank = None, None
+
+        for index in range(position, position + BUCKET_SIZE * WORDS_PER_ENTRY, WORDS_PER_ENTRY):
+            check, data = words[index], words[index + 1]
+            if not data or check ^ data ^ words[index + 2] == key:
+                victim, victim_rank = index, None
+                break
+            entry_depth, _, _, entry_generation = unpack_data(data)
+            rank = (entry_generation == generation, entry_depth)
+            if victim_rank is None or rank < victim_rank:
+                victim, victim_rank = index, rank
+
+        if victim_rank is not None:
+            if victim_rank[0] and victim_rank[1] > depth:
+                return
+            self.replacements += 1
+
+        data = pack_data(min(depth, 0xFF), score, flag, generation)
+        words[victim + 1] = data
+        words[victim + 2] = move_code
+        words[victim] = key ^ data ^ move_code
+        self.stores += 1
+
+    def clear(self):
+        generation = self.words[0]
+        self.shm.buf[:] = bytes(len(self.shm.buf))
+        self.words[0] = generation
+        self.reset_stats()
+
+    def close(self):
+        """ Détache le segment ; le propriétaire le supprime. """
+        if self.shm is None:
+            return
+        self.words.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+        self.shm = None
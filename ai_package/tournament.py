@@ -0,0 +1,201 @@
+from src.core.game import Game
+from . import alphabeta
+from .transposition_table import TranspositionTable
+from .move_ordering import MoveOrderer
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+import argparse
+import inspect
+import random
+import math
+import time
+import sys
+import os
+
+"""
+Tournoi sans interface graphique : les IA s'affrontent directement sur des instances de Game,
+chaque partie étant jouée par un processus d'un ProcessPoolExecutor.
+
+Un joueur est désigné par le nom de son module (paramètres lus dans args.json)
+ou par 'nom=paramètres' pour en essayer d'autres, par exemple "alphabeta=(4, 0.1)" :
+on compare ainsi plusieurs réglages d'une même IA.
+
+Chaque paire de joueurs joue, pour chaque configuration de plateau, des manches de deux
+parties : même ouverture (déplacements aléatoires d'une graine commune), couleurs inversées.
+Une partie non terminée après max_plies demi-coups est comptée nulle.
+Chaque joueur a sa propre table de transposition (de la taille tt_size de ses paramètres)
+et ses propres killers et historique, créés pour la partie : les IA d'alphabeta.py et de mtdf.py
+utilisent sinon les mêmes objets globaux, d'une partie et d'un joueur à l'autre.
+Les classements Elo sont ajustés par le modèle de Bradley-Terry (les nuls comptent
+pour une demi-victoire), avec une partie nulle fictive par paire pour que les scores
+de 0 % ou 100 % restent finis. Ils sont relatifs : leur moyenne vaut 0.
+"""
+
+DEFAULT_PLIES = 300
+ELO_ITERATIONS = 200
+
+
+def get_player(spec, color):
+    """ Instance d'AI pour le joueur 'spec' ('nom' ou 'nom=paramètres'). """
+    from .ai import AI
+
+    name, _, args = spec.partition('=')
+    player = AI.load(name, color)
+    if args:
+        player.args = eval(args)
+    return player
+
+
+def get_search_state(player):
+    """
+    Table de transposition et tri des déplacements propres au joueur pour une partie.
+    La table a la taille du paramètre tt_size de son IA ; None si l'IA n'a pas de table.
+    """
+    arguments = inspect.signature(player.engine).bind_partial(None, player.color, *player.args)
+    arguments.apply_defaults()
+    if 'tt_size' not in arguments.arguments:
+        return None
+    return TranspositionTable(arguments.arguments['tt_size']), MoveOrderer()
+
+
+def play_game(white, black, board_config, seed, random_plies, max_plies):
+    """
+    Joue une partie entre les joueurs 'white' et 'black' sans consulter la bibliothèque d'ouvertures.
+    Les 'random_plies' premiers déplacements sont tirés au sort avec la graine 'seed'.
+    Retourne l'enregistrement de la partie (Game.get_record) et, pour chaque couleur,
+    [temps de recherche total, nombre de recherches].
+    """
+    rng = random.Random(seed)
+    game = Game(board_config)
+    game.init_position()
+    players = {'white': get_player(white, 'white'), 'black': get_player(black, 'black')}
+    search_states = {color: get_search_state(player) for color, player in players.items()}
+    times = {'white': [0, 0], 'black': [0, 0]}
+
+    while not game.is_finished and len(game.moves_played) < max_plies:
+        if len(game.moves_played) < random_plies:
+            move = rng.choice(game.valid_moves)
+        else:
+            player = players[game.turn]
+            search_state = search_states[game.turn]
+            if search_state is not None:
+                # Les recherches utilisent les objets globaux d'alphabeta : on y place ceux du joueur
+                alphabeta.transposition_table, alphabeta.move_orderer = search_state
+            start_time = time.time()
+            _, move, *_ = player.engine(game, player.color, *player.args)
+            times[game.turn][0] += time.time() - start_time
+            times[game.turn][1] += 1
+        game.apply_move(move)
+
+    return game.get_record(), times
+
+
+def silence():
+    """ Initialisation d'un processus du pool : les IA n'affichent rien. """
+    sys.stdout = open(os.devnull, 'w')
+
+
+def compute_elo(players, results):
+    """
+    Classements Elo relatifs. results[(a, b)] = [points de a, nombre de parties] pour chaque paire de combinations(players, 2).
+    Algorithme MM de Bradley-Terry : force(a) = points(a) / somme(parties(a, b) / (force(a) + force(b))).
+    """
+    points = {player: 0 for player in players}
+    games = {}
+    for (a, b), (score, count) in results.items():
+        # Partie nulle fictive
+        points[a] += score + 0.5
+        points[b] += count - score + 0.5
+        games[(a, b)] = games[(b, a)] = count + 1
+
+    strengths = {player: 1 for player in players}
+    for _ in range(ELO_ITERATIONS):
+        strengths = {player: points[player] / sum(count / (strengths[player] + strengths[b])
+                                                  for (a, b), count in games.items() if a == player)
+                     for player in players}
+        mean = math.exp(sum(math.log(strength) for strength in strengths.values()) / len(players))
+        strengths = {player: strength / mean for player, strength in strengths.items()}
+
+    return {player: 400 * math.log10(strength) for player, strength in strengths.items()}
+
+
+def run_tournament(players, board_configs, rounds, random_plies, max_plies, seed, workers=None):
+    """
+    Fait jouer toutes les paires de joueurs et affiche le classement.
+    Retourne la liste des (blanc, noir, enregistrement, temps) des parties jouées.
+    """
+    rng = random.Random(seed)
+    games = []
+    for white, black in combinations(players, 2):
+        for board_config in board_configs:
+            for _ in range(rounds):
+                opening_seed = rng.getrandbits(32)
+                games.append((white, black, board_config, opening_seed))
+                games.append((black, white, board_config, opening_seed))
+
+    finished = []
+    start_time = time.time()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=silence) as pool:
+        futures = {pool.submit(play_game, white, black, board_config, opening_seed, random_plies, max_plies): (white, black)
+                   for white, black, board_config, opening_seed in games}
+        for future in as_completed(futures):
+            white, black = futures[future]
+            record, times = future.result()
+            finished.append((white, black, record, times))
+            print(f"[TOURNAMENT] {len(finished)}/{len(games)} {white} - {black}: {record['result'] or 'unfinished'} in {len(record['moves'])} plies")
+
+    print(f"[TOURNAMENT] {len(games)} games in {round(time.time() - start_time, 3)}s")
+    print_standings(players, finished)
+    return finished
+
+
+def print_standings(players, finished):
+    """ Affiche, pour chaque joueur, ses résultats, son classement Elo et son temps moyen par déplacement. """
+    stats = {player: {'wins': 0, 'draws': 0, 'losses': 0, 'time': 0, 'moves': 0} for player in players}
+    results = {pair: [0, 0] for pair in combinations(players, 2)}
+
+    for white, black, record, times in finished:
+        result = record['result']
+        for player, color in [(white, 'white'), (black, 'black')]:
+            if result in (None, 'draw'):
+                stats[player]['draws'] += 1
+            else:
+                stats[player]['wins' if result == color else 'losses'] += 1
+            stats[player]['time'] += times[color][0]
+            stats[player]['moves'] += times[color][1]
+        white_points = 0.5 if result in (None, 'draw') else float(result == 'white')
+        if (white, black) in results:
+            results[(white, black)][0] += white_points
+            results[(white, black)][1] += 1
+        else:
+            results[(black, white)][0] += 1 - white_points
+            results[(black, white)][1] += 1
+
+    elo = compute_elo(players, results)
+    print(f"{'player':<30} {'games':>6} {'wins':>6} {'draws':>6} {'losses':>6} {'score':>7} {'elo':>7} {'time/move':>10}")
+    for player in sorted(players, key=lambda player: -elo[player]):
+        player_stats = stats[player]
+        count = player_stats['wins'] + player_stats['draws'] + player_stats['losses']
+        score = (player_stats['wins'] + player_stats['draws'] / 2) / count if count else 0
+        move_time = player_stats['time'] / player_stats['moves'] if player_stats['moves'] else 0
+        print(f"{player:<30} {count:>6} {player_stats['wins']:>6} {player_stats['draws']:>6} {player_stats['losses']:>6} "
+              f"{score:>7.1%} {round(elo[player]):>7} {move_time:>9.3f}s")
+    for (a, b), (points, count) in results.items():
+        print(f"{a} - {b}: {points}/{count}")
+
+
+def main():
+    """ Point d'entrée en ligne de commande (main_tournament.py). """
+    parser = argparse.ArgumentParser(description="Tournoi entre IA, sans interface graphique.")
+    parser.add_argument("players", nargs="+", help="joueurs : nom de l'IA (args.json) ou nom=paramètres")
+    parser.add_argument("--configs", type=int, nargs="+", default=[1], help="configurations du plateau")
+    parser.add_argument("--rounds", type=int, default=10, help="manches (de deux parties) par paire et par configuration")
+    parser.add_argument("--random-plies", type=int, default=4, help="nombre de déplacements aléatoires au début")
+    parser.add_argument("--max-plies", type=int, default=DEFAULT_PLIES, help="nombre maximal de demi-coups par partie")
+    parser.add_argument("--seed", type=int, default=0, help="graine des ouvertures")
+    parser.add_argument("--workers", type=int, default=None, help="nombre de processus (par défaut un par coeur)")
+    args = parser.parse_args()
+
+    if len(args.players) < 2 or len(set(args.players)) != len(args.players):
+        parser.error("il faut au moins deux joueurs, tous différents")
+    run_tournament(args.players, args.configs, args.rounds, args.random_plies, args.max_plies, args.seed, args.workers)
@@ -0,0 +1,84 @@
+"""
+Table de transposition : mémorise le résultat de la recherche de chaque position
+(identifiée par sa clé de Zobrist) pour ne pas la chercher à nouveau lorsqu'elle
+est atteinte par un autre ordre de coups.
+"""
+
+# Nature du score mémorisé
+EXACT = 0
+LOWER_BOUND = 1 # le score réel est supérieur ou égal (coupure beta)
+UPPER_BOUND = 2 # le score réel est inférieur ou égal (aucun coup n'a dépassé alpha)
+
+DEFAULT_SIZE = 1 << 18
+
+
+class TranspositionTable:
+    """
+    Table de taille fixe : une entrée par case, la case d'une position étant donnée
+    par les bits de poids faible de sa clé. Une entrée est un tuple
+    (clé, profondeur, score, nature du score, déplacement compacté, génération).
+    Politique de remplacement : on remplace une entrée si elle concerne la même position,
+    si elle provient d'une recherche précédente (génération plus ancienne)
+    ou si la nouvelle entrée a été obtenue avec une profondeur au moins aussi grande.
+    """
+
+    def __init__(self, size=DEFAULT_SIZE):
+        # On arrondit à une puissance de 2 pour calculer l'index avec un masque
+        self.size = 1 << max(size - 1, 1).bit_length()
+        self.mask = self.size - 1
+        self.entries = [None] * self.size
+        self.generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def new_search(self):
+        """ Appelée au début de chaque recherche : les anciennes entrées deviennent remplaçables. """
+        self.generation += 1
+        self.reset_stats()
+
+    def probe(self, key):
+        """ Retourne l'entrée de la position 'key' ou None. """
+        self.probes += 1
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, score, flag, move_code):
+        """ Mémorise le résultat de la recherche d'une position selon la politique de remplacement. """
+        index = key & self.mask
+        entry = self.entries[index]
+        if entry is not None and entry[0] != key:
+            if entry[5] == self.generation and entry[1] > depth:
+                return
+            self.replacements += 1
+        self.entries[index] = (key, depth, score, flag, move_code, self.generation)
+        self.stores += 1
+
+    def clear(self):
+        self.entries = [None] * self.size
+        self.reset_stats()
+
+    def get_stats(self):
+        """ Statistiques de la dernière recherche. """
+        misses = self.probes - self.hits
+        hit_rate = self.hits / self.probes if self.probes > 0 else 0
+        return {
+            'probes': self.probes,
+            'hits': self.hits,
+            'misses': misses,
+            'hit_rate': round(hit_rate, 3),
+            'stores': self.stores,
+            'replacements': self.replacements,
+        }
+
+    def __repr__(self):
+        stats = self.get_stats()
+        return f"TT [size = {self.size}; hits = {stats['hits']}/{stats['probes']} ({stats['hit_rate']}); " \
+               f"stores = {stats['stores']}; replacements = {stats['replacements']}]"
@@ -17,7 +17,8 @@ class Client:
     message contenant la taille des informations à founir. 
     Le serveur pourra ensuite lire la taille des prochaines données qui arrive car il connaît lui aussi HEADER_SIZE
     Ainsi, il pourra récupérer la totalité de l'objet 'game' en une seule fois, sans perte de packets.
-    De la même manière, le serveur renvoie un objet 'move' récupéré par le client.
+    De la même manière, le serveur renvoie un déplacement compacté en entier (Move.encode)
+    récupéré par le client.
     """
 
     def __init__(self):
@@ -62,7 +63,7 @@ class Client:
     def apply_protocol(self, data: object):
         """ 
         Envoie une instance de la classe Game.
-        Reçoit une instance de la classe Move
+        Reçoit un déplacement compacté par Move.encode().
         """
         self.send(data)
 
@@ -1,11 +1,11 @@
 # ai-server
 
-import time
-import socket
-import threading
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import asyncio
 import pickle
 import signal
-import sys
+import os
 
 from .network_constants import *
 from ai_package.ai import AI
@@ -15,139 +15,150 @@ class Server:
     """
     Le serveur est utilisé pour recevoir et traiter les données envoyées par le client
     à un moment donner. Lorsque c'est au tour de l'IA, le client envoie un copie de l'objet 'game'.
-    Avant ça, il envoie la taille de ce transfère en octet.
+    Avant ça, il envoie la taille de ce transfère en octet (header de HEADER_SIZE octets).
     Le serveur récupère les données maintenant qu'il connaît la taille pour effectuer le transfère en
-    une seule fois. Il utilise les algorithmes d'IA qui lui sont fournies pour renvoyer un objet de type Move 
-    au client qui gère également l'interface graphique et appliquera le déplacement choisi par l'ordi.
+    une seule fois. Il utilise les algorithmes d'IA qui lui sont fournies pour renvoyer un déplacement
+    compacté (Move.encode) au client qui gère également l'interface graphique et appliquera le
+    déplacement choisi par l'ordi.
+
+    Toutes les connexions sont gérées par une seule boucle d'évènements asyncio : une tâche par
+    client, qui attend ses données sans bloquer les autres. Les recherches, qui occupent le
+    processeur, sont confiées à des processus pour que plusieurs parties soient calculées
+    en même temps sans bloquer la boucle :
+        - les IA séquentielles partagent un pool de 'workers' processus (par défaut un par coeur,
+          option --workers de main_server.py) ;
+        - une IA qui répartit elle-même sa recherche (AI.is_parallel, par exemple parallel_search)
+          crée déjà un pool de processus, dont la taille est son paramètre 'workers' (args.json).
+          Elle est donc exécutée par un processus réservé à sa connexion et non par le pool commun :
+          sinon chaque processus du pool créerait le sien, soit de l'ordre de workers² processus.
+          Une connexion qui joue une telle IA occupe ainsi 1 + 'workers' de l'IA processus.
     """
 
-    def __init__(self):
-        """
-        # AF_INET = Internet adress family for IPv4
-        # SOCK_STREAM = socket type for TCP
-        """
-        self.ai_index = 0
-        self.ai_list: list[AI] = []
-        self.current_ai: AI = None
-        self.is_server_running = True
-        self.number_of_connections = 0
-        self.threads: list[threading.Thread] = []
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.bind(ADDR)
-
-    def running_thread(self):
-        while self.is_server_running:
-            # conn is a new socket object representing the connection.
-            try:
-                conn, addr = self.server_socket.accept() # blocking
-                thread = threading.Thread(target=self.handle_client, args=(conn, addr))
-                thread.daemon = True
-                thread.start()
-                self.threads.append(thread)
-                self.number_of_connections = threading.activeCount() - 2
-                print(f"[ACTIVE CONNECTIONS] {self.number_of_connections}")
-            except OSError:
-                self.is_server_running = False
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count()
+        # Pool commun aux IA séquentielles
+        self.executor: ProcessPoolExecutor = None
+        self.server: asyncio.Server = None
+        self.sessions: set[asyncio.Task] = set()
+        self.stop_event: asyncio.Event = None
 
     def start(self):
-        """ Démarre et met le serveur sur écoute. """
-        self.server_socket.listen()
-        print(f"[LISTENING] Server is listening on {HOST}")
+        """ Démarre et met le serveur sur écoute jusqu'à la réception de SIGINT ou SIGTERM. """
+        asyncio.run(self.serve())
 
-        running_thread = threading.Thread(target=self.running_thread)
-        running_thread.daemon = True
-        running_thread.start()
-        self.threads.append(running_thread)
+    async def serve(self):
+        self.stop_event = asyncio.Event()
+        self.add_signal_handlers()
 
-        #Gestionnaire de signal
-        signal.signal(signal.SIGTERM, self.shutdown_server)
-        signal.signal(signal.SIGINT, self.shutdown_server)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.server = await asyncio.start_server(self.handle_client, HOST, PORT)
+        print(f"[LISTENING] Server is listening on {HOST}")
+
+        try:
+            await self.stop_event.wait()
+        finally:
+            await self.shutdown_server()
 
-        while self.is_server_running: continue
+    def add_signal_handlers(self):
+        """ Gestionnaire de signal : demande l'arrêt du serveur à la boucle d'évènements. """
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self.stop_event.set)
+            except NotImplementedError:
+                # Windows : le gestionnaire est appelé hors de la boucle
+                signal.signal(signum, lambda *_: loop.call_soon_threadsafe(self.stop_event.set))
 
-    def shutdown_server(self, signum, frame):
-        """ 
-        Méthode appelée quand l'un des signaux pour fermer
-        manuellement le serveur est reçu. Elle permet un arrêt propre.
-        TODO: enlver les threads daemons et fermer proprement tous les threads
+    async def shutdown_server(self):
+        """
+        Arrêt propre : on n'accepte plus de connexions, on ferme celles des clients,
+        on annule les recherches en attente et on attend la fin des processus.
         """
         print("Server is shutting down...")
-        self.is_server_running = False
-        print(f"Current threads: {self.threads}")
-        self.server_socket.close()
+        self.server.close()
+        for session in self.sessions:
+            session.cancel()
+        await asyncio.gather(*self.sessions, return_exceptions=True)
+        await self.server.wait_closed()
+        self.executor.shutdown(wait=True, cancel_futures=True)
         print("Done.")
-        sys.exit()
 
-    def handle_client(self, conn: socket.socket, addr):
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """
-        Reçoit une instance de la classe Game.
-        Renvoi une instance de la classe Move.
+        Reçoit les IA de la partie puis, à chaque tour, une instance de la classe Game.
+        Renvoi un déplacement compacté par Move.encode().
+        Chaque connexion a ses propres IA : plusieurs parties sont jouées en même temps.
         """
+        session = asyncio.current_task()
+        self.sessions.add(session)
+        addr = writer.get_extra_info('peername')
         print(f"[NEW CONNECTION] {addr} connected.")
-        
-        # On reçoit les IA qui vont être joué et le mode de jeu.
-        self.ai_list, can_switch = self.recv_ai(conn, addr)
-        self.current_ai: AI = self.ai_list[0]
+        print(f"[ACTIVE CONNECTIONS] {len(self.sessions)}")
+
+        # Processus réservé aux IA parallèles de la connexion, créé à leur première recherche
+        session_executor = None
 
         try:
+            # On reçoit les IA qui vont être joué et le mode de jeu.
+            ai_list, can_switch = await self.recv(reader)
+            print(f"[FIRST SEND] [{addr}] : {ai_list, can_switch}")
+            ai_index = 0
+
             while True: # Tant que le client est connecté
-                # conn.recv est une méthode bloquante
-                recv_header = conn.recv(HEADER_SIZE).decode(FORMAT) # reception du header
-                if not recv_header:
-                    break
-            
-                recv_data_length = int(recv_header) # on récupère la longueur des données suivantes
-                try:
-                    data_input = pickle.loads(conn.recv(recv_data_length)) # on récupère les données
-                except OSError as err:
-                    print(f"[ERROR] No data can be received.\n{err}")
-                    break
-
-                # Traitement des données
-                move = self.current_ai.choose_move(data_input, addr)
-
-                # Renvoi des données
-                try:
-                    data_output = pickle.dumps(move) # sérialisation
-                except OSError as err:
-                    print(f"[ERROR] Can't pickle object.\n{err}")
-                    break
-
-                send_data_length = len(data_output) # longueur en octets
-                send_header = str(send_data_length).encode(FORMAT) # encodage
-                send_header += b' ' * (HEADER_SIZE - len(send_header)) # complétion
-                conn.send(send_header) # Envoi du header 
-                conn.send(data_output) # Envoi des données
+                data_input = await self.recv(reader)
 
-                if can_switch:
-                    # On change d'IA après le tour            
-                    self.switch_ai()
+                # Traitement des données par un processus du pool (ou celui de la connexion)
+                current_ai: AI = ai_list[ai_index]
+                executor = self.executor
+                if current_ai.is_parallel:
+                    if session_executor is None:
+                        session_executor = ProcessPoolExecutor(max_workers=1)
+                    executor = session_executor
+                move = await asyncio.get_running_loop().run_in_executor(executor, current_ai.choose_move, data_input, addr)
+
+                # Renvoi des données (le déplacement compacté en entier)
+                await self.send(writer, move.encode())
 
-        except OSError as err:
+                if can_switch:
+                    # On change d'IA après le tour
+                    ai_index = (ai_index + 1) % len(ai_list)
+
+        except (asyncio.IncompleteReadError, asyncio.CancelledError):
+            # Le client s'est déconnecté ou le serveur s'arrête
+            pass
+        except Exception as err:
+            # Erreur de communication ou de l'IA : seule cette connexion est fermée
             print(f"[ERROR] Error occured: {err}")
 
         finally:
-            conn.close()
+            self.sessions.discard(session)
+            if session_executor is not None:
+                # Sans attendre : une recherche en cours se termine puis le processus s'arrête
+                session_executor.shutdown(wait=False, cancel_futures=True)
+            writer.close()
             print(f"[DECONNECTION] {addr} has disconnected.")
 
-    def switch_ai(self):
-        self.ai_index += 1
-        self.ai_index %= len(self.ai_list)
-        self.current_ai = self.ai_list[self.ai_index]
-
-    def recv_ai(self, conn: socket.socket, addr):
-        data_input = None
-        recv_header = conn.recv(HEADER_SIZE).decode(FORMAT) # reception du header
-        if not recv_header:
-            conn.close()
-    
-        recv_data_length = int(recv_header) # on récupère la longueur des données suivantes
-        try:
-            data_input = pickle.loads(conn.recv(recv_data_length)) # on récupère les données
-        except OSError as err:
-            print(f"[ERROR] No data can be received.\n{err}")
-            conn.close()
-
-        print(f"[FIRST SEND] [{addr}] : {data_input}")
-        
-        return data_input
+    async def recv(self, reader: asyncio.StreamReader):
+        """ Lit un header puis les données qu'il annonce, et les désérialise. """
+        recv_header = await reader.readexactly(HEADER_SIZE) # reception du header
+        recv_data_length = int(recv_header.decode(FORMAT)) # on récupère la longueur des données suivantes
+        return pickle.loads(await reader.readexactly(recv_data_length)) # on récupère les données
+
+    async def send(self, writer: asyncio.StreamWriter, data: object):
+        """ Envoi le header puis les données sérialisées. """
+        data_output = pickle.dumps(data) # sérialisation
+        send_header = str(len(data_output)).encode(FORMAT) # encodage de la longueur en octets
+        send_header += b' ' * (HEADER_SIZE - len(send_header)) # complétion
+        writer.write(send_header + data_output)
+        await writer.drain()
+
+
+def main():
+    """ Point d'entrée en ligne de commande (main_server.py). """
+    parser = argparse.ArgumentParser(description="Serveur des IA.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processus du pool des IA séquentielles (par défaut un par coeur)")
+    args = parser.parse_args()
+
+    server = Server(args.workers)
+    server.start()
@@ -0,0 +1,4 @@
+from ai_package.benchmark import main
+
+
+main()
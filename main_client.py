@@ -1,4 +1,7 @@
-from src.main import MainClient
+from src.startup_profiler import startup_profiler
+
+with startup_profiler.phase("imports"):
+    from src.main import MainClient
 
 
 main_client = MainClient()
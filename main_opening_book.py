@@ -0,0 +1,5 @@
+from ai_package.opening_book import main
+
+
+if __name__ == "__main__":
+    main()
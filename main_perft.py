@@ -0,0 +1,4 @@
+from src.core.perft import main
+
+
+main()
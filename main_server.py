@@ -1,5 +1,5 @@
-from communication.server import Server
+from communication.server import main
 
 
-server = Server()
-server.start()
+if __name__ == "__main__":
+    main()
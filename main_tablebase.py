@@ -0,0 +1,4 @@
+from src.core.tablebase import main
+
+
+main()
@@ -0,0 +1,5 @@
+from ai_package.tournament import main
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,8 @@ class Button:
         self.screen = screen
         self.pressed = False
 
+        if not pygame.font.get_init():
+            pygame.font.init()
         self.font = pygame.font.Font(font, font_size)
         self.rect = pygame.Rect(self.position[0], self.position[1], self.width, self.height)
         self.button = pygame.Surface([self.width, self.height], pygame.SRCALPHA)
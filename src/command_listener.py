@@ -1,5 +1,6 @@
 from .constants import *
 from .game import Game
+from .core.perft import Perft
 
 import sys
 import json
@@ -55,6 +56,28 @@ class CommandListener:
         for command in commands:
             print(f"- {command}\n")
 
+    def run_perft(self, depth, board_config=None, option=None):
+        """
+        Exécutée lors de la commande /perft <profondeur> [configuration] [divide|hash|compare]
+        A partir d'une copie de la position en cours (ou de la configuration demandée).
+        """
+        if board_config is None or board_config == "current":
+            board, color = self.game.board.copy(), self.game.turn
+        else:
+            board, color = Perft.from_config(int(board_config), self.game.player_side), 'white'
+
+        perft = Perft(board, color, use_hash=option == "hash")
+        if option == "compare":
+            perft.compare(int(depth))
+        else:
+            perft.run(int(depth), divide=option == "divide")
+
+    def toggle_hash_verification(self):
+        """ Exécutée lors de la commande /verify_hash : compare chaque mise à jour de la clé à un recalcul. """
+        hash_key = self.game.hash_key
+        hash_key.set_verify(not hash_key.verify)
+        print(f"Vérification de la clé de hachage {'activée' if hash_key.verify else 'désactivée'}.")
+
     @staticmethod
     def print_configs():
         """ Exécutée lors de la commande /configs """
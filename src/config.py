@@ -2,10 +2,9 @@ import pygame
 from .theme import Theme
 from .screen import Screen
 from .button import Button
+from .sprites import sprite_cache
 from .constants import *
-import pickle
 import json
-import os
 
 
 class Config:
@@ -21,6 +20,7 @@ class Config:
     def __init__(self, copy=False):
         
         self.themes, self.windows = [], []
+        self.fonts = {}
         self.buttons_list = []
         self.board_pos = (0, 0)
 
@@ -29,7 +29,6 @@ class Config:
         if not copy:
             self.init_settings()
             self.init_GUI()
-            self.dump_ai_objects()
 
     def init_settings(self):
         """ Initialise les attributs liés au jeu à partir du fichier settings. """
@@ -50,33 +49,23 @@ class Config:
         self.theme_index, self.window_index = 0, 0
         self.theme = self.themes[self.theme_index]
         self.window = self.windows[self.window_index]
-        pygame.font.init()
-        self.set_font()
 
-    def dump_ai_objects(self):
-        """ 
-        Initialise des objets de la classe IA
-        et les intègrent au fichier de configuration.
-        """
-        from ai_package.ai import AI
-
-        ai_dict = {}
-
-        for file_name in os.listdir(AI_PACKAGE_PATH):
-            if file_name not in ['__pycache__', '__init__.py', 'ai.py', 'args.json']:
-                module_name = os.path.splitext(file_name)[0]
-                module = __import__(f'ai_package.{module_name}', fromlist=[''])
+    def get_font(self, path, size):
+        """ Police de caractères chargée à sa première utilisation, puis conservée pour chaque taille. """
+        key = (path, size)
+        if key not in self.fonts:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.fonts[key] = pygame.font.Font(path, size)
+        return self.fonts[key]
 
-                for color in ['white', 'black']:
-                    ai_dict[f'{module_name}_{color}'] = str(pickle.dumps(AI(module_name, module.MAIN_FUNC, color)))
-            
-        with open(AI_OBJECTS_PATH, "w", encoding='UTF-8') as f:
-            json.dump(ai_dict, f, indent=4, ensure_ascii=False)
+    @property
+    def digital_font(self):
+        return self.get_font(DIGITAL_FONT_PATH, self.window.digital_font_size)
 
-    def set_font(self):
-        """ Récupère les polices de caractères. """
-        self.digital_font = pygame.font.Font("assets/digital-7.regular.ttf", self.window.digital_font_size)
-        self.text_font = pygame.font.Font("assets/recharge.rg-bold.otf", self.window.text_font_size)
+    @property
+    def text_font(self):
+        return self.get_font(TEXT_FONT_PATH, self.window.text_font_size)
 
     def change_theme(self):
         self.theme_index += 1
@@ -87,8 +76,8 @@ class Config:
         self.window_index += 1
         self.window_index %= len(self.windows)
         self.window = self.windows[self.window_index]
-        self.digital_font = pygame.font.Font("assets/digital-7.regular.ttf", self.window.digital_font_size)
-        self.text_font = pygame.font.Font("assets/recharge.rg-bold.otf", self.window.text_font_size)
+        # Les images des pièces à l'ancienne taille de case ne serviront plus
+        sprite_cache.invalidate()
 
     def _add_themes(self):
         """ 
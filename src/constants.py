@@ -1,15 +1,14 @@
 # ======= FICHIER SPECIFIQUE AU JEU =======
-import pygame
-import os, platform
-
-# ==== SYSTEME ====
-SYSTEM = platform.system()
-
-# ==== PLATEAU ====
-ROWS, COLS = 10, 10
+from .core.constants import *
+import os
 
 # ==== IMAGES ====
-ICON = pygame.image.load('assets/icon.ico')
+ASSETS_PATH = os.path.join(SYSTEM_PATH, "assets")
+ICON_PATH = os.path.join(ASSETS_PATH, "icon.ico")
+
+# ==== POLICES ====
+DIGITAL_FONT_PATH = os.path.join(ASSETS_PATH, "digital-7.regular.ttf")
+TEXT_FONT_PATH = os.path.join(ASSETS_PATH, "recharge.rg-bold.otf")
 
 # ==== COULEURS ====
 BG = (49, 46, 43)
@@ -24,13 +23,3 @@ GREY3 = (199, 198, 197)
 WHITE1 = (220, 220, 220)
 WHITE = (233, 233, 233)
 GREEN = (129, 182, 76)
-
-# ==== DOSSIERS DONNEES ====
-SYSTEM_PATH = os.getcwd()
-AI_PACKAGE_PATH = os.path.join(SYSTEM_PATH, "ai_package")
-DATA_PATH = os.path.join(SYSTEM_PATH, "data")
-
-BOARD_CONFIG_PATH = os.path.join(DATA_PATH, "board_config.json")
-CMDS_CONFIG_PATH = os.path.join(DATA_PATH, "commands.json")
-AI_OBJECTS_PATH = os.path.join(DATA_PATH, "ai_objects.json")
-SETTINGS_PATH = os.path.join(DATA_PATH, "settings.json")
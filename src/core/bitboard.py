@@ -0,0 +1,426 @@
+"""
+Représentation du plateau par bitboards.
+Seules les 50 cases foncées sont jouables : la case de coordonnées (row, col)
+correspond au bit numéro row * 5 + col // 2. Chaque ensemble de pièces
+(pions blancs, pions noirs, dames blanches, dames noires, cases vides)
+est un entier dont les bits à 1 désignent les cases occupées.
+"""
+from .constants import ROWS, COLS
+
+SQUARES = ROWS * COLS // 2
+FULL_MASK = (1 << SQUARES) - 1
+TOP_ROW = (1 << (COLS // 2)) - 1
+BOTTOM_ROW = TOP_ROW << (SQUARES - COLS // 2)
+DIRECTIONS = [(-1, -1), (-1, 1), (1, 1), (1, -1)]
+
+
+def coords_to_square(row, col):
+    """ Retourne le numéro de la case foncée de coordonnées (row, col). """
+    return row * (COLS // 2) + col // 2
+
+
+def square_to_coords(square):
+    """ Retourne les coordonnées (row, col) de la case foncée numéro 'square'. """
+    row = square // (COLS // 2)
+    col = 2 * (square % (COLS // 2)) + (1 if row % 2 == 0 else 0)
+    return row, col
+
+
+def iter_squares(mask):
+    """ Parcourt les numéros des cases dont le bit est à 1 dans 'mask'. """
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+def mask_to_coords(mask):
+    """ Convertit un masque en liste de coordonnées (row, col). """
+    return [square_to_coords(square) for square in iter_squares(mask)]
+
+
+def count_bits(mask):
+    """ Nombre de cases présentes dans le masque. """
+    return bin(mask).count('1')
+
+
+def _build_neighbours():
+    """ NEIGHBOURS[direction][square] : case voisine dans la direction donnée ou -1. """
+    neighbours = []
+    for dx, dy in DIRECTIONS:
+        direction_neighbours = []
+        for square in range(SQUARES):
+            row, col = square_to_coords(square)
+            if 0 <= row + dx < ROWS and 0 <= col + dy < COLS:
+                direction_neighbours.append(coords_to_square(row + dx, col + dy))
+            else:
+                direction_neighbours.append(-1)
+        neighbours.append(direction_neighbours)
+    return neighbours
+
+
+def _build_rays():
+    """ RAYS[direction][square] : cases rencontrées sur la diagonale jusqu'au bord du plateau. """
+    rays = []
+    for direction_index in range(len(DIRECTIONS)):
+        direction_rays = []
+        for square in range(SQUARES):
+            ray = []
+            target = NEIGHBOURS[direction_index][square]
+            while target != -1:
+                ray.append(target)
+                target = NEIGHBOURS[direction_index][target]
+            direction_rays.append(tuple(ray))
+        rays.append(direction_rays)
+    return rays
+
+
+def _build_shifts():
+    """
+    Selon la parité de la ligne, le décalage de numéro entre une case et sa voisine
+    n'est pas le même. SHIFTS[direction] regroupe les cases de départ par décalage
+    afin de déplacer un masque entier d'une case en quelques opérations.
+    """
+    shifts = []
+    for direction_index in range(len(DIRECTIONS)):
+        sources = {}
+        for square, target in enumerate(NEIGHBOURS[direction_index]):
+            if target != -1:
+                sources[target - square] = sources.get(target - square, 0) | (1 << square)
+        shifts.append(tuple(sources.items()))
+    return shifts
+
+
+NEIGHBOURS = _build_neighbours()
+RAYS = _build_rays()
+SHIFTS = _build_shifts()
+OPPOSITE_DIRECTION = [DIRECTIONS.index((-dx, -dy)) for dx, dy in DIRECTIONS]
+
+
+def shift(mask, direction_index):
+    """ Déplace toutes les cases du masque d'un cran dans la direction donnée. """
+    shifted = 0
+    for delta, sources in SHIFTS[direction_index]:
+        if delta > 0:
+            shifted |= (mask & sources) << delta
+        else:
+            shifted |= (mask & sources) >> -delta
+    return shifted
+
+
+class BitBoard:
+    """
+    Plateau représenté par des masques d'entiers (un bit par case foncée).
+    Un déplacement y est représenté par un triplet (origin, destination, captured)
+    où origin et destination sont des numéros de cases et captured le masque
+    des pièces sautées.
+    L'attribut white_side indique si les blancs jouent en bas ou en haut du plateau.
+    """
+
+    def __init__(self, white_side="bottom"):
+        self.white_side = white_side
+        self.pawns = {'white': 0, 'black': 0}
+        self.queens = {'white': 0, 'black': 0}
+        self.empty = FULL_MASK
+        self._init_forward_directions()
+
+    def _init_forward_directions(self):
+        """
+        Les pions blancs montent s'ils sont en bas du plateau, les noirs descendent.
+        promotion_rows : masque de la ligne où les pions de chaque couleur deviennent dames.
+        """
+        up = (DIRECTIONS.index((-1, -1)), DIRECTIONS.index((-1, 1)))
+        down = (DIRECTIONS.index((1, 1)), DIRECTIONS.index((1, -1)))
+        if self.white_side == "bottom":
+            self.forward_directions = {'white': up, 'black': down}
+            self.promotion_rows = {'white': TOP_ROW, 'black': BOTTOM_ROW}
+        else:
+            self.forward_directions = {'white': down, 'black': up}
+            self.promotion_rows = {'white': BOTTOM_ROW, 'black': TOP_ROW}
+
+    def is_promotion(self, color, origin, destination):
+        """ Indique si le déplacement d'un pion de 'origin' à 'destination' le fait devenir dame. """
+        return bool(self.pawns[color] >> origin & 1 and self.promotion_rows[color] >> destination & 1)
+
+    def get_pieces(self, color):
+        """ Masque de toutes les pièces d'une couleur. """
+        return self.pawns[color] | self.queens[color]
+
+    def get_occupied(self):
+        return FULL_MASK & ~self.empty
+
+    def get_key(self):
+        """ Identifiant exact de la position (sans le trait). """
+        return self.pawns['white'], self.pawns['black'], self.queens['white'], self.queens['black']
+
+    def get_content(self, square):
+        """ Retourne le couple (couleur, nom) de la pièce présente sur la case ou None. """
+        bit = 1 << square
+        for color in ['white', 'black']:
+            if self.pawns[color] & bit:
+                return color, 'pawn'
+            if self.queens[color] & bit:
+                return color, 'queen'
+        return None
+
+    def set_piece(self, square, color, name):
+        """ Ajoute une pièce sur une case vide. """
+        bit = 1 << square
+        if name == 'queen':
+            self.queens[color] |= bit
+        else:
+            self.pawns[color] |= bit
+        self.empty &= ~bit
+
+    def remove_piece(self, square):
+        """ Retire la pièce présente sur une case. """
+        keep = ~(1 << square)
+        for color in ['white', 'black']:
+            self.pawns[color] &= keep
+            self.queens[color] &= keep
+        self.empty |= 1 << square
+
+    def remove_pieces(self, captured):
+        """ Retire l'ensemble des pièces du masque 'captured'. """
+        keep = ~captured
+        for color in ['white', 'black']:
+            self.pawns[color] &= keep
+            self.queens[color] &= keep
+        self.empty |= captured
+
+    def move(self, origin, destination):
+        """ Déplace la pièce de la case 'origin' vers la case 'destination'. """
+        color, name = self.get_content(origin)
+        self.remove_piece(origin)
+        self.set_piece(destination, color, name)
+
+    def promote(self, square, color):
+        """ Transforme le pion de la case en dame. """
+        bit = 1 << square
+        self.pawns[color] &= ~bit
+        self.queens[color] |= bit
+
+    def demote(self, square, color):
+        """ Transforme la dame de la case en pion (annulation d'une promotion). """
+        bit = 1 << square
+        self.queens[color] &= ~bit
+        self.pawns[color] |= bit
+
+    def clear(self):
+        self.pawns = {'white': 0, 'black': 0}
+        self.queens = {'white': 0, 'black': 0}
+        self.empty = FULL_MASK
+
+    @staticmethod
+    def get_opposite_color(color):
+        return 'black' if color == 'white' else 'white'
+
+    def get_capturing_pieces(self, color):
+        """
+        Masque des pièces de couleur 'color' qui peuvent effectuer au moins une prise.
+        Le calcul se fait par décalages de masques entiers, sans construire aucun déplacement :
+        pour chaque direction, on repère les pièces adverses suivies d'une case vide,
+        puis les pions qui les touchent et les dames qui les voient à travers des cases vides.
+        """
+        empty = self.empty
+        pawns, queens = self.pawns[color], self.queens[color]
+        opponent_pieces = self.get_pieces(self.get_opposite_color(color))
+        capturing = 0
+        for direction_index in range(len(DIRECTIONS)):
+            back = OPPOSITE_DIRECTION[direction_index]
+            targets = opponent_pieces & shift(empty, back)
+            if not targets:
+                continue
+            capturing |= pawns & shift(targets, back)
+
+            if queens:
+                # Cases atteintes par les dames en glissant sur les cases vides
+                reach = shift(queens, direction_index)
+                slide = reach & empty
+                while slide:
+                    slide = shift(slide, direction_index)
+                    reach |= slide
+                    slide &= empty
+                hits = reach & targets
+                # Retour en arrière depuis les pièces attaquées jusqu'aux dames
+                while hits:
+                    hits = shift(hits, back)
+                    capturing |= hits & queens
+                    hits &= empty
+        return capturing
+
+    def has_capture(self, color):
+        return self.get_capturing_pieces(color) != 0
+
+    def has_valid_moves(self, color):
+        """ Vérifie, par décalages de masques, que le joueur 'color' peut encore jouer. """
+        empty = self.empty
+        for direction_index in self.forward_directions[color]:
+            if shift(self.pawns[color], direction_index) & empty:
+                return True
+        if self.queens[color]:
+            for direction_index in range(len(DIRECTIONS)):
+                if shift(self.queens[color], direction_index) & empty:
+                    return True
+        return self.has_capture(color)
+
+    def iter_free_moves(self, color):
+        """ Déplacements libres (triplets sans pièce capturée) des pièces de couleur 'color'. """
+        empty = self.empty
+        forward_directions = self.forward_directions[color]
+        for origin in iter_squares(self.get_pieces(color)):
+            if self.queens[color] >> origin & 1:
+                for direction_index in range(len(DIRECTIONS)):
+                    for target in RAYS[direction_index][origin]:
+                        if not (empty >> target & 1):
+                            break
+                        yield origin, target, 0
+            else:
+                for direction_index in forward_directions:
+                    target = NEIGHBOURS[direction_index][origin]
+                    if target != -1 and empty >> target & 1:
+                        yield origin, target, 0
+
+    def _iter_jumps(self, current, last_direction, captured, opponent_pieces, is_queen):
+        """
+        Sauts possibles depuis la case 'current' au cours d'une rafle.
+        Renvoie des triplets (direction, case d'arrivée, nouveau masque des pièces sautées).
+        Un pion saute une pièce voisine, une dame peut s'en approcher en glissant
+        puis s'arrêter sur n'importe quelle case vide derrière elle.
+        Les pièces déjà sautées restent sur le plateau jusqu'à la fin de la rafle.
+        """
+        empty = self.empty
+        for direction_index in range(len(DIRECTIONS)):
+            if last_direction is not None and direction_index == OPPOSITE_DIRECTION[last_direction]:
+                continue
+            ray = RAYS[direction_index][current]
+            index = 0
+            if is_queen:
+                while index < len(ray) and empty >> ray[index] & 1:
+                    index += 1
+            if index + 1 >= len(ray):
+                continue
+            target = ray[index]
+            if not (opponent_pieces >> target & 1) or captured >> target & 1:
+                continue
+            new_captured = captured | (1 << target)
+            index += 1
+            while index < len(ray) and empty >> ray[index] & 1:
+                yield direction_index, ray[index], new_captured
+                if not is_queen:
+                    break
+                index += 1
+
+    def _get_capture_length(self, current, last_direction, captured, opponent_pieces, is_queen):
+        """ Nombre maximum de pièces qu'il est encore possible de sauter depuis la case 'current'. """
+        length = 0
+        for direction_index, landing, new_captured in self._iter_jumps(current, last_direction, captured,
+                                                                       opponent_pieces, is_queen):
+            length = max(length, 1 + self._get_capture_length(landing, direction_index, new_captured,
+                                                              opponent_pieces, is_queen))
+        return length
+
+    def _iter_captures(self, origin, current, last_direction, captured, remaining, opponent_pieces, is_queen):
+        """ Rafles depuis la case 'current' qui sautent exactement 'remaining' pièces de plus. """
+        for direction_index, landing, new_captured in self._iter_jumps(current, last_direction, captured,
+                                                                       opponent_pieces, is_queen):
+            if remaining == 1:
+                yield origin, landing, new_captured
+            else:
+                yield from self._iter_captures(origin, landing, direction_index, new_captured,
+                                               remaining - 1, opponent_pieces, is_queen)
+
+    def iter_captures(self, color, capturing_pieces):
+        """
+        Rafles valides des pièces du masque 'capturing_pieces' selon la règle de la prise majoritaire.
+        La longueur maximale est d'abord calculée sans construire de déplacement, puis seules
+        les rafles de cette longueur sont produites, une à une.
+        """
+        opponent_pieces = self.get_pieces(self.get_opposite_color(color))
+        lengths = {}
+        for origin in iter_squares(capturing_pieces):
+            is_queen = self.queens[color] >> origin & 1 == 1
+            lengths[origin] = self._get_capture_length(origin, None, 0, opponent_pieces, is_queen), is_queen
+        max_length = max(length for length, _ in lengths.values())
+
+        for origin, (length, is_queen) in lengths.items():
+            if length == max_length:
+                yield from self._iter_captures(origin, origin, None, 0, max_length, opponent_pieces, is_queen)
+
+    def iter_valid_moves(self, color):
+        """
+        Produit à la demande les déplacements valides (triplets) du joueur 'color'.
+        On détecte d'abord s'il existe une prise : si oui, seules les rafles des pièces
+        qui peuvent prendre sont construites, sinon seuls les déplacements libres le sont.
+        """
+        capturing_pieces = self.get_capturing_pieces(color)
+        if capturing_pieces:
+            return self.iter_captures(color, capturing_pieces)
+        return self.iter_free_moves(color)
+
+    def is_valid_move(self, color, origin, destination, captured):
+        """
+        Vérifie qu'un déplacement (triplet) est valide pour le joueur 'color' sans générer
+        les autres déplacements : seules les rafles de la pièce 'origin' sont parcourues.
+        Sert à essayer un déplacement mémorisé (table de transposition) avant la génération.
+        """
+        if not (self.get_pieces(color) >> origin & 1) or not (self.empty >> destination & 1):
+            return False
+        is_queen = self.queens[color] >> origin & 1 == 1
+        capturing_pieces = self.get_capturing_pieces(color)
+
+        if not captured:
+            if capturing_pieces:
+                return False
+            if is_queen:
+                for ray in RAYS:
+                    for target in ray[origin]:
+                        if target == destination:
+                            return True
+                        if not (self.empty >> target & 1):
+                            break
+                return False
+            return any(NEIGHBOURS[direction_index][origin] == destination
+                       for direction_index in self.forward_directions[color])
+
+        # Prise majoritaire : aucune pièce ne peut sauter plus de pièces que cette rafle
+        if not (capturing_pieces >> origin & 1):
+            return False
+        opponent_pieces = self.get_pieces(self.get_opposite_color(color))
+        length = count_bits(captured)
+        if self._get_capture_length(origin, None, 0, opponent_pieces, is_queen) != length:
+            return False
+        for square in iter_squares(capturing_pieces & ~(1 << origin)):
+            if self._get_capture_length(square, None, 0, opponent_pieces, self.queens[color] >> square & 1 == 1) > length:
+                return False
+        return (origin, destination, captured) in self._iter_captures(origin, origin, None, 0, length,
+                                                                      opponent_pieces, is_queen)
+
+    def get_valid_moves(self, color):
+        """ Liste des déplacements valides (triplets) pour le joueur 'color'. """
+        return list(self.iter_valid_moves(color))
+
+    def copy(self):
+        """ Copie une instance de la classe BitBoard. """
+        bitboard_copy = BitBoard(self.white_side)
+        bitboard_copy.pawns = dict(self.pawns)
+        bitboard_copy.queens = dict(self.queens)
+        bitboard_copy.empty = self.empty
+        return bitboard_copy
+
+    def __repr__(self):
+        lines = []
+        for row in range(ROWS):
+            line = ""
+            for col in range(COLS):
+                if (row + col) % 2 == 0:
+                    line += " "
+                    continue
+                content = self.get_content(coords_to_square(row, col))
+                if content is None:
+                    line += "."
+                else:
+                    symbol = 'p' if content[1] == 'pawn' else 'q'
+                    line += symbol.upper() if content[0] == 'white' else symbol
+            lines.append(line)
+        return "\n".join(lines)
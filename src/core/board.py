@@ -1,6 +1,8 @@
 from .constants import *
 from .piece import Piece
 from .move import Move
+from .bitboard import BitBoard, coords_to_square
+from .evaluation_terms import SQUARE_TABLES, ADVANCEMENT_TABLES
 import json, os
 from copy import deepcopy
 
@@ -8,8 +10,13 @@ from copy import deepcopy
 class Board:
     """
     Le plateau de jeu est représenté par une matrice.
-    L'objet a aussi pour attributs le nombre de pièces de chaque joueur
-    ainsi que la dernière pièce déplacée.
+    L'objet a aussi pour attributs le nombre de pièces de chaque joueur,
+    les pièces de chaque joueur indexées par leur position (team_pieces),
+    les termes de l'évaluation positionnelle de chaque joueur (evaluation_terms)
+    ainsi que la dernière pièce déplacée. Ces attributs sont tenus à jour à chaque
+    déplacement, capture et promotion plutôt que recalculés en parcourant le plateau.
+    La même position est maintenue sous forme de bitboards (attribut bitboard)
+    sur lesquels s'appuie la génération des déplacements.
     """
 
     def __init__(self, config, player_side):
@@ -18,12 +25,32 @@ class Board:
         self.board = [[0 for _ in range(COLS)] for _ in range(ROWS)]
         self.config = config
         self.last_move = None
+        self.bitboard = BitBoard(player_side)
+        self.team_pieces = {'white': {}, 'black': {}}
+        self.square_tables = SQUARE_TABLES[player_side]
+        self.advancement_tables = ADVANCEMENT_TABLES[player_side]
         self._init_pieces_dictionary()
+        self._init_evaluation_terms()
 
     def init(self):
-        """ Initialise la matrice du plateau et le dictionnaire des pièces. """
+        """ Initialise la matrice du plateau, les bitboards et le dictionnaire des pièces. """
         self._init_board(self.config, self.player_side)
+        self._init_team_pieces()
+        self._init_bitboard()
         self.update_pieces_count()
+        self.update_evaluation_terms()
+
+    def _init_team_pieces(self):
+        """ Range les pièces de la matrice par couleur, indexées par leur position (row, col). """
+        self.team_pieces = {'white': {}, 'black': {}}
+        for piece in self.get_all_pieces():
+            self.team_pieces[piece.color][(piece.row, piece.col)] = piece
+
+    def _init_bitboard(self):
+        """ Reconstruit les bitboards à partir de la matrice du plateau. """
+        self.bitboard.clear()
+        for piece in self.get_all_pieces():
+            self.bitboard.set_piece(coords_to_square(piece.row, piece.col), piece.color, piece.name)
         
     def _init_pieces_dictionary(self):
         """ Initialise le dictionnaire contenant le nombre de pions et de dames pour chaque joueur."""
@@ -39,11 +66,51 @@ class Board:
         }
 
     def update_pieces_count(self):
-        """ Met à jour le dictionnaire contenant le nombre de pions et de dames pour chaque joueur. """
+        """
+        Recompte entièrement le nombre de pions et de dames pour chaque joueur.
+        Ensuite, les compteurs sont mis à jour au fil des déplacements.
+        """
+        self._init_pieces_dictionary()
         for color in ['white', 'black']:
             for piece in self.get_team_pieces(color):
                 self.pieces_dict[piece.color][piece.name] += 1
     
+    def _init_evaluation_terms(self):
+        """
+        Termes de l'évaluation de chaque joueur (voir src/core/evaluation_terms.py) :
+        somme des tables pièce-case et nombre total de lignes parcourues par ses pions.
+        """
+        self.evaluation_terms = {
+            'white': {
+                'square_values': 0,
+                'advancement': 0
+            },
+            'black': {
+                'square_values': 0,
+                'advancement': 0
+            }
+        }
+
+    def update_evaluation_terms(self):
+        """
+        Recalcule entièrement les termes de l'évaluation.
+        Ensuite, ils sont mis à jour au fil des déplacements.
+        """
+        self._init_evaluation_terms()
+        for color in ['white', 'black']:
+            for piece in self.get_team_pieces(color):
+                self._update_evaluation_terms(piece.color, piece.name, coords_to_square(piece.row, piece.col), 1)
+
+    def _update_evaluation_terms(self, color, name, square, sign):
+        """ Ajoute (sign = 1) ou retire (sign = -1) la contribution d'une pièce sur une case. """
+        terms = self.evaluation_terms[color]
+        terms['square_values'] += sign * self.square_tables[color][name][square]
+        if name == 'pawn':
+            terms['advancement'] += sign * self.advancement_tables[color][square]
+
+    def get_evaluation_terms(self, color):
+        return self.evaluation_terms[color]
+
     def get_number_of_queens(self, color):
         return self.pieces_dict[color]['queen']
     
@@ -75,24 +142,10 @@ class Board:
         """ Vérifie les coordonnées (row, col) correspondent à une case vide du plateau. """
         return self.in_range(row, col) and self.is_empty_square(row, col)
 
-    def get_team_pieces(self, color):
-        """ 
-        Renvoi sous forme de liste la totalité des pions appartenant au joueur courant.
-        Réinitialise également la liste des déplacements de chaque pièce. 
-        """
-        team_pieces_list: list[Piece] = []
-        for row in range(len(self.board)):
-            team_pieces_list.extend(self.get_team_pieces_on_row(color, row))
-        return team_pieces_list
+    def get_team_pieces(self, color) -> list[Piece]:
+        """ Renvoi sous forme de liste la totalité des pièces appartenant au joueur 'color'. """
+        return list(self.team_pieces[color].values())
 
-    def get_team_pieces_on_row(self, color, row):
-        pieces_list = []
-        for col in range(len(self.board)):
-            if not(self.is_empty_square(row, col)) and self.board[row][col].color == color:
-                piece = self.get_piece(row, col)
-                pieces_list.append(piece)
-        return pieces_list
-    
     def get_all_pieces(self) -> list[Piece]:
         """ Renvoi sous forme de liste la totalité des pions du plateau """
         pieces_list: list[Piece] = []
@@ -109,16 +162,24 @@ class Board:
 
     def move_piece(self, move: Move):
         """ Déplace une pièce sur le plateau (sans prendre en compte les règles). """
-        piece: Piece = move.get_piece()
         initial_pos, final_pos = move.get_initial_pos(), move.get_final_pos()
+        piece: Piece = self.get_piece(initial_pos[0], initial_pos[1])
+        self._update_evaluation_terms(piece.color, piece.name, move.origin, -1)
 
         self.board[initial_pos[0]][initial_pos[1]] = 0
         self.board[final_pos[0]][final_pos[1]] = piece
+        self.bitboard.move(move.origin, move.destination)
+        del self.team_pieces[piece.color][initial_pos]
+        self.team_pieces[piece.color][final_pos] = piece
         
         self.last_move = move
 
         piece.update_pos(final_pos[0], final_pos[1])
-        piece.check_promotion()
+        if piece.check_promotion():
+            self.bitboard.promote(move.destination, piece.color)
+            self.pieces_dict[piece.color]['pawn'] -= 1
+            self.pieces_dict[piece.color]['queen'] += 1
+        self._update_evaluation_terms(piece.color, piece.name, move.destination, 1)
     
     def _add_piece(self, row, col, color, name, side):
         piece = Piece(row, col, color, name, side)
@@ -129,12 +190,65 @@ class Board:
         """ 
         Supprime l'ensemble des pièces contenues dans la liste 'skipped_pieces'
         et qui ont été sautées suite à une capture. La liste contient au moins 1 élément.
-        Met à jour le conmpteur des pièces.
+        Met à jour le conmpteur des pièces et retourne la liste des pièces supprimées.
         """
+        removed_pieces: list[Piece] = []
         for coords in skipped_pieces:
             piece = self.get_piece(coords[0], coords[1])
             self.board[piece.row][piece.col] = 0
+            self.bitboard.remove_piece(coords_to_square(piece.row, piece.col))
+            del self.team_pieces[piece.color][(piece.row, piece.col)]
             self.pieces_dict[piece.color][piece.name] -= 1
+            self._update_evaluation_terms(piece.color, piece.name, coords_to_square(piece.row, piece.col), -1)
+            removed_pieces.append(piece)
+        return removed_pieces
+
+    def _restore_piece(self, piece: Piece):
+        """ Remet sur le plateau une pièce supprimée par remove_pieces. """
+        self.board[piece.row][piece.col] = piece
+        self.bitboard.set_piece(coords_to_square(piece.row, piece.col), piece.color, piece.name)
+        self.team_pieces[piece.color][(piece.row, piece.col)] = piece
+        self.pieces_dict[piece.color][piece.name] += 1
+        self._update_evaluation_terms(piece.color, piece.name, coords_to_square(piece.row, piece.col), 1)
+
+    def make_move(self, move: Move):
+        """
+        Joue un déplacement sur le plateau (pièce déplacée et pièces capturées)
+        et retourne les informations nécessaires pour l'annuler avec unmake_move.
+        """
+        last_move, was_pawn = self.last_move, move.is_pawn_move()
+        self.move_piece(move)
+
+        captured_pieces = []
+        if move.is_capture():
+            captured_pieces = self.remove_pieces(move.get_skipped_list())
+        return last_move, was_pawn, captured_pieces
+
+    def unmake_move(self, move: Move, undo_info):
+        """ Annule exactement un déplacement joué par make_move. """
+        last_move, was_pawn, captured_pieces = undo_info
+        initial_pos, final_pos = move.get_initial_pos(), move.get_final_pos()
+        piece: Piece = self.get_piece(final_pos[0], final_pos[1])
+        self._update_evaluation_terms(piece.color, piece.name, move.destination, -1)
+
+        if was_pawn and piece.is_queen():
+            piece.make_pawn()
+            self.bitboard.demote(move.destination, piece.color)
+            self.pieces_dict[piece.color]['queen'] -= 1
+            self.pieces_dict[piece.color]['pawn'] += 1
+
+        self.board[final_pos[0]][final_pos[1]] = 0
+        self.board[initial_pos[0]][initial_pos[1]] = piece
+        self.bitboard.move(move.destination, move.origin)
+        del self.team_pieces[piece.color][final_pos]
+        self.team_pieces[piece.color][initial_pos] = piece
+        piece.update_pos(initial_pos[0], initial_pos[1])
+        self._update_evaluation_terms(piece.color, piece.name, move.origin, 1)
+
+        for captured_piece in captured_pieces:
+            self._restore_piece(captured_piece)
+
+        self.last_move = last_move
 
     @staticmethod
     def print_valid_moves(valid_moves):
@@ -152,7 +266,7 @@ class Board:
         """
         most_effective_move: Move = None
         for move in possible_moves:
-            if most_effective_move is None or len(move.get_skipped_list()) > len(most_effective_move.get_skipped_list()):
+            if most_effective_move is None or move.get_number_of_captures() > most_effective_move.get_number_of_captures():
                 most_effective_move = move
 
         return most_effective_move
@@ -164,7 +278,7 @@ class Board:
         """
         valid_moves = []
         for move in possible_moves:
-            if len(move.get_skipped_list()) == len(most_effective_move.get_skipped_list()):
+            if move.get_number_of_captures() == most_effective_move.get_number_of_captures():
                 valid_moves.append(move)
         
         return valid_moves
@@ -185,10 +299,49 @@ class Board:
         else:
             return possible_moves
 
+    def _to_move(self, color_turn, origin, destination, captured) -> Move:
+        """ Convertit un déplacement du bitboard en objet de la classe 'Move'. """
+        return Move(origin, destination, captured, not (self.bitboard.queens[color_turn] >> origin & 1))
+
+    def iter_valid_moves(self, color_turn):
+        """
+        Produit un à un les déplacements valides des pièces de couleur 'color_turn'.
+        Seuls les déplacements effectivement parcourus sont construits, ce qui permet
+        à une recherche interrompue (élagage) de ne pas payer pour les autres.
+        Le plateau doit être dans le même état à chaque reprise de l'itération
+        (c'est le cas entre make_move et unmake_move).
+        """
+        for origin, destination, captured in self.bitboard.iter_valid_moves(color_turn):
+            yield self._to_move(color_turn, origin, destination, captured)
+
     def get_valid_moves(self, color_turn) -> list[Move]:
         """"
         Récupère l'ensemble des déplacements valides de toutes les pièces
         de couleur 'color_turn' présentes sur le plateau à un certain tour.
+        La génération est faite sur les bitboards, puis chaque déplacement
+        est converti en objet de la classe 'Move'.
+        """
+        return list(self.iter_valid_moves(color_turn))
+
+    def is_valid_move(self, color_turn, move: Move):
+        """ Vérifie que 'move' est valide pour le joueur 'color_turn', sans générer ses déplacements. """
+        is_queen = self.bitboard.queens[color_turn] >> move.origin & 1 == 1
+        return move.is_pawn != is_queen and \
+            self.bitboard.is_valid_move(color_turn, move.origin, move.destination, move.captured)
+
+    def has_valid_moves(self, color_turn):
+        """ Vérifie que le joueur 'color_turn' peut jouer, sans générer ses déplacements. """
+        return self.bitboard.has_valid_moves(color_turn)
+
+    def has_capture(self, color_turn):
+        """ Vérifie que le joueur 'color_turn' est obligé de prendre, sans générer ses déplacements. """
+        return self.bitboard.has_capture(color_turn)
+
+    def get_matrix_valid_moves(self, color_turn) -> list[Move]:
+        """"
+        Générateur de référence qui parcourt la matrice case par case.
+        Récupère l'ensemble des déplacements valides de toutes les pièces
+        de couleur 'color_turn' présentes sur le plateau à un certain tour.
         La valeur de retour une liste qui contient des objets de la classe 'Move'.
         """
         possible_directions = [(-1, -1), (-1, 1), (1, 1), (1, -1)]
@@ -206,7 +359,6 @@ class Board:
         
         return valid_moves
 
-
     def _get_piece_moves(self, player_turn, piece: Piece, start_position, last_direction, skipped_list,
                   possible_directions, current_row, current_col):
         """
@@ -258,12 +410,12 @@ class Board:
         """ Ajoute les déplacements possibles et appelle la méthode get_piece_moves()"""
         if piece.is_queen():
             while self.is_in_range_and_empty(new_target_row, new_target_col) and (new_target_row, new_target_col) != start_position:
-                piece_moves.append(Move(player_turn, piece, (piece.row, piece.col), (new_target_row, new_target_col), skipped))
+                piece_moves.append(Move.from_coords((piece.row, piece.col), (new_target_row, new_target_col), skipped, piece.is_pawn()))
                 piece_moves.extend(self._get_piece_moves(player_turn, piece, start_position, new_last_dir, skipped,
                                             possible_directions, new_target_row, new_target_col))
                 new_target_row += dx; new_target_col += dy
         else:
-            piece_moves.append(Move(player_turn, piece, (piece.row, piece.col), (new_target_row, new_target_col), skipped))
+            piece_moves.append(Move.from_coords((piece.row, piece.col), (new_target_row, new_target_col), skipped, piece.is_pawn()))
             piece_moves.extend(self._get_piece_moves(player_turn, piece, start_position, new_last_dir, skipped,
                                             possible_directions, new_target_row, new_target_col))
 
@@ -298,12 +450,12 @@ class Board:
         """
         if not piece.is_queen():
             if dx == piece.direction:
-                piece_moves.append(Move(player_turn, piece, (piece.row, piece.col), (row, col), []))
+                piece_moves.append(Move.from_coords((piece.row, piece.col), (row, col), [], piece.is_pawn()))
                 return True, piece_moves, row, col
         else:
             row, col, empty_squares_list = self._check_diagonal_squares(dx, dy, row, col, True)
             for square in empty_squares_list:
-                piece_moves.append(Move(player_turn, piece, (piece.row, piece.col), (square[0], square[1]), []))
+                piece_moves.append(Move.from_coords((piece.row, piece.col), (square[0], square[1]), [], piece.is_pawn()))
 
         return False, piece_moves, row, col
     
@@ -430,6 +582,10 @@ class Board:
                 if self.board[row][col] == 0:
                     board_copy.board[row][col] = 0
                 else:
-                    board_copy.board[row][col] = self.board[row][col].copy()
+                    piece_copy = self.board[row][col].copy()
+                    board_copy.board[row][col] = piece_copy
+                    board_copy.team_pieces[piece_copy.color][(row, col)] = piece_copy
         board_copy.pieces_dict = deepcopy(self.pieces_dict)
+        board_copy.evaluation_terms = deepcopy(self.evaluation_terms)
+        board_copy.bitboard = self.bitboard.copy()
         return board_copy
@@ -0,0 +1,18 @@
+# ======= CONSTANTES DU MODELE DE JEU (sans interface graphique) =======
+import os, platform
+
+# ==== SYSTEME ====
+SYSTEM = platform.system()
+
+# ==== PLATEAU ====
+ROWS, COLS = 10, 10
+
+# ==== DOSSIERS DONNEES ====
+# Racine du projet, indépendante du dossier depuis lequel le programme est lancé
+SYSTEM_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+AI_PACKAGE_PATH = os.path.join(SYSTEM_PATH, "ai_package")
+DATA_PATH = os.path.join(SYSTEM_PATH, "data")
+
+BOARD_CONFIG_PATH = os.path.join(DATA_PATH, "board_config.json")
+CMDS_CONFIG_PATH = os.path.join(DATA_PATH, "commands.json")
+SETTINGS_PATH = os.path.join(DATA_PATH, "settings.json")
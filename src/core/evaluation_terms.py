@@ -0,0 +1,68 @@
+"""
+Termes de l'évaluation positionnelle tenus à jour par le plateau (src/core/board.py)
+à chaque déplacement, prise et promotion, et utilisés par ai_package/evaluation.py.
+
+Les tables sont écrites pour le joueur qui joue en bas et dont les pions montent
+(ligne 0 = ligne de promotion). Pour le joueur du haut, la case numéro s correspond
+à la case 49 - s (rotation d'un demi-tour du plateau).
+Les scores sont entiers, un pion valant PAWN_VALUE.
+"""
+from .constants import ROWS, COLS
+from .bitboard import SQUARES, square_to_coords
+
+PAWN_VALUE = 100
+QUEEN_VALUE = 300
+ADVANCEMENT_WEIGHT = 3 # par ligne parcourue par un pion
+BACK_RANK_BONUS = 10 # pion resté sur la ligne de départ, qui protège de la promotion adverse
+CENTER_BONUS = 6 # pion au centre du plateau
+EDGE_PENALTY = 4 # pion sur un bord, qui ne contrôle qu'une diagonale
+LONG_DIAGONAL_BONUS = 12 # dame sur la grande diagonale
+TEMPO_BONUS = 5 # avantage d'avoir le trait
+
+
+def _build_table(function):
+    """ Liste de 50 valeurs entières : function(row, col) pour chaque case foncée. """
+    return [function(*square_to_coords(square)) for square in range(SQUARES)]
+
+
+# Tables du joueur du bas
+ADVANCEMENT_TABLE = _build_table(lambda row, col: ROWS - 1 - row)
+BACK_RANK_TABLE = _build_table(lambda row, col: BACK_RANK_BONUS if row == ROWS - 1 else 0)
+CENTER_TABLE = _build_table(lambda row, col: CENTER_BONUS if 3 <= row <= 6 and 2 <= col <= 7 else 0)
+EDGE_TABLE = _build_table(lambda row, col: -EDGE_PENALTY if col in (0, COLS - 1) else 0)
+LONG_DIAGONAL_TABLE = _build_table(lambda row, col: LONG_DIAGONAL_BONUS if row + col == COLS - 1 else 0)
+
+# Tables pièce-case (piece-square tables) : bonus de position hors matériel et avancement
+PAWN_SQUARE_TABLE = [sum(values) for values in zip(BACK_RANK_TABLE, CENTER_TABLE, EDGE_TABLE)]
+QUEEN_SQUARE_TABLE = LONG_DIAGONAL_TABLE
+
+
+def get_tables(white_side, table_by_name):
+    """
+    Oriente des tables écrites pour le joueur du bas : retourne table[color][name][square]
+    selon le côté où jouent les blancs. table_by_name associe une table à chaque nom de pièce.
+    """
+    tables = {}
+    for color in ['white', 'black']:
+        is_bottom = (color == 'white') == (white_side == "bottom")
+        tables[color] = {
+            name: list(table) if is_bottom else list(reversed(table))
+            for name, table in table_by_name.items()
+        }
+    return tables
+
+
+def get_square_tables(white_side):
+    """ Tables pièce-case orientées : square_tables[color][name][square]. """
+    return get_tables(white_side, {'pawn': PAWN_SQUARE_TABLE, 'queen': QUEEN_SQUARE_TABLE})
+
+
+def get_advancement_tables(white_side):
+    """ Nombre de lignes parcourues par un pion de chaque couleur : advancement_tables[color][square]. """
+    tables = get_tables(white_side, {'pawn': ADVANCEMENT_TABLE})
+    return {color: tables[color]['pawn'] for color in tables}
+
+
+# Tables orientées, calculées une fois pour chaque côté possible des blancs
+SQUARE_TABLES = {white_side: get_square_tables(white_side) for white_side in ["bottom", "top"]}
+ADVANCEMENT_TABLES = {white_side: get_advancement_tables(white_side) for white_side in ["bottom", "top"]}
@@ -0,0 +1,363 @@
+from .board import Board
+from .move import Move
+from .hash_key import HashKey
+from .bitboard import coords_to_square
+from copy import copy, deepcopy
+import time
+
+
+class Game:
+    """
+    Modèle d'une partie, sans interface graphique (utilisable par les IA, le serveur,
+    les tournois et les processus de calcul) :
+        - le plateau de jeu (board) et la clé de hachage de la position (hash_key)
+        - le tour du joueur qui a le trait (turn)
+        - la liste des déplacements valides (valid_moves)
+        - la fin de partie, avec les match nuls
+        - le temps restant de chaque joueur, si la partie est chronométrée
+    L'interface graphique (src/game.py) est construite au-dessus de cette classe.
+
+    Une partie est chronométrée si game_duration (en secondes) est donné ; sinon c'est une
+    simulation et les horloges ne sont pas mises à jour.
+    init_position() place les pièces de la configuration de départ.
+    Les simulations se font sur place : make_move() joue un déplacement et unmake_move()
+    remet le jeu exactement dans l'état précédent.
+    """
+
+    # Attributs sauvegardés par make_move() et restaurés par unmake_move()
+    UNDO_ATTRIBUTES = ['turn', '_valid_moves', 'winner', 'win', 'draw', 'is_finished',
+                       'no_move_repetition_counter', 'pieces_repetition_counter']
+    CLOCK_ATTRIBUTES = ['start_time', 'remaining_time', 'player1_remaining_time', 'player2_remaining_time']
+
+    def __init__(self, board_config, game_duration=None, increment=0):
+        self.board_config = board_config
+        self.is_timed = game_duration is not None
+        self.increment = increment
+
+        self._init_game_state()
+        self.board = Board(board_config, self.player_side)
+        self.hash_key = HashKey(self.board, self.turn, self.player_side)
+        self.hash_list = [self.hash_key.get_value()]
+        self.moves_played: list[Move] = []
+        self._valid_moves: list[Move] = None
+        self.undo_stack = []
+        self._init_equivalence_classes()
+
+        if self.is_timed:
+            self._init_clocks(game_duration)
+
+    def _init_game_state(self):
+        """ Initialise les attributs relatifs à l'état de la partie. """
+        self.player_side = "bottom"
+        self.turn = 'white'
+        self.has_start = False
+        self.winner = None
+        self.win = False
+        self.draw = False
+        self.is_finished = self.win or self.draw
+        self._init_draw_counters()
+
+    def _init_clocks(self, game_duration):
+        """ Initialise le temps de jeu de chaque joueur. """
+        self.start_time = time.time()
+        self.player1_remaining_time = self.player2_remaining_time = game_duration
+        self.remaining_time = game_duration
+        self.elapsed_time = 0
+
+    def _init_equivalence_classes(self):
+        """ Initialise les piles qui sont les classes d'équivalence de la congruence modulo 4. """
+         # Classes d'équivalences de représentants [0, 1, 2, 3]
+        self.eqc_0, self.eqc_1, self.eqc_2, self.eqc_4 = [], [], [], []
+        self.quotient_set = [self.eqc_0, self.eqc_1, self.eqc_2, self.eqc_4]
+
+    def _init_draw_counters(self):
+        """ Initialise les compteurs pour les istuations de nuls. """
+        self.no_move_repetition_counter = 0
+        self.pieces_repetition_counter  = 0
+
+    def init_position(self):
+        """ Place les pièces de la configuration de départ. """
+        self.board.init()
+        self.hash_key.generate()
+        self.hash_list = [self.hash_key.get_value()]
+        self.valid_moves = self.board.get_valid_moves(self.turn)
+
+    @property
+    def valid_moves(self) -> list[Move]:
+        """
+        Liste des déplacements valides du joueur courant.
+        Elle n'est calculée que lorsqu'on la demande puis conservée jusqu'au prochain tour,
+        de sorte qu'une position seulement évaluée par l'IA ne génère aucun déplacement.
+        """
+        if self._valid_moves is None:
+            self._valid_moves = self.board.get_valid_moves(self.turn)
+        return self._valid_moves
+
+    @valid_moves.setter
+    def valid_moves(self, valid_moves):
+        self._valid_moves = valid_moves
+
+    def iter_valid_moves(self):
+        """
+        Parcourt les déplacements valides du joueur courant. S'ils n'ont pas encore été calculés,
+        ils sont produits à la demande sans construire la liste complète.
+        """
+        if self._valid_moves is not None:
+            return iter(self._valid_moves)
+        return self.board.iter_valid_moves(self.turn)
+
+    def is_valid_move(self, move: Move):
+        """
+        Vérifie qu'un déplacement est valide pour le joueur courant. Si la liste n'a pas
+        encore été calculée, la vérification est faite sur le plateau sans la construire.
+        """
+        if self._valid_moves is not None:
+            return move in self._valid_moves
+        return self.board.is_valid_move(self.turn, move)
+
+    @staticmethod
+    def get_opposite_color(color):
+        """ Retourne la couleur de l'adversaire du joueur courant. """
+        if color == 'white':
+            return 'black'
+        return 'white'
+
+    def get_remaining_time(self):
+        """ Retourne le temps de jeu restant pour le joueur courant. """
+        if self.turn == 'white':
+            return self.player1_remaining_time
+        return self.player2_remaining_time
+
+    def get_increment(self):
+        """ Temps rajouté à chaque joueur à la fin de son tour. """
+        return self.increment
+
+    def update_remaining_time(self):
+        """ Décompte le temps écoulé depuis le début du tour du joueur courant. """
+        if self.has_start:
+            self.elapsed_time = time.time() - self.start_time
+            self.remaining_time = max(self.get_remaining_time() - self.elapsed_time, 0)
+
+    def get_move(self, initial, final) -> Move:
+        """ Recherche un move parmi la liste des déplacements valides. """
+        origin, destination = coords_to_square(*initial), coords_to_square(*final)
+        for move in self.valid_moves:
+            if move.origin == origin and move.destination == destination:
+                return move
+        return None
+
+    def change_turn(self):
+        """
+        Change le tour. Les déplacements valides du joueur auquel le tour
+        vient de passer seront calculés lorsqu'on en aura besoin.
+        Les horloges ne sont mises à jour que pour une partie chronométrée.
+        """
+        if self.is_timed:
+            if self.turn == 'white':
+                self.player1_remaining_time = self.remaining_time + self.get_increment()
+                self.remaining_time = self.player2_remaining_time
+            else:
+                self.player2_remaining_time = self.remaining_time + self.get_increment()
+                self.remaining_time = self.player1_remaining_time
+
+            self.start_time = time.time()
+        self.turn = self.get_opposite_color(self.turn)
+        self.valid_moves = None
+
+    def apply_move(self, move: Move):
+        """ 
+        Applique un déplacement. Cette méthode est indépendante
+        de l'interface graphique et également utilisée pour des simulations.
+        Retourne les informations du plateau nécessaires pour annuler le déplacement.
+        """
+        board_undo_info = self.board.make_move(move)
+        self.moves_played.append(move)
+        self.change_turn()
+
+        _, _, captured_pieces = board_undo_info
+        self.hash_key.update(move, self.turn, captured_pieces)
+        self.hash_list.append(self.hash_key.get_value())
+
+        self.update_game_state()
+        return board_undo_info
+
+    def _get_undo_attributes(self):
+        if self.is_timed:
+            return self.UNDO_ATTRIBUTES + self.CLOCK_ATTRIBUTES
+        return self.UNDO_ATTRIBUTES
+
+    def make_move(self, move: Move):
+        """
+        Joue un déplacement sur place en sauvegardant tout ce qu'il modifie
+        (état de la partie, compteurs de nuls, clé de hachage) afin que
+        unmake_move() puisse l'annuler. Utilisé par les IA à la place d'une copie du jeu.
+        """
+        saved_state = [getattr(self, attr_name) for attr_name in self._get_undo_attributes()]
+        saved_hash = (self.hash_key.value, self.hash_key.turn)
+        board_undo_info = self.apply_move(move)
+        self.undo_stack.append((move, board_undo_info, saved_state, saved_hash))
+
+    def unmake_move(self):
+        """ Annule le dernier déplacement joué avec make_move(). """
+        move, board_undo_info, saved_state, saved_hash = self.undo_stack.pop()
+
+        # draw_by_repetition() a rangé la dernière clé dans sa classe d'équivalence
+        self.quotient_set[(len(self.hash_list) - 1) % 4].pop()
+        self.hash_list.pop()
+        self.moves_played.pop()
+        self.hash_key.value, self.hash_key.turn = saved_hash
+
+        for attr_name, value in zip(self._get_undo_attributes(), saved_state):
+            setattr(self, attr_name, value)
+
+        self.board.unmake_move(move, board_undo_info)
+
+    def get_winner(self):
+        """ Renvoi le gagnant de la partie. """
+        can_play = self.board.has_valid_moves(self.turn)
+        if self.board.get_number_of_pieces('white') == 0 and self.board.get_number_of_pieces('black') > 0 \
+                or not can_play and self.turn == 'white':
+            self.winner = 'noir'
+        elif self.board.get_number_of_pieces('black') == 0 and self.board.get_number_of_pieces('white') > 0 \
+                or not can_play and self.turn == 'black':
+            self.winner = 'blanc'
+
+    def get_winner_by_time(self):
+        """ Si un joueur gagne au temps, renvoi ce joueur. """
+        if self.remaining_time == 0 and self.turn == 'white':
+            self.winner = 'noir'
+        elif self.remaining_time == 0 and self.turn == 'black':
+            self.winner = 'blanc'
+
+    def get_result(self):
+        """ Résultat de la partie : 'white', 'black', 'draw' ou None si elle n'est pas terminée. """
+        if self.winner is not None:
+            return 'white' if self.winner == 'blanc' else 'black'
+        return 'draw' if self.draw else None
+
+    def get_record(self):
+        """ Enregistrement de la partie (configuration, déplacements compactés, résultat), sérialisable en JSON. """
+        return {'config': self.board_config, 'moves': [move.encode() for move in self.moves_played], 'result': self.get_result()}
+
+    def check_win(self):
+        """ Vérifie s'il y a un gagnant. """
+        return self.winner is not None
+
+    def draw_by_repetition(self):
+        """ 
+        La fin de partie est considérée comme égale lorsque la même position se représente pour la troisième fois,
+        le même joueur ayant le trait.
+        On créé des piles, les classes d'équivalences de la congruence modulo 4.
+        On range chaque valeur de la liste contenant les valeurs des clés de hachage dans ces classes.
+        Si l'on a la même valeurs trois fois côte-à-côte dans la classe dans l'une des classes d'équivalences,
+        c'est match nul. 
+        """
+        equivalence_class = self.quotient_set[(len(self.hash_list) - 1)%4]
+        hash_key = self.hash_list[len(self.hash_list) - 1]
+        equivalence_class.append(hash_key)
+        if len(self.hash_list) >= 9 and len(equivalence_class) >= 3:
+            if equivalence_class[-1] == equivalence_class[-2] == equivalence_class[-3]:
+                return True
+        return False
+
+    def draw_by_queen_moves_repetition(self):
+        """
+        Si, durant 25 coups, il n'y a ni déplacement de pion ni prise, 
+        la fin de partie est considérée comme égale.
+        """
+        move = self.moves_played[-1]
+        if not(move.is_pawn_move() or move.is_capture()):
+            self.no_move_repetition_counter += 1
+            if self.no_move_repetition_counter >= 25:
+                return True
+        return False
+
+    def draw_by_material_and_repetition(self):
+        """
+        S'il n'y a plus que trois dames, deux dames et un pion, ou une dame et deux pions contre une dame, 
+        la fin de partie sera considérée comme égale lorsque les deux joueurs auront encore joué
+        chacun 16 coups au maximum.
+        """
+        if self.board.get_total_number_of_pieces() == 4:
+            player1, player2 = 'white', 'black'
+            player1_pieces = (self.board.get_number_of_pawns(player1), self.board.get_number_of_queens(player1))
+            player2_pieces = (self.board.get_number_of_pawns(player2), self.board.get_number_of_queens(player2))
+            cond1 = player1_pieces == (0, 3) and player2_pieces == (0, 1) \
+                        or player1_pieces == (0, 1) and player2_pieces == (0, 3)
+            cond2 = player1_pieces == (1, 2) and player2_pieces == (0, 1) \
+                        or player1_pieces == (0, 1) and player2_pieces == (1, 2)
+            cond3 = player1_pieces == (2, 1) and player2_pieces == (0, 1) \
+                        or player1_pieces == (0, 1) and player2_pieces == (2, 1)
+            if cond1 or cond2 or cond3:
+                self.pieces_repetition_counter += 1
+                if self.pieces_repetition_counter >= 16:
+                    return True
+        return False
+
+    def draw_by_material(self):
+        """
+        Pour autant qu'il n'y ait pas de phase de jeu en cours, 
+        la fin de partie de deux dames contre une dame, et a fortiori, de une dame contre une dame, 
+        sera considérée égale.
+        """
+        if self.board.get_total_number_of_pieces() <= 3:
+            player1, player2 = 'white', 'black'
+            player1_pieces = (self.board.get_number_of_pawns(player1), self.board.get_number_of_queens(player1))
+            player2_pieces = (self.board.get_number_of_pawns(player2), self.board.get_number_of_queens(player2))
+            cond1 = player1_pieces == (0, 2) and player2_pieces == (0, 1) \
+                        or player1_pieces == (0, 1) and player2_pieces == (0, 2)
+            cond2 = player1_pieces == player2_pieces == (0, 1)
+            if cond1 or cond2:
+                return True
+        return False
+
+    def check_draw(self):
+        """ Vérifie si l'issue de la partie doit être égale. """
+        if self.draw_by_repetition():
+            return "répétition"
+        elif self.draw_by_queen_moves_repetition():
+            return "jeu passif"
+        elif self.draw_by_material_and_repetition():
+            return "jeu passif / matériel insuffisant"
+        elif self.draw_by_material():
+            return "matériel insuffisant"
+        else:
+            return False
+
+    def update_game_state(self):
+        """ Met à jour l'état de la partie. """
+        self.get_winner()
+        self.draw = self.check_draw()
+        self.is_finished = self.winner is not None or self.draw
+
+    def start(self):
+        self.has_start = True
+        self.start_time = time.time()
+
+    def add_time(self, duration, player):
+        """ Ajoute du temps à l'horloge de l'un des joueurs. """
+        if player == 1:
+            self.player1_remaining_time += duration
+        else:
+            self.player2_remaining_time += duration
+
+    def copy(self):
+        """ Copie la partie, sans horloges (simulation) : c'est cette copie qui est envoyée à l'IA. """
+        # Liste des noms d'attributs à copier
+        attribute_names = ['board_config', 'player_side', 'turn', 'quotient_set', 'no_move_repetition_counter',
+                           'pieces_repetition_counter', 'has_start', 'winner', 'win', 'draw', 'is_finished']
+
+        game_copy = Game(self.board_config)
+        
+        # Copie des attributs simples
+        for attr_name in attribute_names:
+            setattr(game_copy, attr_name, copy(getattr(self, attr_name)))
+        
+        # Copie des attributs spéciaux
+        game_copy.board = self.board.copy()
+        game_copy.hash_key = self.hash_key.copy(game_copy.board)
+        game_copy.hash_list = deepcopy(self.hash_list)
+        game_copy.valid_moves = [move.copy() for move in self.valid_moves]
+        game_copy.moves_played = [move.copy() for move in self.moves_played]
+        
+        return game_copy
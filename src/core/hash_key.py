@@ -0,0 +1,88 @@
+from .board import Board
+from .piece import Piece
+from .move import Move
+from .bitboard import iter_squares, coords_to_square
+from .hash_values import *
+
+
+class HashKey:
+    """
+    Génère et actualise une clé de hachage de Zobrist (64 bits) unique à chaque position
+    et qui permet de détecter les match nuls en ne parcourant le plateau qu'une seule fois.
+    La clé est mise à jour de façon incrémentale à chaque déplacement (pièce déplacée,
+    pièces capturées, promotion et trait). En mode vérification (verify), chaque mise à jour
+    est comparée à un recalcul complet de la clé.
+    """
+    
+    def __init__(self, starting_board: Board, turn, white_side, verify=False):
+        self.board = starting_board
+        self.turn = turn
+        self.side = white_side
+        self.verify = verify
+        self.value = 0
+        self.generate()
+
+    def compute(self):
+        """ Calcule entièrement la clé de la position actuelle à partir des bitboards. """
+        bitboard = self.board.bitboard
+        value = TOP_SIDE if self.side == 'top' else 0
+        for color in ['white', 'black']:
+            for name, mask in [('pawn', bitboard.pawns[color]), ('queen', bitboard.queens[color])]:
+                keys = PIECE_KEYS[(color, name)]
+                for square in iter_squares(mask):
+                    value ^= keys[square]
+        if self.turn == 'black':
+            value ^= BLACK_TO_MOVE
+        return value
+
+    def generate(self):
+        """
+        Génère une clé de hachage unique pour représenter l'état du plateau de jeu.
+        """
+        self.value = self.compute()
+
+    def update(self, move: Move, player_turn, captured_pieces: list[Piece] = []):
+        """
+        Met à jour la valeur de la clé de hachage après un déplacement déjà appliqué au plateau.
+        player_turn est le joueur qui a désormais le trait et captured_pieces
+        les pièces retirées par le déplacement.
+        """
+        piece: Piece = self.board.get_piece(*move.get_final_pos())
+        initial_name = 'pawn' if move.is_pawn_move() else 'queen'
+        # Si la pièce a été promue, elle n'a pas le même type à l'arrivée qu'au départ
+        self.value ^= PIECE_KEYS[(piece.color, initial_name)][move.origin] \
+            ^ PIECE_KEYS[(piece.color, piece.name)][move.destination]
+
+        for captured_piece in captured_pieces:
+            self.value ^= PIECE_KEYS[(captured_piece.color, captured_piece.name)][
+                coords_to_square(captured_piece.row, captured_piece.col)]
+
+        if player_turn != self.turn:
+            self.value ^= BLACK_TO_MOVE
+            self.turn = player_turn
+
+        if self.verify:
+            self.check()
+
+    def check(self):
+        """ Compare la clé incrémentale avec un recalcul complet. """
+        expected_value = self.compute()
+        if self.value != expected_value:
+            raise RuntimeError(f"Clé de hachage incorrecte : {self.value} au lieu de {expected_value}.")
+
+    def set_verify(self, verify=True):
+        """ Active ou désactive la vérification de chaque mise à jour. """
+        self.verify = verify
+
+    def get_value(self):
+        """ Retourne la valeur de la clé de hachage. """
+        return self.value
+
+    def copy(self, board):
+        """ Copie une instance de la classe HashKey. """
+        hash_copy = HashKey(board, self.turn, self.side, self.verify)
+        hash_copy.value = self.value
+        return hash_copy
+
+    def __repr__(self):
+        return f"{self.value}"
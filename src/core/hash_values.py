@@ -0,0 +1,20 @@
+"""
+Clés de Zobrist : un nombre aléatoire de 64 bits pour chaque type de pièce sur chaque case,
+un pour le trait aux noirs et un pour la disposition où les blancs jouent en haut.
+La clé d'une position est le XOR des nombres correspondant à son contenu.
+La graine est fixe afin que les clés soient les mêmes d'une exécution à l'autre
+(et donc entre le client et le serveur).
+"""
+import random
+from .bitboard import SQUARES
+
+ZOBRIST_SEED = 20240101
+_generator = random.Random(ZOBRIST_SEED)
+
+PIECE_KEYS = {
+    (color, name): [_generator.getrandbits(64) for _ in range(SQUARES)]
+    for color in ['white', 'black']
+    for name in ['pawn', 'queen']
+}
+BLACK_TO_MOVE = _generator.getrandbits(64)
+TOP_SIDE = _generator.getrandbits(64)
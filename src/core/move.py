@@ -0,0 +1,101 @@
+from .bitboard import coords_to_square, square_to_coords, mask_to_coords, count_bits
+
+# Disposition des champs d'un déplacement compacté en entier (voir Move.encode)
+ORIGIN_BITS = 6
+DESTINATION_SHIFT = 6
+PAWN_SHIFT = 12
+CAPTURED_SHIFT = 13
+SQUARE_MASK = (1 << ORIGIN_BITS) - 1
+
+
+class Move:
+    """
+    Un 'Move' ou déplacement, ou bien encore mouvement,
+    possède une case de départ, une case d'arrivée et l'ensemble des cases
+    qui on été sautées par le déplacement de la case de départ à la case d'arrivée.
+    Pour rester léger, un déplacement ne contient que des numéros de cases (voir bitboard.py) :
+    origin, destination, le masque 'captured' des pièces sautées et un booléen 'is_pawn'
+    qui indique si la pièce déplacée est un pion. Il peut être compacté en un seul entier
+    avec encode() et reconstruit avec decode().
+    Les coordonnées (row, col) utilisées par l'interface graphique sont calculées à la demande.
+    """
+
+    __slots__ = ('origin', 'destination', 'captured', 'is_pawn')
+
+    def __init__(self, origin, destination, captured=0, is_pawn=True):
+        self.origin = origin
+        self.destination = destination
+        self.captured = captured
+        self.is_pawn = is_pawn
+
+    @classmethod
+    def from_coords(cls, initial_pos, final_pos, skipped_list=[], is_pawn=True):
+        """ Créé un déplacement à partir de coordonnées (row, col). """
+        captured = 0
+        for row, col in skipped_list:
+            captured |= 1 << coords_to_square(row, col)
+        return cls(coords_to_square(*initial_pos), coords_to_square(*final_pos), captured, is_pawn)
+
+    @property
+    def initial_pos(self):
+        return square_to_coords(self.origin)
+
+    @property
+    def final_pos(self):
+        return square_to_coords(self.destination)
+
+    def get_initial_pos(self):
+        return self.initial_pos
+    
+    def get_final_pos(self):
+        return self.final_pos
+    
+    def is_empty_skipped_list(self):
+        """ Vérifie si la liste des pièces capturées est vide. """
+        return self.captured == 0
+
+    def get_skipped_list(self):
+        """ Retourne les coordonnées des pièces capturées. """
+        return mask_to_coords(self.captured)
+
+    def get_number_of_captures(self):
+        return count_bits(self.captured)
+    
+    def is_capture(self):
+        """ Vérifie si un déplacement est une capture. """
+        return self.captured != 0
+    
+    def is_pawn_move(self):
+        """ Vérifie si un pion est déplacé. """
+        return self.is_pawn
+
+    def encode(self):
+        """ Compacte le déplacement en un entier (cases, type de pièce et masque des prises). """
+        return self.origin | self.destination << DESTINATION_SHIFT \
+            | int(self.is_pawn) << PAWN_SHIFT | self.captured << CAPTURED_SHIFT
+
+    @classmethod
+    def decode(cls, code):
+        """ Reconstruit un déplacement compacté par encode(). """
+        return cls(code & SQUARE_MASK, code >> DESTINATION_SHIFT & SQUARE_MASK,
+                   code >> CAPTURED_SHIFT, bool(code >> PAWN_SHIFT & 1))
+
+    def copy(self):
+        """ Copie une instance de la classe Move. """
+        return Move(self.origin, self.destination, self.captured, self.is_pawn)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Deux rafles d'une dame peuvent avoir les mêmes cases de départ et d'arrivée
+        mais prendre des pièces différentes : on compare donc aussi les prises.
+        La recherche d'un déplacement par ses seules cases se fait avec Game.get_move.
+        """
+        if isinstance(other, Move):
+            return self.encode() == other.encode()
+        return False
+
+    def __hash__(self):
+        return hash(self.encode())
+
+    def __repr__(self):
+        return f"[{self.initial_pos}, {self.final_pos}]"
@@ -0,0 +1,136 @@
+from .board import Board
+from .move import Move
+import argparse
+import time
+
+
+class Perft:
+    """
+    Perft (performance test) : compte les feuilles de l'arbre des déplacements valides
+    jusqu'à une profondeur donnée à partir d'une position, sans tenir compte des règles
+    de match nul. Sert à vérifier le générateur de déplacements (en comparant les totaux
+    avec ceux du générateur de référence) et à mesurer sa vitesse en noeuds par seconde.
+        - board: plateau de départ (il est modifié puis restauré par make_move / unmake_move)
+        - color: couleur du joueur qui a le trait
+        - use_hash: mémorise le nombre de feuilles de chaque position déjà rencontrée
+        - reference: utilise le générateur de référence qui parcourt la matrice
+    """
+
+    def __init__(self, board: Board, color, use_hash=False, reference=False):
+        self.board = board
+        self.color = color
+        self.use_hash = use_hash
+        self.reference = reference
+        self.hash_table = {}
+        self.hash_hits = 0
+
+    @staticmethod
+    def from_config(board_config, player_side="bottom"):
+        """ Créé le plateau correspondant à la configuration numéro 'board_config'. """
+        board = Board(board_config, player_side)
+        board.init()
+        return board
+
+    @staticmethod
+    def get_opposite_color(color):
+        return 'black' if color == 'white' else 'white'
+
+    def get_moves(self, color) -> list[Move]:
+        if self.reference:
+            return self.board.get_matrix_valid_moves(color)
+        return self.board.get_valid_moves(color)
+
+    def count(self, depth, color=None):
+        """ Nombre de feuilles de l'arbre de profondeur 'depth'. """
+        color = self.color if color is None else color
+        if depth == 0:
+            return 1
+
+        if self.use_hash:
+            key = (self.board.bitboard.get_key(), color, depth)
+            if key in self.hash_table:
+                self.hash_hits += 1
+                return self.hash_table[key]
+
+        moves = self.get_moves(color)
+        if depth == 1:
+            nodes = len(moves)
+        else:
+            nodes = 0
+            opposite_color = self.get_opposite_color(color)
+            for move in moves:
+                undo_info = self.board.make_move(move)
+                nodes += self.count(depth - 1, opposite_color)
+                self.board.unmake_move(move, undo_info)
+
+        if self.use_hash:
+            self.hash_table[key] = nodes
+        return nodes
+
+    def divide(self, depth):
+        """ Nombre de feuilles sous chacun des déplacements de la position de départ. """
+        results = []
+        opposite_color = self.get_opposite_color(self.color)
+        for move in self.get_moves(self.color):
+            undo_info = self.board.make_move(move)
+            results.append((move, self.count(depth - 1, opposite_color)))
+            self.board.unmake_move(move, undo_info)
+        return results
+
+    def run(self, depth, divide=False):
+        """ Lance perft (ou divide) pour chaque profondeur jusqu'à 'depth' et affiche les résultats. """
+        for current_depth in range(1, depth + 1):
+            self.hash_table.clear()
+            self.hash_hits = 0
+            start_time = time.perf_counter()
+            if divide and current_depth == depth:
+                results = self.divide(current_depth)
+                nodes = sum(move_nodes for _, move_nodes in results)
+            else:
+                results = []
+                nodes = self.count(current_depth)
+            elapsed_time = time.perf_counter() - start_time
+
+            for move, move_nodes in results:
+                print(f"{move}: {move_nodes}")
+            nodes_per_second = nodes / elapsed_time if elapsed_time > 0 else float('inf')
+            hash_infos = f" ({self.hash_hits} hash hits)" if self.use_hash else ""
+            print(f"perft({current_depth}) = {nodes} in {round(elapsed_time, 3)}s, "
+                  f"{round(nodes_per_second)} nodes/s{hash_infos}")
+        return nodes
+
+    def compare(self, depth):
+        """
+        Compare, déplacement par déplacement, les résultats de divide avec le générateur
+        de référence et affiche les différences. Retourne True si tout correspond.
+        """
+        reference = Perft(self.board, self.color, reference=True)
+        expected = {move.encode(): move_nodes for move, move_nodes in reference.divide(depth)}
+        found = {move.encode(): move_nodes for move, move_nodes in self.divide(depth)}
+
+        is_identical = True
+        for code in sorted(set(expected) | set(found)):
+            if expected.get(code) != found.get(code):
+                is_identical = False
+                print(f"{Move.decode(code)}: {found.get(code)} (référence : {expected.get(code)})")
+        print(f"perft({depth}) : {'identique' if is_identical else 'différent'} au générateur de référence.")
+        return is_identical
+
+
+def main():
+    """ Point d'entrée en ligne de commande (main_perft.py). """
+    parser = argparse.ArgumentParser(description="Perft du générateur de déplacements.")
+    parser.add_argument("depth", type=int, help="profondeur maximale")
+    parser.add_argument("--config", type=int, default=1, help="numéro de la configuration du plateau")
+    parser.add_argument("--color", default="white", choices=["white", "black"], help="joueur qui a le trait")
+    parser.add_argument("--divide", action="store_true", help="détail par déplacement à la profondeur maximale")
+    parser.add_argument("--hash", action="store_true", help="mémorise les positions déjà comptées")
+    parser.add_argument("--reference", action="store_true", help="utilise le générateur de référence")
+    parser.add_argument("--compare", action="store_true", help="compare avec le générateur de référence")
+    args = parser.parse_args()
+
+    perft = Perft(Perft.from_config(args.config), args.color, args.hash, args.reference)
+    if args.compare:
+        perft.compare(args.depth)
+    else:
+        perft.run(args.depth, args.divide)
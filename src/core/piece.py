@@ -7,26 +7,22 @@ class Piece:
     un attribut 'name' qui permet de savoir si la pièce est une dame,
     un attribut side: selon si les blancs sont en haut ou en bas, la ligne pour aller en dame
         n'est pas la même
+    L'image de la pièce n'est pas stockée dans la pièce : elle est fournie par le cache
+    partagé 'sprite_cache' (src/sprites.py) au moment de l'affichage.
     """
     
-    def __init__(self, row, col, color, name='pawn', side="bottom", copy=False):
+    def __init__(self, row, col, color, name='pawn', side="bottom"):
         self.row = row
         self.col = col
         self.color = color
         self.name = name
         self.side = side
-        if not copy:
-            self.set_sprite()
 
         if self.color == 'white':
             self.direction, self.last_row = (-1, 0) if side == "bottom" else (1, ROWS - 1)
         else:
              self.direction, self.last_row = (1, ROWS - 1) if side == "bottom" else (-1, 0)
 
-    def set_sprite(self):
-        """ Load l'image correspondant à la pièce. """
-        self.sprite = pygame.image.load(f'assets/{self.color}_{self.name}.png')
-
     def is_queen(self):
         return self.name == 'queen'
     
@@ -36,12 +32,20 @@ class Piece:
     def make_queen(self):
         """ Tranforme une pièce en dame. """
         self.name = 'queen'
-        self.set_sprite()
+
+    def make_pawn(self):
+        """ Transforme une dame en pion (annulation d'une promotion). """
+        self.name = 'pawn'
 
     def check_promotion(self):
-        """ Vérifie si une pièce doit devenir une dame. Si oui, elle est transformée. """
+        """
+        Vérifie si une pièce doit devenir une dame. Si oui, elle est transformée.
+        Retourne True si la pièce vient d'être promue.
+        """
         if self.row == self.last_row and not(self.is_queen()):
             self.make_queen()
+            return True
+        return False
 
     def update_pos(self, row, col):
         """" 
@@ -50,15 +54,10 @@ class Piece:
         self.row = row
         self.col = col
 
-    def draw_piece(self, window, x, y, square_size):
-        """ Dessine une pièce qui est soit une dame, soit un pion normal """
-        piece_to_draw = pygame.transform.scale(self.sprite, (0.80 * square_size, 0.80 * square_size))
-        window.blit(piece_to_draw, (x - piece_to_draw.get_width()//2, y - piece_to_draw.get_height()//2))
-
     def copy(self):
         """ Copy une instance de la classe Piece. """
         piece_copy = Piece(self.row, self.col, self.color, 
-            self.name, self.side, True)
+            self.name, self.side)
         return piece_copy
 
     def __eq__(self, other):
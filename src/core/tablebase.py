@@ -0,0 +1,332 @@
+"""
+Tables de finales (endgame tablebases).
+
+Génération par analyse rétrograde de toutes les positions comptant au plus N pièces,
+pour les deux joueurs au trait, et consultation par mmap sans charger le fichier en mémoire.
+
+Une position est rangée par sa signature matérielle (pions blancs, dames blanches,
+pions noirs, dames noires) puis par un index : chaque groupe de pièces identiques est
+numéroté par le rang colexicographique de l'ensemble de ses cases parmi les 50,
+les rangs des quatre groupes et le trait formant un nombre en base mixte.
+Les index de positions impossibles (pièces superposées, pion sur sa ligne de promotion)
+sont conservés pour que le calcul de l'index reste direct ; ils valent INVALID.
+
+Chaque position occupe un octet : les 2 bits de poids faible donnent le résultat pour le
+joueur au trait (DRAW, WIN ou LOSS), les 6 autres le nombre de demi-coups avant la fin
+(plafonné à MAX_DISTANCE) : le plus court pour un gain, le plus long pour une perte.
+
+Format du fichier :
+    en-tête   : MAGIC, nombre de pièces maximal, nombre de signatures (struct HEADER)
+    index     : pour chaque signature, les 4 effectifs, la position et la taille des données (struct ENTRY)
+    données   : un octet par index de position
+
+Les tables sont construites pour des blancs qui jouent en bas du plateau ; pour l'autre
+orientation, la consultation retourne le plateau (case s -> case 49 - s).
+La règle de nullité de Game.draw_by_material (une dame contre une ou deux dames) s'applique
+dès que la position est atteinte. Les règles de nullité qui dépendent du nombre de coups
+joués (25 coups de dames, 16 coups à 4 pièces) ne sont pas prises en compte.
+"""
+from .bitboard import BitBoard, SQUARES, FULL_MASK, iter_squares, count_bits
+from .constants import DATA_PATH
+from itertools import combinations
+import argparse
+import struct
+import mmap
+import time
+import os
+
+INVALID, DRAW, WIN, LOSS = range(4)
+RESULT_NAMES = {DRAW: 'draw', WIN: 'win', LOSS: 'loss'}
+MAX_DISTANCE = 63
+UNKNOWN = INVALID # pendant la génération : position légale pas encore résolue
+
+MAGIC = b'DTB1'
+HEADER = struct.Struct('<4sII')
+ENTRY = struct.Struct('<4BQQ')
+DEFAULT_PATH = os.path.join(DATA_PATH, 'endgame.tb')
+
+COLORS = ['white', 'black']
+BINOMIALS = [[0] * (SQUARES + 1) for _ in range(SQUARES + 1)]
+for n in range(SQUARES + 1):
+    BINOMIALS[n][0] = 1
+    for k in range(1, n + 1):
+        BINOMIALS[n][k] = BINOMIALS[n - 1][k - 1] + BINOMIALS[n - 1][k]
+
+
+def rank_mask(mask):
+    """ Rang colexicographique de l'ensemble des cases du masque parmi les ensembles de même taille. """
+    rank = 0
+    for index, square in enumerate(iter_squares(mask)):
+        rank += BINOMIALS[square][index + 1]
+    return rank
+
+
+def mirror_mask(mask):
+    """ Retourne le plateau d'un demi-tour : la case s devient la case 49 - s. """
+    return int(format(mask, f'0{SQUARES}b')[::-1], 2)
+
+
+def get_signature(key):
+    """ Signature matérielle d'une position donnée par BitBoard.get_key(). """
+    white_pawns, black_pawns, white_queens, black_queens = key
+    return count_bits(white_pawns), count_bits(white_queens), count_bits(black_pawns), count_bits(black_queens)
+
+
+def get_table_size(signature):
+    size = 2
+    for count in signature:
+        size *= BINOMIALS[SQUARES][count]
+    return size
+
+
+def get_index(signature, key, color):
+    """ Index de la position dans la table de sa signature. """
+    white_pawns, black_pawns, white_queens, black_queens = key
+    index = 0
+    for mask, count in zip((white_pawns, white_queens, black_pawns, black_queens), signature):
+        index = index * BINOMIALS[SQUARES][count] + rank_mask(mask)
+    return index * 2 + (color == 'black')
+
+
+def is_rule_draw(signature):
+    """ Game.draw_by_material : une dame contre une dame, deux dames contre une dame. """
+    white_pawns, white_queens, black_pawns, black_queens = signature
+    if white_pawns or black_pawns:
+        return False
+    return sorted((white_queens, black_queens)) in ([1, 1], [1, 2])
+
+
+def get_signatures(max_pieces):
+    """
+    Signatures d'au plus max_pieces pièces, chaque joueur en ayant au moins une, dans l'ordre
+    de résolution : une prise mène à moins de pièces, une promotion à moins de pions.
+    """
+    signatures = []
+    for total in range(2, max_pieces + 1):
+        for white_pawns in range(total):
+            for white_queens in range(total - white_pawns):
+                for black_pawns in range(total - white_pawns - white_queens + 1):
+                    black_queens = total - white_pawns - white_queens - black_pawns
+                    if white_pawns + white_queens and black_pawns + black_queens:
+                        signatures.append((white_pawns, white_queens, black_pawns, black_queens))
+    return sorted(signatures, key=lambda signature: (sum(signature), signature[0] + signature[2]))
+
+
+def encode(result, distance):
+    return result | min(distance, MAX_DISTANCE) << 2
+
+
+def decode(value):
+    """ Retourne (résultat, distance) ou None pour une position impossible. """
+    if value & 0b11 == INVALID:
+        return None
+    return value & 0b11, value >> 2
+
+
+class TablebaseGenerator:
+    """
+    Analyse rétrograde par itérations successives, signature par signature.
+    Pour chaque position légale, on calcule une fois pour toutes la liste de ses positions filles.
+    Une fille de même signature est désignée par son index ; une fille d'une autre signature
+    (après une prise ou une promotion) est déjà résolue et remplacée par son résultat.
+    Ensuite, distance par distance : une position dont une fille est perdante (pour l'adversaire
+    au trait) est gagnante, une position dont toutes les filles sont gagnantes est perdante.
+    Les positions encore inconnues quand plus rien ne change sont nulles.
+    """
+
+    def __init__(self, max_pieces):
+        import numpy as np
+        self.np = np
+        self.max_pieces = max_pieces
+        self.bitboard = BitBoard("bottom")
+        self.tables = {}
+
+    def generate(self, path=DEFAULT_PATH):
+        for signature in get_signatures(self.max_pieces):
+            start_time = time.time()
+            self.tables[signature] = self.solve(signature)
+            values = self.tables[signature]
+            counts = {name: int((values & 0b11 == result).sum()) for result, name in RESULT_NAMES.items()}
+            print(f"[TABLEBASE] {signature} solved in {round(time.time() - start_time, 2)}s: {counts}")
+        self.write(path)
+
+    def iter_positions(self, signature):
+        """ Parcourt les positions légales de la signature : (index, key, color). """
+        white_pawns, white_queens, black_pawns, black_queens = signature
+        white_promotion, black_promotion = self.bitboard.promotion_rows['white'], self.bitboard.promotion_rows['black']
+        for white_pawn_squares in combinations(range(SQUARES), white_pawns):
+            white_pawn_mask = sum(1 << square for square in white_pawn_squares)
+            if white_pawn_mask & white_promotion:
+                continue
+            for white_queen_squares in combinations(range(SQUARES), white_queens):
+                white_queen_mask = sum(1 << square for square in white_queen_squares)
+                if white_queen_mask & white_pawn_mask:
+                    continue
+                white_mask = white_pawn_mask | white_queen_mask
+                for black_pawn_squares in combinations(range(SQUARES), black_pawns):
+                    black_pawn_mask = sum(1 << square for square in black_pawn_squares)
+                    if black_pawn_mask & (white_mask | black_promotion):
+                        continue
+                    for black_queen_squares in combinations(range(SQUARES), black_queens):
+                        black_queen_mask = sum(1 << square for square in black_queen_squares)
+                        if black_queen_mask & (white_mask | black_pawn_mask):
+                            continue
+                        key = (white_pawn_mask, black_pawn_mask, white_queen_mask, black_queen_mask)
+                        for color in COLORS:
+                            yield get_index(signature, key, color), key, color
+
+    def get_children(self, key, color):
+        """ Positions (key, trait) atteintes par chaque déplacement valide de 'color'. """
+        bitboard = self.bitboard
+        white_pawns, black_pawns, white_queens, black_queens = key
+        bitboard.pawns = {'white': white_pawns, 'black': black_pawns}
+        bitboard.queens = {'white': white_queens, 'black': black_queens}
+        bitboard.empty = FULL_MASK & ~(white_pawns | black_pawns | white_queens | black_queens)
+        opponent = BitBoard.get_opposite_color(color)
+
+        children = []
+        for origin, destination, captured in bitboard.get_valid_moves(color):
+            pawns, queens = dict(bitboard.pawns), dict(bitboard.queens)
+            pawns[opponent] &= ~captured
+            queens[opponent] &= ~captured
+            if queens[color] >> origin & 1:
+                queens[color] ^= 1 << origin | 1 << destination
+            else:
+                pawns[color] ^= 1 << origin
+                if bitboard.promotion_rows[color] >> destination & 1:
+                    queens[color] |= 1 << destination
+                else:
+                    pawns[color] |= 1 << destination
+            children.append(((pawns['white'], pawns['black'], queens['white'], queens['black']), opponent))
+        return children
+
+    def lookup(self, key, color):
+        """ Valeur (octet) d'une position d'une signature déjà résolue. """
+        signature = get_signature(key)
+        pieces = sum(signature[:2]) if color == 'white' else sum(signature[2:])
+        if not pieces:
+            # Le joueur au trait n'a plus de pièce : il a perdu
+            return encode(LOSS, 0)
+        return int(self.tables[signature][get_index(signature, key, color)])
+
+    def solve(self, signature):
+        np = self.np
+        size = get_table_size(signature)
+        values = np.zeros(size, dtype=np.uint8)
+
+        if is_rule_draw(signature):
+            for index, _, _ in self.iter_positions(signature):
+                values[index] = encode(DRAW, 0)
+            return values
+
+        # Filles : index internes, les valeurs déjà connues sont ajoutées à la fin du tableau
+        constants = {}
+        positions, pointers, child_indexes = [], [], []
+        for index, key, color in self.iter_positions(signature):
+            children = self.get_children(key, color)
+            if not children:
+                values[index] = encode(LOSS, 0)
+                continue
+            positions.append(index)
+            pointers.append(len(child_indexes))
+            for child_key, child_color in children:
+                if get_signature(child_key) == signature:
+                    child_indexes.append(get_index(signature, child_key, child_color))
+                else:
+                    value = self.lookup(child_key, child_color)
+                    if value not in constants:
+                        constants[value] = size + len(constants)
+                    child_indexes.append(constants[value])
+
+        unresolved = np.array(positions, dtype=np.int64)
+        if len(unresolved) == 0:
+            return values
+        pointers = np.array(pointers, dtype=np.int64)
+        child_indexes = np.array(child_indexes, dtype=np.int64)
+        child_counts = np.diff(np.append(pointers, len(child_indexes)))
+        extended = np.concatenate([values, np.array(list(constants), dtype=np.uint8)])
+        max_constant_distance = max((value >> 2 for value in constants), default=0)
+
+        # Niveau par niveau : au niveau 'distance', seules les filles résolues à une distance
+        # inférieure comptent, ce qui donne la distance minimale d'un gain et maximale d'une perte.
+        distance = 1
+        while True:
+            child_values = extended[child_indexes]
+            child_results, child_distances = child_values & 0b11, child_values >> 2
+            is_known = child_distances < distance
+            any_loss = np.add.reduceat((child_results == LOSS) & is_known, pointers) > 0
+            all_win = np.add.reduceat((child_results == WIN) & is_known, pointers) == child_counts
+            unknown = extended[unresolved] & 0b11 == UNKNOWN
+            new_wins, new_losses = any_loss & unknown, all_win & unknown & ~any_loss
+            if not new_wins.any() and not new_losses.any() and distance > max_constant_distance:
+                break
+            extended[unresolved[new_wins]] = encode(WIN, distance)
+            extended[unresolved[new_losses]] = encode(LOSS, distance)
+            distance += 1
+
+        values = extended[:size]
+        values[unresolved[values[unresolved] & 0b11 == UNKNOWN]] = encode(DRAW, 0)
+        return values
+
+    def write(self, path):
+        """ Écrit l'en-tête, l'index puis les données de toutes les signatures. """
+        signatures = list(self.tables)
+        offset = HEADER.size + ENTRY.size * len(signatures)
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, self.max_pieces, len(signatures)))
+            for signature in signatures:
+                f.write(ENTRY.pack(*signature, offset, len(self.tables[signature])))
+                offset += len(self.tables[signature])
+            for signature in signatures:
+                f.write(self.tables[signature].tobytes())
+        print(f"[TABLEBASE] {len(signatures)} tables written to {path} ({offset} bytes)")
+
+
+class Tablebase:
+    """
+    Consultation des tables : le fichier est projeté en mémoire (mmap) et seul son index
+    est lu à l'ouverture ; chaque consultation lit un octet.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.max_pieces, number_of_signatures = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} n'est pas un fichier de tables de finales.")
+        self.offsets = {}
+        for position in range(HEADER.size, HEADER.size + ENTRY.size * number_of_signatures, ENTRY.size):
+            *signature, offset, _ = ENTRY.unpack_from(self.data, position)
+            self.offsets[tuple(signature)] = offset
+
+    def probe(self, bitboard: BitBoard, color):
+        """
+        Résultat exact de la position pour le joueur au trait 'color' :
+        (WIN, LOSS ou DRAW, distance) ou None si la position n'est pas dans les tables.
+        """
+        key = bitboard.get_key()
+        if bitboard.white_side != "bottom":
+            key = tuple(mirror_mask(mask) for mask in key)
+        signature = get_signature(key)
+        offset = self.offsets.get(signature)
+        if offset is None:
+            return None
+        return decode(self.data[offset + get_index(signature, key, color)])
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __repr__(self):
+        return f"Tablebase [{self.path}; {len(self.offsets)} signatures; up to {self.max_pieces} pieces]"
+
+
+def main():
+    """ Point d'entrée en ligne de commande (main_tablebase.py). """
+    parser = argparse.ArgumentParser(description="Génère les tables de finales par analyse rétrograde.")
+    parser.add_argument("pieces", type=int, help="nombre maximal de pièces")
+    parser.add_argument("--output", default=DEFAULT_PATH, help="fichier à écrire")
+    args = parser.parse_args()
+
+    TablebaseGenerator(args.pieces).generate(args.output)
@@ -1,6 +1,7 @@
 from .constants import *
 from .config import Config
-from .piece import Piece
+from .core.piece import Piece
+from .sprites import sprite_cache
 
 class Dragger:
     """
@@ -28,7 +29,7 @@ class Dragger:
 
     def update_blit(self, window):
         """ Dessine la pièce à l'endroit où se trouve le curseur de la souris. """
-        self.piece.draw_piece(window, self.mouseX , self.mouseY, self.config.window.square_size)
+        sprite_cache.draw_piece(window, self.piece, self.mouseX , self.mouseY, self.config.window.square_size)
 
     def update_mouse(self, mouse_pos):
         """ 
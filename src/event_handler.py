@@ -1,5 +1,5 @@
 import pygame
-from src.board import Board
+from src.core.board import Board
 from src.dragger import Dragger
 from src.game import Game
 from src.config import Config
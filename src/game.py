@@ -1,78 +1,39 @@
 import pygame
-from .board import Board
+from .core.game import Game as CoreGame
+from .core.piece import Piece
 from .config import Config
 from .dragger import Dragger
 from .theme import Theme
 from .button import Button
 from .clock import Clock
-from .move import Move
-from .piece import Piece
-from .hash_key import HashKey
+from .sprites import sprite_cache
 from .constants import *
-from copy import copy, deepcopy
-import sys, time
+import sys
 
 
-class Game:
+class Game(CoreGame):
     """
-    Initialise tout ce qui est relatif au jeu (graphique ou non):
-        - la fenêtre
+    Partie affichée, construite au-dessus du modèle de jeu (src/core/game.py) qui gère
+    les règles, l'état de la partie, les match nuls et le temps de jeu. Ajoute :
+        - la fenêtre et les pendules
         - La pièce sélectionnée par le joueur courant (selected_piece)
         - Le carré qui est survolé par la souris (hovered_square_pos)
-        - le plateau de jeu (board)
         - le dragger (dragger)
-        - le tour du joueur qui commence (turn)
-        - la liste des déplacements valides (valid_moves)
         ...
-    Gère l'affichage, les déplacements, la fin de partie avec les match nuls.
-
-    La méthode __init__() est le constructeur de la classe.
-    _init() est la méthode privée qui initialise les attributs indispensables.
-    init() est une méthode public qui est appelée si l'on a besoin d'un affichage.
-    C'est-à-dire qu'elle est inutile si l'on eest en train d'effectuer une copie du jeu pour simuler
-    des déplacements pour l'IA.
+    Gère l'affichage et la fin de partie.
+    Les copies envoyées à l'IA (copy()) sont des instances du modèle, sans interface graphique.
     """
-    
-    def __init__(self, game_config: Config, board_config, copy=False):
-        self.is_copy = copy
-        self.board_config = board_config
-        self._init(game_config, board_config)
-        
-        if not copy:
-            self.init()
 
-    def _init(self, game_config: Config, board_config):
-        """ Initialise les attributs principaux. """
+    def __init__(self, game_config: Config, board_config):
         self.game_config = game_config
         self.selected_piece: Piece = None
         self.hovered_square_pos = None
-
-        self._init_game_state()
-        self.board = Board(board_config, self.player_side)
         self.dragger = Dragger(game_config)
-        self.hash_key = HashKey(self.board, self.turn, self.player_side)
-        self.hash_list = [self.hash_key.get_value()]
-        self.moves_played: list[Move] = []
-        self._init_equivalence_classes()
-
-    def _init_game_state(self):
-        """ Initialise les attributs relatifs à l'état de la partie. """
-        self.player_side = "bottom"
-        self.turn = 'white'
-        self.has_start = False
-        self.winner = None
-        self.win = False
-        self.draw = False
-        self.is_finished = self.win or self.draw
-        self._init_draw_counters()
-
-    def _init_clocks(self):
-        """ Initialise les horloges de jeu. """
-        self.start_time = time.time()
-        self.player1_remaining_time = self.player2_remaining_time = self.game_config.game_duration
-        self.remaining_time = self.game_config.game_duration
-        self.elapsed_time = 0
+        super().__init__(board_config, game_config.game_duration, game_config.increment)
+        self.init()
 
+    def _init_clock_widgets(self):
+        """ Initialise les pendules affichées. """
         self.clock1 = Clock(self.game_config, self.screen, 'white', self.game_config.game_duration, self.player_side)
         self.clock2 =  Clock(self.game_config, self.screen, 'black', self.game_config.game_duration, self.player_side)
 
@@ -81,40 +42,17 @@ class Game:
         self.screen = pygame.display.set_mode([self.game_config.window.screen_width, self.game_config.window.screen_height], pygame.SRCALPHA)
         self.board_window = pygame.Surface([self.game_config.window.board_width, self.game_config.window.board_height], pygame.SRCALPHA)
 
-    def _init_equivalence_classes(self):
-        """ Initialise les piles qui sont les classes d'équivalence de la congruence modulo 4. """
-         # Classes d'équivalences de représentants [0, 1, 2, 3]
-        self.eqc_0, self.eqc_1, self.eqc_2, self.eqc_4 = [], [], [], []
-        self.quotient_set = [self.eqc_0, self.eqc_1, self.eqc_2, self.eqc_4]
-
-    def _init_draw_counters(self):
-        """ Initialise les compteurs pour les istuations de nuls. """
-        self.no_move_repetition_counter = 0
-        self.pieces_repetition_counter  = 0
-
     def init(self):
         """" 
-        Initialise la partie principale.
-        cette méthode n'est appelée que si nécessaire.
-        Elle est là pour optimiser la créations des copies nécessaires pour l'IA.
+        Initialise la partie principale : fenêtre, pendules et position de départ.
         """
         self._init_windows()
-        self._init_clocks()
-        self.board.init()
-        self.valid_moves = self.board.get_valid_moves(self.turn)
+        self._init_clock_widgets()
+        self.init_position()
 
-    @staticmethod
-    def get_opposite_color(color):
-        """ Retourne la couleur de l'adversaire du joueur courant. """
-        if color == 'white':
-            return 'black'
-        return 'white'
-
-    def get_remaining_time(self):
-        """ Retourne le temps de jeu restant pour le joueur courant. """
-        if self.turn == 'white':
-            return self.player1_remaining_time
-        return self.player2_remaining_time
+    def get_increment(self):
+        """ Le bonus de temps peut être modifié en cours de partie (commande set_incr). """
+        return self.game_config.increment
 
     def select_piece(self, piece):
         self.selected_piece = piece
@@ -122,13 +60,6 @@ class Game:
     def unselect_piece(self):
         self.selected_piece = None
 
-    def get_move(self, initial, final) -> Move:
-        """ Recherche un move parmi la liste des déplacements valides. """
-        for move in self.valid_moves:
-            if move.initial_pos == initial and move.final_pos == final:
-                return move
-        return None
-
     def set_hover(self, row, col):
         """ Définit la case de coordonnées (row, col) comme étant survolée par la souris. """
         self.hovered_square_pos = (row, col)
@@ -191,7 +122,7 @@ class Game:
         if piece != 0 and piece is not self.dragger.piece:
             x, y = (square_size * piece.col + square_size // 2, 
                         square_size * piece.row + square_size // 2)
-            piece.draw_piece(window, x, y, square_size)
+            sprite_cache.draw_piece(window, piece, x, y, square_size)
 
     def draw_pieces(self, window):
         """ Dessine les pièces du plateau. """
@@ -213,42 +144,10 @@ class Game:
         self.draw_pieces(window)
     
     def change_turn(self):
-        """
-        Change le tour et calcul les déplacements valides
-        du joueur auquel le tour vient de passer.
-        """
-        if not self.is_copy:
-            if self.turn == 'white':
-                self.player1_remaining_time = self.remaining_time + self.game_config.increment
-                self.remaining_time = self.player2_remaining_time
-                self.turn = 'black'
-            else:
-                self.player2_remaining_time = self.remaining_time + self.game_config.increment
-                self.remaining_time = self.player1_remaining_time
-                self.turn = 'white'
-
-            self.start_time = time.time()
-        self.valid_moves = self.board.get_valid_moves(self.turn)
+        """ Change le tour et désélectionne la pièce du joueur précédent. """
+        super().change_turn()
         self.selected_piece = None
 
-    def apply_move(self, move: Move):
-        """ 
-        Applique un déplacement. Cette méthode est indépendante
-        de l'interface graphique et également utilisée pour des simulations.
-        """
-        self.board.move_piece(move)
-        self.moves_played.append(move)
-
-        skipped_pieces = move.get_skipped_list()
-        if len(skipped_pieces) > 0:
-            self.board.remove_pieces(skipped_pieces)
-        self.change_turn()
-
-        self.hash_key.update(move, self.turn)
-        self.hash_list.append(self.hash_key.get_value())
-
-        self.update_game_state()
-
     def check_human_move(self, row, col):
         """ 
         Déplace une pièce sur le plateau (en prenant en compte les règles).
@@ -373,7 +272,7 @@ class Game:
             position= [end_screen_center_x + (end_screen_width - (end_screen_width // 2)) // 2, 
                        end_screen_center_y + end_screen_height // 2],
             command=self.reset,
-            font="assets/recharge.rg-bold.otf",
+            font=TEXT_FONT_PATH,
             font_size=self.game_config.window.text_font_size
         )
 
@@ -395,114 +294,6 @@ class Game:
         if restart_button not in self.game_config.get_buttons_list():
             self.game_config.add_button(restart_button)
 
-    def get_winner(self):
-        """ Renvoi le gagnant de la partie. """
-        if self.board.get_number_of_pieces('white') == 0 and self.board.get_number_of_pieces('black') > 0 \
-                or len(self.valid_moves) == 0 and self.turn == 'white':
-            self.winner = 'noir'
-        elif self.board.get_number_of_pieces('black') == 0 and self.board.get_number_of_pieces('white') > 0 \
-                or len(self.valid_moves) == 0 and self.turn == 'black':
-            self.winner = 'blanc'
-
-    def get_winner_by_time(self):
-        """ Si un joueur gagne au temps, renvoi ce joueur. """
-        if self.remaining_time == 0 and self.turn == 'white':
-            self.winner = 'noir'
-        elif self.remaining_time == 0 and self.turn == 'black':
-            self.winner = 'blanc'
-
-    def check_win(self):
-        """ Vérifie s'il y a un gagnant. """
-        return self.winner is not None
-
-    def draw_by_repetition(self):
-        """ 
-        La fin de partie est considérée comme égale lorsque la même position se représente pour la troisième fois,
-        le même joueur ayant le trait.
-        On créé des piles, les classes d'équivalences de la congruence modulo 4.
-        On range chaque valeur de la liste contenant les valeurs des clés de hachage dans ces classes.
-        Si l'on a la même valeurs trois fois côte-à-côte dans la classe dans l'une des classes d'équivalences,
-        c'est match nul. 
-        """
-        equivalence_class = self.quotient_set[(len(self.hash_list) - 1)%4]
-        hash_key = self.hash_list[len(self.hash_list) - 1]
-        equivalence_class.append(hash_key)
-        if len(self.hash_list) >= 9 and len(equivalence_class) >= 3:
-            if equivalence_class[-1] == equivalence_class[-2] == equivalence_class[-3]:
-                return True
-        return False
-
-    def draw_by_queen_moves_repetition(self):
-        """
-        Si, durant 25 coups, il n'y a ni déplacement de pion ni prise, 
-        la fin de partie est considérée comme égale.
-        """
-        move = self.moves_played[-1]
-        if not(move.is_pawn_move() or move.is_capture()):
-            self.no_move_repetition_counter += 1
-            if self.no_move_repetition_counter >= 25:
-                return True
-        return False
-
-    def draw_by_material_and_repetition(self):
-        """
-        S'il n'y a plus que trois dames, deux dames et un pion, ou une dame et deux pions contre une dame, 
-        la fin de partie sera considérée comme égale lorsque les deux joueurs auront encore joué
-        chacun 16 coups au maximum.
-        """
-        if self.board.get_total_number_of_pieces() == 4:
-            player1, player2 = 'white', 'black'
-            player1_pieces = (self.board.get_number_of_pawns(player1), self.board.get_number_of_queens(player1))
-            player2_pieces = (self.board.get_number_of_pawns(player2), self.board.get_number_of_queens(player2))
-            cond1 = player1_pieces == (0, 3) and player2_pieces == (0, 1) \
-                        or player1_pieces == (0, 1) and player2_pieces == (0, 3)
-            cond2 = player1_pieces == (1, 2) and player2_pieces == (0, 1) \
-                        or player1_pieces == (0, 1) and player2_pieces == (1, 2)
-            cond3 = player1_pieces == (2, 1) and player2_pieces == (0, 1) \
-                        or player1_pieces == (0, 1) and player2_pieces == (2, 1)
-            if cond1 or cond2 or cond3:
-                self.pieces_repetition_counter += 1
-                print(self.pieces_repetition_counter)
-                if self.pieces_repetition_counter >= 16:
-                    return True
-        return False
-
-    def draw_by_material(self):
-        """
-        Pour autant qu'il n'y ait pas de phase de jeu en cours, 
-        la fin de partie de deux dames contre une dame, et a fortiori, de une dame contre une dame, 
-        sera considérée égale.
-        """
-        if self.board.get_total_number_of_pieces() <= 3:
-            player1, player2 = 'white', 'black'
-            player1_pieces = (self.board.get_number_of_pawns(player1), self.board.get_number_of_queens(player1))
-            player2_pieces = (self.board.get_number_of_pawns(player2), self.board.get_number_of_queens(player2))
-            cond1 = player1_pieces == (0, 2) and player2_pieces == (0, 1) \
-                        or player1_pieces == (0, 1) and player2_pieces == (0, 2)
-            cond2 = player1_pieces == player2_pieces == (0, 1)
-            if cond1 or cond2:
-                return True
-        return False
-
-    def check_draw(self):
-        """ Vérifie si l'issue de la partie doit être égale. """
-        if self.draw_by_repetition():
-            return "répétition"
-        elif self.draw_by_queen_moves_repetition():
-            return "jeu passif"
-        elif self.draw_by_material_and_repetition():
-            return "jeu passif / matériel insuffisant"
-        elif self.draw_by_material():
-            return "matériel insuffisant"
-        else:
-            return False
-    
-    def update_game_state(self):
-        """ Met à jour l'état de la partie. """
-        self.get_winner()
-        self.draw = self.check_draw()
-        self.is_finished = self.winner is not None or self.draw
-    
     def check_end_game(self):
         """ Vérifie si la partie est terminée. Si oui, affiche l'écran de fin. """
         self.get_winner_by_time()
@@ -518,10 +309,6 @@ class Game:
             return True
         return False
     
-    def start(self):
-        self.has_start = True
-        self.start_time = time.time()
-
     def quit_game(self):
         """ Permet de quitter le jeu. """
         pygame.quit()
@@ -530,31 +317,3 @@ class Game:
     def reset(self, board_config=1):
         """ Réinitialise la partie. """
         self.__init__(self.game_config, board_config)
-
-    def add_time(self, duration, player):
-        """ Ajoute du temps à l'horloge de l'un des joueurs. """
-        if player == 1:
-            self.player1_remaining_time += duration
-        else:
-            self.player2_remaining_time += duration
-
-    def copy(self):
-        """ Copie une instance de la classe Game. """
-        # Liste des noms d'attributs à copier
-        attribute_names = ['board_config', 'player_side','selected_piece', 'turn', 'quotient_set', 'no_move_repetition_counter',
-                           'pieces_repetition_counter', 'has_start', 'winner', 'win', 'draw', 'is_finished']
-
-        game_copy = Game(Config(copy=True), self.board_config, copy=True)
-        
-        # Copie des attributs simples
-        for attr_name in attribute_names:
-            setattr(game_copy, attr_name, copy(getattr(self, attr_name)))
-        
-        # Copie des attributs spéciaux
-        game_copy.board = self.board.copy()
-        game_copy.hash_key = self.hash_key.copy(game_copy.board)
-        game_copy.hash_list = deepcopy(self.hash_list)
-        game_copy.valid_moves = [move.copy() for move in self.valid_moves]
-        game_copy.moves_played = [move.copy() for move in self.moves_played]
-        
-        return game_copy
@@ -1,34 +0,0 @@
-EMPTY = 0
-PAWN = 200
-QUEEN = 300
-PLAYER1 = 400
-PLAYER2 = 500
-BOT_SIDE = 480
-TOP_SIDE = 580
-WHITE_PIECE = 440
-BLACK_PIECE = 550
-TOUR_START = 600
-CAPTURE_PAWN = 1200
-CAPTURE_DAME = 1300
-MOVE_UP_LEFT = 103
-MOVE_UP_RIGHT = 104
-MOVE_DOWN_LEFT = 105
-MOVE_DOWN_RIGHT = 106
-CAPTURE_UP_LEFT = 107
-CAPTURE_UP_RIGHT = 108
-CAPTURE_DOWN_LEFT = 109
-CAPTURE_DOWN_RIGHT = 110
-
-MOVES = {
-    (1, 1): MOVE_DOWN_RIGHT,
-    (1, -1): MOVE_DOWN_LEFT,
-    (-1, 1): MOVE_UP_RIGHT,
-    (-1, -1): MOVE_UP_LEFT,
-}
-
-CAPTURES = {
-    (2, 2): CAPTURE_DOWN_RIGHT,
-    (2, -2): CAPTURE_DOWN_LEFT,
-    (-2, 2): CAPTURE_UP_RIGHT,
-    (-2, -2): CAPTURE_UP_LEFT,
-}
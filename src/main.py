@@ -2,19 +2,16 @@ import pygame
 from src.constants import *
 from src.game import Game
 from src.config import Config
-from src.move import Move
+from src.core.move import Move
 from src.event_handler import EventHandler
+from src.startup_profiler import startup_profiler
 import threading
 import ctypes
 from ctypes import wintypes
-import pickle
-import json
 import os
 import time
 
-from ai_package.ai import AI
 from src.command_listener import CommandListener
-from communication.client import Client
 
 
 if SYSTEM == "Windows":
@@ -45,63 +42,50 @@ class MainClient:
     """
 
     def __init__(self):
-        """ Attributs, instances de classes. """
-        pygame.init()
-        pygame.display.set_icon(ICON)
-        pygame.display.set_caption('Jeu de Dames')
-        self.config = Config()
-        self.game = Game(self.config, self.config.board_config)
-        self.command_listener = CommandListener(self.game)
-        self.event_handler = EventHandler(self.game, self.config)
+        """
+        Attributs, instances de classes.
+        Seul l'affichage de pygame est initialisé ici (les polices le sont à leur premier usage),
+        et le client et les IA ne sont importés que si le mode de jeu en a besoin.
+        """
+        with startup_profiler.phase("pygame"):
+            pygame.display.init()
+            pygame.display.set_icon(pygame.image.load(ICON_PATH))
+            pygame.display.set_caption('Jeu de Dames')
+        with startup_profiler.phase("config"):
+            self.config = Config()
+        with startup_profiler.phase("game"):
+            self.game = Game(self.config, self.config.board_config)
+            self.command_listener = CommandListener(self.game)
+            self.event_handler = EventHandler(self.game, self.config)
         self.client = None
         self.run = True
 
         if self.config.gamemode != 'self.player_vs_player':
-            self.client = Client()
-            self.ai_index = 0
-            self.load_ai()
+            with startup_profiler.phase("ai"):
+                from communication.client import Client
+                self.client = Client()
+                self.ai_index = 0
+                self.load_ai()
     
     def switch_ai(self):
         self.ai_index += 1
         self.ai_index %= len(self.ai_list)
         self.current_ai = self.ai_list[self.ai_index]
             
-    def deserialize(self, serialized_data: str):
-        """ 
-        Nous utilisé latin1 pour encoder et décoder la chaîne afin de préserver 
-        la correspondance univoque entre les octets et les caractères 
-        lors de la transformation des données pickle encodées en une représentation 
-        lisible. Cela permet de restaurer correctement l'objet pickle original.
-        """
-        # On élimine le préfixe <b'> et la fin <'> pour obtenir la représentation pickle
-        pickle_string = serialized_data[2:-1].encode('latin1').decode('unicode_escape')
-        # Désérialisez la représentation pickle
-        deserialized_object = pickle.loads(pickle_string.encode('latin1'))
-        return deserialized_object
-
     def load_ai(self):
-        """ Créé plusieurs instances de la classe AI. """
-        multiple_ai = self.config.gamemode == 'self.ai_vs_ai'
+        """ Créé les instances de la classe AI du mode de jeu : seuls leurs modules sont importés. """
+        from ai_package.ai import AI
 
-        with open(AI_OBJECTS_PATH, "r", encoding='UTF-8') as f:
-            data = json.load(f)
-
-        self.ai_list, ai_name_list = [], []
+        multiple_ai = self.config.gamemode == 'self.ai_vs_ai'
 
+        ai_settings = [(self.config.ai_1_engine, self.config.ai_1_color)]
         if multiple_ai:
-            ai_name_list = [
-                f'{self.config.ai_1_engine}_{self.config.ai_1_color}',
-                f'{self.config.ai_2_engine}_{self.config.ai_2_color}'    
-            ]
-        else:
-            ai_name_list = [f'{self.config.ai_1_engine}_{self.config.ai_1_color}']
+            ai_settings.append((self.config.ai_2_engine, self.config.ai_2_color))
 
-        for ai_name in ai_name_list:
-            deserialized_ai = self.deserialize(data[ai_name])
-            self.ai_list.append(deserialized_ai)
+        self.ai_list = [AI.load(engine, color) for engine, color in ai_settings]
 
         self.client.send_ai(ai_list=self.ai_list, ai_switch=multiple_ai)
-        self.current_ai: AI = self.ai_list[0]
+        self.current_ai = self.ai_list[0]
 
     def ai_loop(self):
         """ Boucle principale qui gère l'IA. """
@@ -119,11 +103,7 @@ class MainClient:
 
     def update_clocks(self):
         """ Met à jour les pendules du jeu. """
-        if self.game.has_start:
-            self.game.elapsed_time = time.time() - self.game.start_time
-            self.game.remaining_time = self.game.get_remaining_time() - self.game.elapsed_time
-            if self.game.remaining_time < 0:
-                self.game.remaining_time = 0
+        self.game.update_remaining_time()
 
     def player_turn(self, board, dragger):
         """ 
@@ -170,8 +150,7 @@ class MainClient:
     
     def client_queue(self):
         if self.client and not self.client.get_queue().empty():
-            best_move: Move = self.client.get_data()
-            best_move.piece.set_sprite()
+            best_move = Move.decode(self.client.get_data())
             self.current_ai.move(self.game, best_move)
             self.switch_ai()
 
@@ -207,6 +186,7 @@ class MainClient:
             board, dragger = self.event_handler.check_ButtonClick(board, dragger)
 
             pygame.display.update() 
+            startup_profiler.report()
 
         if self.client:
             self.client.close()
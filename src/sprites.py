@@ -0,0 +1,47 @@
+import pygame
+from .constants import ASSETS_PATH
+import os
+
+
+class SpriteCache:
+    """
+    Cache des images des pièces partagé par tout le processus.
+    Chaque image est chargée une seule fois depuis le disque (clé : couleur, nom),
+    puis redimensionnée une seule fois par taille de case (clé : couleur, nom, taille).
+    Les pièces ne possèdent donc pas d'image : elles demandent la leur au cache
+    au moment d'être dessinées.
+    """
+
+    def __init__(self):
+        self.images = {}
+        self.scaled_images = {}
+
+    def get_image(self, color, name):
+        """ Retourne l'image d'origine de la pièce (chargée depuis le disque au premier appel). """
+        key = (color, name)
+        if key not in self.images:
+            self.images[key] = pygame.image.load(os.path.join(ASSETS_PATH, f'{color}_{name}.png'))
+        return self.images[key]
+
+    def get_sprite(self, color, name, square_size):
+        """ Retourne l'image de la pièce à la taille d'affichage correspondant à une case. """
+        key = (color, name, square_size)
+        sprite = self.scaled_images.get(key)
+        if sprite is None:
+            sprite = pygame.transform.scale(self.get_image(color, name), (0.80 * square_size, 0.80 * square_size))
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self.scaled_images[key] = sprite
+        return sprite
+
+    def draw_piece(self, window, piece, x, y, square_size):
+        """ Dessine une pièce (pion ou dame) centrée sur le point (x, y). """
+        sprite = self.get_sprite(piece.color, piece.name, square_size)
+        window.blit(sprite, (x - sprite.get_width()//2, y - sprite.get_height()//2))
+
+    def invalidate(self):
+        """ Oublie les images redimensionnées (changement de résolution). """
+        self.scaled_images.clear()
+
+
+sprite_cache = SpriteCache()
@@ -0,0 +1,37 @@
+from contextlib import contextmanager
+import time
+
+
+class StartupProfiler:
+    """
+    Mesure la durée de chaque phase du démarrage du client (imports, initialisation
+    de pygame, configuration, fenêtre, IA, ...) et l'affiche une fois la première image dessinée.
+    Le temps total part de l'import de ce module, c'est-à-dire du début de main_client.py.
+    Pour le détail des imports module par module : python -X importtime main_client.py
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.phases = []
+        self.reported = False
+
+    @contextmanager
+    def phase(self, name):
+        """ Mesure la durée du bloc 'with' sous le nom 'name'. """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start_time))
+
+    def report(self):
+        """ Affiche la durée de chaque phase puis le total (une seule fois). """
+        if self.reported:
+            return
+        self.reported = True
+        for name, duration in self.phases:
+            print(f"[STARTUP] {name}: {round(1000 * duration, 1)} ms")
+        print(f"[STARTUP] total: {round(1000 * (time.perf_counter() - self.start_time), 1)} ms")
+
+
+startup_profiler = StartupProfiler()